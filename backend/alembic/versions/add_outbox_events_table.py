@@ -0,0 +1,48 @@
+"""add outbox_events table
+
+Revision ID: add_outbox_events
+Revises: d298ff1ee6ff, add_conversation_message
+Create Date: 2025-11-20 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_outbox_events'
+# 두 브랜치(llm_usage_logs, conversation)를 병합
+down_revision: Union[str, Sequence[str], None] = ('d298ff1ee6ff', 'add_conversation_message')
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Transactional outbox 이벤트 테이블 생성
+    op.create_table(
+        'outbox_events',
+        sa.Column('id', sa.UUID(), nullable=False, comment='이벤트 고유 식별자'),
+        sa.Column('event_type', sa.String(length=100), nullable=False, comment='이벤트 타입'),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False, comment='이벤트 데이터'),
+        sa.Column('created_at', sa.DateTime(), nullable=False, comment='이벤트 생성 시각'),
+        sa.Column('processed_at', sa.DateTime(), nullable=True, comment='발행 완료 시각'),
+        sa.Column('claimed_until', sa.DateTime(), nullable=True, comment='릴레이 선점 만료 시각'),
+        sa.PrimaryKeyConstraint('id'),
+        comment='Transactional outbox 이벤트 테이블'
+    )
+
+    # 미발행 이벤트 폴링용 부분 인덱스
+    op.create_index(
+        'ix_outbox_events_pending',
+        'outbox_events',
+        ['created_at'],
+        postgresql_where=sa.text('processed_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_events_pending', table_name='outbox_events')
+    op.drop_table('outbox_events')
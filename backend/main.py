@@ -80,13 +80,16 @@ async def lifespan(app: FastAPI):
     logger.info("=" * 60)
 
     # 1. Warm up RAG system
+    # 라우트가 실제로 사용하는 싱글톤을 초기화해야 첫 요청이 임베딩 모델 로드 비용을 치르지 않음
     try:
         logger.info("[Warmup] Initializing RAG retriever...")
-        from src.ai.rag.retriever import Retriever
+        from src.api.routes import readings as readings_routes
+        from src.api.routes import readings_stream as readings_stream_routes
 
-        retriever = Retriever()
-        # Perform a dummy query to load the vector store index
-        dummy_result = retriever.retrieve_general_context("warmup", k=1)
+        for routes_module in (readings_routes, readings_stream_routes):
+            routes_module.get_context_enricher()
+            # Perform a dummy query to load the vector store index
+            dummy_result = routes_module.get_retriever().retrieve_general_context("warmup", k=1)
 
         logger.info(
             "[Warmup] ✓ RAG system ready (retrieved %d documents)",
@@ -149,15 +152,72 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("[Warmup] ✗ Settings initialization failed (non-critical): %s", e)
 
+    # 4. Initialize AI orchestrators (provider clients created once, off the request path)
+    try:
+        logger.info("[Warmup] Initializing AI orchestrators...")
+        from src.database.factory import get_database_provider
+        from src.api.routes import readings as readings_routes
+        from src.api.routes import readings_stream as readings_stream_routes
+
+        db_provider = get_database_provider()
+        await readings_routes.get_orchestrator(db_provider)
+        await readings_stream_routes.get_orchestrator(db_provider)
+        logger.info("[Warmup] ✓ AI orchestrators ready")
+    except Exception as e:
+        logger.warning("[Warmup] ✗ AI orchestrator warmup failed (non-critical): %s", e)
+
+    # 5. Start outbox relay (feedback events -> Redis Streams, off the request path)
+    outbox_relay = None
+    if settings.OUTBOX_RELAY_ENABLED and settings.DATABASE_PROVIDER == "postgresql":
+        try:
+            from src.core.cache import cache
+            from src.core.outbox import OutboxRelay
+            from src.database.factory import get_database_provider
+
+            outbox_relay = OutboxRelay(
+                get_database_provider(),
+                cache.redis_client,
+                poll_interval=settings.OUTBOX_POLL_INTERVAL,
+                batch_size=settings.OUTBOX_BATCH_SIZE,
+            )
+            outbox_relay.start()
+        except Exception as e:
+            logger.warning("[Warmup] ✗ Outbox relay start failed (non-critical): %s", e)
+
     logger.info("=" * 60)
     logger.info("Warmup sequence completed! Application ready.")
     logger.info("=" * 60)
     
     yield  # Application runs here
     
-    # Shutdown (cleanup code would go here if needed)
+    # Shutdown
     logger.info("Application shutting down...")
 
+    if outbox_relay is not None:
+        await outbox_relay.stop()
+
+    from src.api.routes import readings as readings_routes
+    from src.api.routes import readings_stream as readings_stream_routes
+
+    # Finish readings queued for background persistence by the SSE route
+    await readings_stream_routes.stop_persistence_workers()
+
+    # Close provider HTTP clients held by the orchestrator singletons
+    for module in (readings_routes, readings_stream_routes):
+        orchestrator = module._orchestrator
+        if orchestrator is not None:
+            await orchestrator.close_all()
+
+    from src.api.dependencies import auth as auth_dependencies
+
+    if auth_dependencies._auth_orchestrator is not None:
+        await auth_dependencies._auth_orchestrator.close_all()
+
+    # Providers share keep-alive HTTP/2 clients; close them last
+    from src.ai.http_client import close_shared_http_clients
+
+    await close_shared_http_clients()
+
 
 # FastAPI 애플리케이션 인스턴스 생성
 # Swagger UI와 ReDoc 자동 문서화 활성화
@@ -44,6 +44,7 @@ from src.ai.orchestrator import (
 from src.ai.cache import (
     AICache,
     AICacheMetrics,
+    ReadingCache,
 )
 
 # Concrete providers (auto-registers in ProviderFactory)
@@ -76,6 +77,7 @@ __all__ = [
     # Caching
     "AICache",
     "AICacheMetrics",
+    "ReadingCache",
 
     # Concrete providers
     "OpenAIProvider",
@@ -14,6 +14,7 @@ import redis
 from redis import Redis
 
 from src.ai.models import AIResponse
+from src.ai.prompt_engine.schemas import ReadingResponse as ParsedReading
 
 logger = logging.getLogger(__name__)
 
@@ -74,14 +75,22 @@ class AICache:
     - TTL support (default 24 hours)
     - Cache hit/miss metrics
     - Automatic serialization/deserialization
+    - Reconnects (at most every reconnect_interval seconds) if Redis
+      was unreachable when the cache was created
+
+    Subclasses cache other value types by overriding _serialize,
+    _deserialize and _describe (and _generate_cache_key if needed).
     """
 
+    log_name = "AICache"
+
     def __init__(
         self,
         redis_client: Optional[Redis] = None,
         redis_url: str = "redis://localhost:6379/0",
         default_ttl: int = 86400,  # 24 hours in seconds
-        key_prefix: str = "ai_cache:"
+        key_prefix: str = "ai_cache:",
+        reconnect_interval: float = 30.0,
     ):
         """
         Initialize AI cache
@@ -91,23 +100,65 @@ class AICache:
             redis_url: Redis connection URL
             default_ttl: Default TTL in seconds (24 hours)
             key_prefix: Prefix for cache keys
+            reconnect_interval: Minimum seconds between reconnect attempts
         """
+        self.redis_url = redis_url
+        self.reconnect_interval = reconnect_interval
+        self._last_connect_attempt = 0.0
+
         if redis_client:
             self.redis = redis_client
         else:
-            try:
-                self.redis = redis.from_url(redis_url, decode_responses=True)
-                # Test connection
-                self.redis.ping()
-                logger.info(f"[AICache] Connected to Redis: {redis_url}")
-            except Exception as e:
-                logger.error(f"[AICache] Failed to connect to Redis: {e}")
-                self.redis = None
+            self.redis = self._connect()
 
         self.default_ttl = default_ttl
         self.key_prefix = key_prefix
         self.metrics = AICacheMetrics()
 
+    def _connect(self) -> Optional[Redis]:
+        """Create a Redis client from redis_url (None if unreachable)"""
+        self._last_connect_attempt = time.monotonic()
+        try:
+            client = redis.from_url(self.redis_url, decode_responses=True)
+            # Test connection
+            client.ping()
+            logger.info(f"[{self.log_name}] Connected to Redis: {self.redis_url}")
+            return client
+        except Exception as e:
+            logger.error(f"[{self.log_name}] Failed to connect to Redis: {e}")
+            return None
+
+    def _get_redis(self) -> Optional[Redis]:
+        """
+        Return the Redis client, retrying the connection if the first one failed
+
+        Retries are throttled by reconnect_interval so a Redis outage does not
+        add a connection attempt to every cache call.
+        """
+        if self.redis is None and (
+            time.monotonic() - self._last_connect_attempt >= self.reconnect_interval
+        ):
+            self.redis = self._connect()
+        return self.redis
+
+    def _serialize(self, value: AIResponse) -> str:
+        """Serialize a cached value to a JSON string"""
+        data = value.model_dump() if hasattr(value, 'model_dump') else value.dict()
+
+        # Convert datetime to ISO format
+        if 'created_at' in data and isinstance(data['created_at'], datetime):
+            data['created_at'] = data['created_at'].isoformat()
+
+        return json.dumps(data)
+
+    def _deserialize(self, data: str) -> AIResponse:
+        """Deserialize a cached JSON string"""
+        return AIResponse(**json.loads(data))
+
+    def _describe(self, value: AIResponse) -> str:
+        """Short description of a cached value for log messages"""
+        return f"provider={value.provider}, model={value.model}"
+
     def _generate_cache_key(
         self,
         prompt: str,
@@ -170,38 +221,38 @@ class AICache:
         Returns:
             Cached AIResponse or None if not found
         """
-        if not self.redis:
+        redis_client = self._get_redis()
+        if not redis_client:
             return None
 
         try:
             cache_key = self._generate_cache_key(prompt, system_prompt, model, **kwargs)
 
             # Get from Redis
-            cached_data = self.redis.get(cache_key)
+            cached_data = redis_client.get(cache_key)
 
             if cached_data:
                 # Cache hit
                 self.metrics.record_hit()
 
                 # Deserialize
-                data = json.loads(cached_data)
-                response = AIResponse(**data)
+                response = self._deserialize(cached_data)
 
                 logger.info(
-                    f"[AICache] ✓ Cache HIT: {cache_key[:16]}... "
-                    f"(provider={response.provider}, model={response.model})"
+                    f"[{self.log_name}] ✓ Cache HIT: {cache_key[:24]}... "
+                    f"({self._describe(response)})"
                 )
 
                 return response
             else:
                 # Cache miss
                 self.metrics.record_miss()
-                logger.debug(f"[AICache] ✗ Cache MISS: {cache_key[:16]}...")
+                logger.debug(f"[{self.log_name}] ✗ Cache MISS: {cache_key[:24]}...")
                 return None
 
         except Exception as e:
             self.metrics.record_error()
-            logger.error(f"[AICache] Error getting from cache: {e}")
+            logger.error(f"[{self.log_name}] Error getting from cache: {e}")
             return None
 
     def set(
@@ -227,35 +278,30 @@ class AICache:
         Returns:
             True if cached successfully, False otherwise
         """
-        if not self.redis:
+        redis_client = self._get_redis()
+        if not redis_client:
             return False
 
         try:
             cache_key = self._generate_cache_key(prompt, system_prompt, model, **kwargs)
 
             # Serialize response
-            data = response.model_dump() if hasattr(response, 'model_dump') else response.dict()
-
-            # Convert datetime to ISO format
-            if 'created_at' in data and isinstance(data['created_at'], datetime):
-                data['created_at'] = data['created_at'].isoformat()
-
-            cache_data = json.dumps(data)
+            cache_data = self._serialize(response)
 
             # Set with TTL
             ttl_seconds = ttl if ttl is not None else self.default_ttl
-            self.redis.setex(cache_key, ttl_seconds, cache_data)
+            redis_client.setex(cache_key, ttl_seconds, cache_data)
 
             logger.info(
-                f"[AICache] Cached response: {cache_key[:16]}... "
-                f"(TTL={ttl_seconds}s, provider={response.provider})"
+                f"[{self.log_name}] Cached response: {cache_key[:24]}... "
+                f"(TTL={ttl_seconds}s, {self._describe(response)})"
             )
 
             return True
 
         except Exception as e:
             self.metrics.record_error()
-            logger.error(f"[AICache] Error caching response: {e}")
+            logger.error(f"[{self.log_name}] Error caching response: {e}")
             return False
 
     def invalidate(
@@ -277,22 +323,23 @@ class AICache:
         Returns:
             True if deleted, False otherwise
         """
-        if not self.redis:
+        redis_client = self._get_redis()
+        if not redis_client:
             return False
 
         try:
             cache_key = self._generate_cache_key(prompt, system_prompt, model, **kwargs)
-            deleted = self.redis.delete(cache_key)
+            deleted = redis_client.delete(cache_key)
 
             if deleted:
-                logger.info(f"[AICache] Invalidated cache: {cache_key[:16]}...")
+                logger.info(f"[{self.log_name}] Invalidated cache: {cache_key[:16]}...")
                 return True
             else:
-                logger.debug(f"[AICache] No cache to invalidate: {cache_key[:16]}...")
+                logger.debug(f"[{self.log_name}] No cache to invalidate: {cache_key[:16]}...")
                 return False
 
         except Exception as e:
-            logger.error(f"[AICache] Error invalidating cache: {e}")
+            logger.error(f"[{self.log_name}] Error invalidating cache: {e}")
             return False
 
     def clear_all(self) -> int:
@@ -302,23 +349,24 @@ class AICache:
         Returns:
             Number of keys deleted
         """
-        if not self.redis:
+        redis_client = self._get_redis()
+        if not redis_client:
             return 0
 
         try:
             pattern = f"{self.key_prefix}*"
-            keys = list(self.redis.scan_iter(match=pattern))
+            keys = list(redis_client.scan_iter(match=pattern))
 
             if keys:
-                deleted = self.redis.delete(*keys)
-                logger.info(f"[AICache] Cleared {deleted} cached responses")
+                deleted = redis_client.delete(*keys)
+                logger.info(f"[{self.log_name}] Cleared {deleted} cached responses")
                 return deleted
             else:
-                logger.debug("[AICache] No cached responses to clear")
+                logger.debug("[{self.log_name}] No cached responses to clear")
                 return 0
 
         except Exception as e:
-            logger.error(f"[AICache] Error clearing cache: {e}")
+            logger.error(f"[{self.log_name}] Error clearing cache: {e}")
             return 0
 
     def get_metrics(self) -> Dict[str, Any]:
@@ -331,20 +379,21 @@ class AICache:
         stats = self.metrics.get_stats()
 
         # Add Redis info if available
-        if self.redis:
+        redis_client = self._get_redis()
+        if redis_client:
             try:
-                info = self.redis.info("stats")
+                info = redis_client.info("stats")
                 stats["redis_hits"] = info.get("keyspace_hits", 0)
                 stats["redis_misses"] = info.get("keyspace_misses", 0)
             except Exception as e:
-                logger.warning(f"[AICache] Could not get Redis stats: {e}")
+                logger.warning(f"[{self.log_name}] Could not get Redis stats: {e}")
 
         return stats
 
     def reset_metrics(self):
         """Reset cache metrics"""
         self.metrics.reset()
-        logger.info("[AICache] Metrics reset")
+        logger.info(f"[{self.log_name}] Metrics reset")
 
     def health_check(self) -> Dict[str, Any]:
         """
@@ -353,7 +402,8 @@ class AICache:
         Returns:
             Health status dictionary
         """
-        if not self.redis:
+        redis_client = self._get_redis()
+        if not redis_client:
             return {
                 "status": "unhealthy",
                 "error": "Redis client not initialized"
@@ -362,11 +412,11 @@ class AICache:
         try:
             # Test ping
             response_time_start = time.time()
-            self.redis.ping()
+            redis_client.ping()
             response_time = (time.time() - response_time_start) * 1000
 
             # Get info
-            info = self.redis.info()
+            info = redis_client.info()
 
             return {
                 "status": "healthy",
@@ -387,6 +437,81 @@ class AICache:
         if self.redis:
             try:
                 self.redis.close()
-                logger.info("[AICache] Redis connection closed")
+                logger.info(f"[{self.log_name}] Redis connection closed")
             except Exception as e:
-                logger.warning(f"[AICache] Error closing Redis connection: {e}")
+                logger.warning(f"[{self.log_name}] Error closing Redis connection: {e}")
+
+
+class ReadingCache(AICache):
+    """
+    Redis-based cache for parsed tarot readings
+
+    Stores the post-parse reading (after ResponseParser and validation)
+    so a repeated request with an identical prompt skips the AI call,
+    parsing and validation entirely. Shares connection handling, TTL,
+    metrics and fail-open behaviour with AICache; only the key scheme
+    and the (de)serialization of ParsedReading differ.
+
+    Features:
+    - BLAKE2b cache keys over (system_prompt, prompt, model)
+    - Fails open: any Redis error behaves like a cache miss
+    """
+
+    log_name = "ReadingCache"
+
+    def __init__(
+        self,
+        redis_client: Optional[Redis] = None,
+        redis_url: str = "redis://localhost:6379/0",
+        default_ttl: int = 86400,  # 24 hours in seconds
+        key_prefix: str = "ai:reading:",
+        reconnect_interval: float = 30.0,
+    ):
+        """
+        Initialize reading cache
+
+        Args:
+            redis_client: Redis client instance (optional, e.g. the app-wide client)
+            redis_url: Redis connection URL
+            default_ttl: Default TTL in seconds (24 hours)
+            key_prefix: Prefix for cache keys
+            reconnect_interval: Minimum seconds between reconnect attempts
+        """
+        super().__init__(
+            redis_client=redis_client,
+            redis_url=redis_url,
+            default_ttl=default_ttl,
+            key_prefix=key_prefix,
+            reconnect_interval=reconnect_interval,
+        )
+
+    def _generate_cache_key(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        model: Optional[str] = None,
+        **kwargs
+    ) -> str:
+        """
+        Generate cache key from prompt, system prompt and model
+
+        Args:
+            prompt: Full user prompt (reading prompt + output format)
+            system_prompt: System instruction
+            model: Provider/model identifier
+
+        Returns:
+            Cache key string
+        """
+        key_string = "\0".join((system_prompt or "", prompt, model or ""))
+        digest = hashlib.blake2b(key_string.encode(), digest_size=16).hexdigest()
+        return f"{self.key_prefix}{digest}"
+
+    def _serialize(self, value: ParsedReading) -> str:
+        return value.model_dump_json()
+
+    def _deserialize(self, data: str) -> ParsedReading:
+        return ParsedReading.model_validate_json(data)
+
+    def _describe(self, value: ParsedReading) -> str:
+        return f"cards={len(value.cards)}"
@@ -0,0 +1,54 @@
+"""
+AI Provider 공용 HTTP 클라이언트 모듈
+
+이 모듈의 목적:
+- SDK(Anthropic/OpenAI)별로 하나의 keep-alive AsyncClient를 프로세스 전역에서 공유
+- 연결 재사용으로 요청마다 TCP/TLS 핸드셰이크 비용 제거
+- HTTP/2로 동시 요청을 하나의 연결에서 다중화
+- Orchestrator 재생성(설정 변경) 시에도 연결 풀 유지
+
+각 SDK는 자체 DefaultAsyncHttpxClient(소켓 keep-alive, 프록시 설정 포함)를
+제공하므로 SDK별 클래스로 클라이언트를 만들어 호환성을 보장합니다.
+앱 lifespan 종료 시 close_shared_http_clients()로 정리합니다.
+"""
+import logging
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+_shared_clients: Dict[type, Any] = {}
+
+
+def get_shared_http_client(client_cls: type) -> Any:
+    """
+    SDK별 공용 AsyncClient 반환 (최초 호출 시 생성)
+
+    Args:
+        client_cls: SDK의 DefaultAsyncHttpxClient 클래스
+            (예: anthropic.DefaultAsyncHttpxClient)
+
+    Returns:
+        HTTP/2, keep-alive 풀이 설정된 AsyncClient 인스턴스
+    """
+    client = _shared_clients.get(client_cls)
+
+    if client is None or client.is_closed:
+        # timeout/limits는 SDK 기본값 사용 (keep-alive 100개), 요청별 timeout은 SDK가 지정
+        client = client_cls(http2=True)
+        _shared_clients[client_cls] = client
+        logger.info("[AIHttpClient] Shared HTTP/2 client created for %s", client_cls.__module__)
+
+    return client
+
+
+async def close_shared_http_clients() -> None:
+    """모든 공용 AsyncClient 종료 (앱 종료 시 호출)"""
+    clients = list(_shared_clients.values())
+    _shared_clients.clear()
+
+    for client in clients:
+        if not client.is_closed:
+            await client.aclose()
+
+    if clients:
+        logger.info("[AIHttpClient] Closed %d shared HTTP client(s)", len(clients))
@@ -28,7 +28,7 @@ TASK-020: AI 응답 캐싱 시스템 (CachedAIOrchestrator)
 """
 import time
 import asyncio
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator, Union
 import logging
 
 from src.ai.provider import AIProvider
@@ -45,6 +45,36 @@ from src.ai.models import (
 
 logger = logging.getLogger(__name__)
 
+# stream() 펌프 태스크가 큐로 보내는 종료 신호
+_STREAM_END = object()
+_STREAM_TIMEOUT = object()
+
+
+async def _pump_stream(iterator: AsyncIterator[Any], queue: "asyncio.Queue[Any]") -> None:
+    """
+    Provider 스트림을 큐로 옮기는 펌프
+
+    정상 종료는 _STREAM_END, 오류는 예외 객체, 취소(데드라인)는 _STREAM_TIMEOUT을
+    큐에 넣어 소비자가 항상 깨어나도록 합니다.
+    """
+    try:
+        async for item in iterator:
+            queue.put_nowait(item)
+    except asyncio.CancelledError:
+        queue.put_nowait(_STREAM_TIMEOUT)
+        raise
+    except Exception as e:
+        queue.put_nowait(e)
+    else:
+        queue.put_nowait(_STREAM_END)
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            try:
+                await aclose()
+            except Exception:
+                pass
+
 
 class AIOrchestrator:
     """
@@ -201,6 +231,191 @@ class AIOrchestrator:
             original_error=None
         )
     
+    async def stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        config: Optional[GenerationConfig] = None,
+        model: Optional[str] = None,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> AsyncIterator[Union[str, OrchestratorResponse]]:
+        """
+        Stream text with retries and fallback before the first token
+
+        Yields text deltas from the first provider that starts responding,
+        then a final OrchestratorResponse. Each attempt runs under an overall
+        deadline (``timeout`` or ``provider_timeout``). Until the first chunk
+        is yielded, timeouts and transient errors are retried with backoff
+        and then fall back to the next provider, like ``_try_provider``.
+        Once text has been sent to the caller any failure is raised instead
+        of silently switching providers. Failed attempts are recorded in
+        ``all_attempts`` as empty responses with ``finish_reason="error"``.
+
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system instruction
+            config: Generation configuration
+            model: Model to use
+            timeout: Deadline per attempt in seconds (default provider_timeout)
+            **kwargs: Additional parameters
+
+        Raises:
+            AITimeoutError: If a started stream exceeds its deadline
+            AIProviderError: If all providers fail, or a started stream
+                breaks or ends without a final response
+        """
+        start_time = time.time()
+        errors: List[Dict[str, Any]] = []
+        all_attempts: List[AIResponse] = []
+        deadline_seconds = timeout or self.provider_timeout
+        loop = asyncio.get_running_loop()
+
+        compatible_providers = self._get_compatible_providers(model)
+        if not compatible_providers:
+            raise AIProviderError(
+                message=f"No compatible provider found for model '{model}'",
+                provider="orchestrator",
+                error_type="NO_COMPATIBLE_PROVIDER",
+                original_error=None
+            )
+
+        for idx, provider in enumerate(compatible_providers):
+            is_primary = (provider == self.primary_provider)
+            provider_label = "primary" if is_primary else f"fallback {idx}"
+
+            logger.info(
+                "[Orchestrator] Streaming from %s provider: %s",
+                provider_label,
+                provider.provider_name,
+            )
+
+            for attempt in range(self.max_retries):
+                started = False
+                attempt_start = time.time()
+                # 청크마다 wait_for(태스크 생성)를 걸지 않고, 펌프 태스크 하나와 타이머 하나로 데드라인 적용
+                queue: "asyncio.Queue[Any]" = asyncio.Queue()
+                pump = asyncio.create_task(_pump_stream(
+                    provider.stream(
+                        prompt=prompt,
+                        system_prompt=system_prompt,
+                        config=config,
+                        model=model,
+                        **kwargs
+                    ),
+                    queue
+                ))
+                timer = loop.call_later(deadline_seconds, pump.cancel)
+
+                try:
+                    while True:
+                        item = await queue.get()
+
+                        if item is _STREAM_TIMEOUT:
+                            raise asyncio.TimeoutError()
+                        if item is _STREAM_END:
+                            raise AIProviderError(
+                                message=f"Provider {provider.provider_name} stream ended without a final response",
+                                provider=provider.provider_name,
+                                error_type="STREAM_INCOMPLETE",
+                                original_error=None
+                            )
+                        if isinstance(item, Exception):
+                            raise item
+
+                        if isinstance(item, AIResponse):
+                            all_attempts.append(item)
+                            logger.info(
+                                "[Orchestrator] ✓ Stream completed (%s) in %dms",
+                                provider.provider_name,
+                                int((time.time() - start_time) * 1000),
+                            )
+                            yield OrchestratorResponse(
+                                response=item,
+                                all_attempts=all_attempts,
+                                total_cost=sum(a.estimated_cost or 0.0 for a in all_attempts)
+                            )
+                            return
+                        started = True
+                        yield item
+
+                except asyncio.TimeoutError:
+                    error: Exception = AITimeoutError(
+                        f"Provider {provider.provider_name} stream exceeded {deadline_seconds}s deadline",
+                        provider=provider.provider_name
+                    )
+                except Exception as e:
+                    error = e
+                finally:
+                    timer.cancel()
+                    pump.cancel()
+
+                if started:
+                    logger.error(
+                        "[Orchestrator] ✗ Stream from %s broke after first token: %s",
+                        provider.provider_name,
+                        error,
+                    )
+                    if isinstance(error, AIProviderError):
+                        raise error
+                    raise AIProviderError(
+                        message=f"Provider {provider.provider_name} stream broke after first token: {error}",
+                        provider=provider.provider_name,
+                        error_type="STREAM_INTERRUPTED",
+                        original_error=error
+                    ) from error
+
+                # 실패한 시도도 사용량 로그에 남도록 빈 응답으로 기록
+                all_attempts.append(AIResponse(
+                    content="",
+                    model=model or provider.default_model,
+                    provider=provider.provider_name,
+                    finish_reason="error",
+                    latency_ms=int((time.time() - attempt_start) * 1000)
+                ))
+
+                retryable = isinstance(
+                    error, (AITimeoutError, AIRateLimitError, AIServiceUnavailableError)
+                )
+                logger.warning(
+                    "[Orchestrator] %s provider failed to start stream (%s, attempt %d/%d): %s - %s",
+                    provider_label.capitalize(),
+                    provider.provider_name,
+                    attempt + 1,
+                    self.max_retries,
+                    type(error).__name__,
+                    error,
+                )
+
+                if retryable and attempt < self.max_retries - 1:
+                    backoff = min(2 ** attempt, 4)
+                    logger.debug("[Orchestrator] Waiting %ss before retry...", backoff)
+                    await asyncio.sleep(backoff)
+                    continue
+
+                errors.append({
+                    "provider": provider.provider_name,
+                    "error_type": type(error).__name__,
+                    "error": str(error),
+                    "is_primary": is_primary,
+                    "attempts": attempt + 1
+                })
+                break
+
+        total_elapsed = int((time.time() - start_time) * 1000)
+        error_summary = self._format_error_summary(errors)
+        logger.error(
+            "[Orchestrator] ✗ All providers failed to stream after %dms. Errors: %s",
+            total_elapsed,
+            error_summary,
+        )
+        raise AIProviderError(
+            message=f"All {len(compatible_providers)} compatible providers failed. {error_summary}",
+            provider="orchestrator",
+            error_type="ALL_PROVIDERS_FAILED",
+            original_error=None
+        )
+
     def _get_compatible_providers(self, model: Optional[str]) -> List[AIProvider]:
         """
         모델명에 따라 호환되는 provider 리스트 반환
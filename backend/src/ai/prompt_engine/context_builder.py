@@ -57,10 +57,16 @@ TASK 참조:
     #     "reversed_meaning": "무모함을 나타냅니다."
     # }
 """
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 from src.models import ArcanaType, Suit
 from src.core.card_shuffle import DrawnCard, Orientation
 
+# (카드 객체 id, 방향) -> (카드 객체, 컨텍스트)
+# 카드 객체는 프로바이더 DTO별로 캐시되어 재사용되므로 같은 카드/방향의 컨텍스트를 다시 만들지 않음.
+# 객체를 함께 보관해 id() 재사용으로 다른 카드의 컨텍스트가 반환되지 않도록 함
+_card_context_cache: Dict[Tuple[int, str], Tuple[Any, Dict[str, Any]]] = {}
+_CARD_CONTEXT_CACHE_MAX = 512
+
 
 class ContextBuilder:
     """
@@ -157,6 +163,8 @@ class ContextBuilder:
         Args:
             drawn_card: 선택된 카드 (Card + Orientation)
 
+        결과는 카드 객체/방향별로 캐시되므로 읽기 전용으로 사용해야 합니다.
+
         Returns:
             프롬프트 템플릿용 딕셔너리:
             - name: 카드 이름
@@ -172,6 +180,20 @@ class ContextBuilder:
         card = drawn_card.card
         orientation = drawn_card.orientation.value
 
+        cache_key = (id(card), orientation)
+        cached = _card_context_cache.get(cache_key)
+        if cached is not None and cached[0] is card:
+            return cached[1]
+
+        context = ContextBuilder._build_card_context(card, orientation)
+        if len(_card_context_cache) >= _CARD_CONTEXT_CACHE_MAX:
+            _card_context_cache.clear()
+        _card_context_cache[cache_key] = (card, context)
+        return context
+
+    @staticmethod
+    def _build_card_context(card: Any, orientation: str) -> Dict[str, Any]:
+        """카드 객체와 방향으로 프롬프트용 딕셔너리 생성"""
         # 방향에 따라 적절한 키워드 선택
         if orientation == "upright":
             keywords = card.keywords_upright if getattr(card, "keywords_upright", None) else []
@@ -186,7 +208,7 @@ class ContextBuilder:
         suit_value = getattr(card, "suit", None)
         suit_str = suit_value.value if hasattr(suit_value, 'value') else str(suit_value) if suit_value else None
 
-        context = {
+        return {
             "id": getattr(card, "id", None),  # Add card ID for response
             "name": card.name,
             "orientation": orientation,
@@ -201,8 +223,6 @@ class ContextBuilder:
             "reversed_meaning": getattr(card, "meaning_reversed", ""),
         }
 
-        return context
-
     @staticmethod
     def build_cards_context(drawn_cards: List[DrawnCard]) -> List[Dict[str, Any]]:
         """
@@ -87,13 +87,20 @@ class PromptEngine:
             )
 
         # Initialize Jinja2 environment
+        # 프롬프트 파일은 배포 시점에 고정되므로 변경 여부(stat) 확인 없이 컴파일 결과를 계속 캐시
         self.env = Environment(
             loader=FileSystemLoader(str(self.prompts_dir)),
             trim_blocks=True,
             lstrip_blocks=True,
-            autoescape=False  # We're generating prompts, not HTML
+            autoescape=False,  # We're generating prompts, not HTML
+            auto_reload=False,
+            cache_size=-1,
         )
 
+        # 변수가 없는 시스템/출력 형식 프롬프트는 최초 렌더링 결과를 재사용
+        self._system_prompt: Optional[str] = None
+        self._output_format_prompt: Optional[str] = None
+
         logger.info(f"[PromptEngine] Initialized with prompts_dir: {self.prompts_dir}")
 
     def load_template(self, prompt_type: PromptType) -> Template:
@@ -126,8 +133,9 @@ class PromptEngine:
         Returns:
             Rendered system prompt text
         """
-        template = self.load_template(PromptType.SYSTEM)
-        return template.render()
+        if self._system_prompt is None:
+            self._system_prompt = self.load_template(PromptType.SYSTEM).render()
+        return self._system_prompt
 
     def render_one_card_prompt(
         self,
@@ -219,8 +227,9 @@ class PromptEngine:
         Returns:
             Rendered output format instructions
         """
-        template = self.load_template(PromptType.OUTPUT_FORMAT)
-        return template.render()
+        if self._output_format_prompt is None:
+            self._output_format_prompt = self.load_template(PromptType.OUTPUT_FORMAT).render()
+        return self._output_format_prompt
 
     def build_full_prompt(
         self,
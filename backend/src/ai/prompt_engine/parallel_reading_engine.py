@@ -15,8 +15,6 @@ Parallel Reading Engine - 병렬 LLM 처리 엔진
 import asyncio
 import logging
 from typing import List, Dict, Any, Optional, Tuple
-from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
 
 from src.ai.orchestrator import AIOrchestrator
 from src.ai.models import GenerationConfig, OrchestratorResponse
@@ -29,6 +27,12 @@ from src.ai.prompt_engine.citation_formatter import CitationFormatter
 from src.core.card_shuffle import DrawnCard
 from src.core.config import settings
 from src.ai.prompt_engine.spread_config import get_spread_config
+from src.ai.prompt_engine.reading_templates import (
+    jinja_env,
+    SYSTEM_PROMPT,
+    OUTPUT_FORMAT,
+    get_parallel_template,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -78,17 +82,9 @@ class ParallelReadingEngine:
             max_concurrent = 5
         self.semaphore = asyncio.Semaphore(max_concurrent)
         
-        # Jinja2 환경 설정
-        prompts_dir = Path(__file__).parent.parent.parent.parent / "prompts"
-        self.jinja_env = Environment(loader=FileSystemLoader(str(prompts_dir)))
-        
-        # 시스템 프롬프트 로드
-        try:
-            system_template = self.jinja_env.get_template("system/tarot_expert.txt")
-            self.system_prompt = system_template.render()
-        except Exception as e:
-            logger.warning(f"Failed to load system prompt: {e}")
-            self.system_prompt = "You are a professional tarot reader."
+        # 템플릿은 모듈 임포트 시 한 번만 컴파일/렌더링된 공용 캐시 사용
+        self.jinja_env = jinja_env
+        self.system_prompt = SYSTEM_PROMPT
         
         logger.info(
             f"ParallelReadingEngine initialized for {spread_type} "
@@ -179,23 +175,12 @@ class ParallelReadingEngine:
         Returns:
             카드 해석 리스트
         """
-        # 프롬프트 언어 설정 확인 (기본: 영어)
-        prompt_lang = settings.PROMPT_LANGUAGE
-        lang_suffix = f"_{prompt_lang}" if prompt_lang == "en" else "_en"  # Default to English
-        
         # 스프레드 설정에서 템플릿 경로 가져오기
         template_base = self.spread_config.parallel_templates.get("card") if self.spread_config.parallel_templates else None
         if not template_base:
             raise ValueError(f"No card template configured for spread type: {self.spread_type}")
         
-        template_name = template_base.replace(".txt", f"{lang_suffix}.txt")
-        
-        # 프롬프트 템플릿 로드
-        try:
-            template = self.jinja_env.get_template(template_name)
-        except Exception as e:
-            logger.warning(f"Template {template_name} not found, falling back to English: {e}")
-            template = self.jinja_env.get_template(template_base.replace(".txt", "_en.txt"))
+        template = get_parallel_template(template_base)
         
         # 배치용 카드 정보 준비
         cards_data = []
@@ -228,9 +213,7 @@ class ParallelReadingEngine:
         prompt = template.render(**prompt_context)
         
         # 출력 형식 추가
-        output_template = self.jinja_env.get_template("output/structured_response.txt")
-        output_format = output_template.render()
-        full_prompt = f"{prompt}\n\n{output_format}"
+        full_prompt = f"{prompt}\n\n{OUTPUT_FORMAT}"
         
         # LLM 설정 가져오기 (프롬프트 분석 기반 동적 할당)
         config = self.allocator.get_config_for_prompt(
@@ -497,22 +480,12 @@ class ParallelReadingEngine:
         rag_context: Optional[Dict[str, Any]]
     ) -> Tuple[Dict[str, str], OrchestratorResponse]:
         """종합 리딩 생성"""
-        # 프롬프트 언어 설정 확인 (기본: 영어)
-        prompt_lang = settings.PROMPT_LANGUAGE
-        lang_suffix = f"_{prompt_lang}" if prompt_lang == "en" else "_en"  # Default to English
-        
         # 스프레드 설정에서 템플릿 경로 가져오기
         template_base = self.spread_config.parallel_templates.get("overall") if self.spread_config.parallel_templates else None
         if not template_base:
             raise ValueError(f"No overall template configured for spread type: {self.spread_type}")
         
-        template_name = template_base.replace(".txt", f"{lang_suffix}.txt")
-        
-        try:
-            template = self.jinja_env.get_template(template_name)
-        except Exception as e:
-            logger.warning(f"Template {template_name} not found, falling back to English: {e}")
-            template = self.jinja_env.get_template(template_base.replace(".txt", "_en.txt"))
+        template = get_parallel_template(template_base)
         
         prompt_context = {
             "question": question,
@@ -523,9 +496,7 @@ class ParallelReadingEngine:
         }
         prompt = template.render(**prompt_context)
         
-        output_template = self.jinja_env.get_template("output/structured_response.txt")
-        output_format = output_template.render()
-        full_prompt = f"{prompt}\n\n{output_format}"
+        full_prompt = f"{prompt}\n\n{OUTPUT_FORMAT}"
         
         # LLM 설정 가져오기 (프롬프트 분석 기반 동적 할당)
         config = self.allocator.get_config_for_prompt(
@@ -566,23 +537,13 @@ class ParallelReadingEngine:
         card_summaries: List[Dict[str, Any]]
     ) -> Tuple[Dict[str, str], Optional[OrchestratorResponse]]:
         """카드 관계 분석 생성"""
-        # 프롬프트 언어 설정 확인 (기본: 영어)
-        prompt_lang = settings.PROMPT_LANGUAGE
-        lang_suffix = f"_{prompt_lang}" if prompt_lang == "en" else "_en"  # Default to English
-        
         # 스프레드 설정에서 템플릿 경로 가져오기
         template_base = self.spread_config.parallel_templates.get("relationships") if self.spread_config.parallel_templates else None
         if not template_base:
             # 관계 분석이 선택적일 수 있음 (일부 스프레드는 관계 분석이 없을 수 있음)
             return {"card_relationships": ""}, None
         
-        template_name = template_base.replace(".txt", f"{lang_suffix}.txt")
-        
-        try:
-            template = self.jinja_env.get_template(template_name)
-        except Exception as e:
-            logger.warning(f"Template {template_name} not found, falling back to English: {e}")
-            template = self.jinja_env.get_template(template_base.replace(".txt", "_en.txt"))
+        template = get_parallel_template(template_base)
         
         prompt_context = {
             "question": question,
@@ -592,9 +553,7 @@ class ParallelReadingEngine:
         }
         prompt = template.render(**prompt_context)
         
-        output_template = self.jinja_env.get_template("output/structured_response.txt")
-        output_format = output_template.render()
-        full_prompt = f"{prompt}\n\n{output_format}"
+        full_prompt = f"{prompt}\n\n{OUTPUT_FORMAT}"
         
         # LLM 설정 가져오기 (프롬프트 분석 기반 동적 할당)
         config = self.allocator.get_config_for_prompt(
@@ -634,10 +593,6 @@ class ParallelReadingEngine:
         overall_reading_summary: str
     ) -> Tuple[Dict[str, Advice], Optional[OrchestratorResponse]]:
         """조언 생성"""
-        # 프롬프트 언어 설정 확인 (기본: 영어)
-        prompt_lang = settings.PROMPT_LANGUAGE
-        lang_suffix = f"_{prompt_lang}" if prompt_lang == "en" else "_en"  # Default to English
-        
         # 스프레드 설정에서 템플릿 경로 가져오기
         template_base = self.spread_config.parallel_templates.get("advice") if self.spread_config.parallel_templates else None
         if not template_base:
@@ -652,13 +607,7 @@ class ParallelReadingEngine:
                 )
             }, None
         
-        template_name = template_base.replace(".txt", f"{lang_suffix}.txt")
-        
-        try:
-            template = self.jinja_env.get_template(template_name)
-        except Exception as e:
-            logger.warning(f"Template {template_name} not found, falling back to English: {e}")
-            template = self.jinja_env.get_template(template_base.replace(".txt", "_en.txt"))
+        template = get_parallel_template(template_base)
         
         prompt_context = {
             "question": question,
@@ -669,9 +618,7 @@ class ParallelReadingEngine:
         }
         prompt = template.render(**prompt_context)
         
-        output_template = self.jinja_env.get_template("output/structured_response.txt")
-        output_format = output_template.render()
-        full_prompt = f"{prompt}\n\n{output_format}"
+        full_prompt = f"{prompt}\n\n{OUTPUT_FORMAT}"
         
         # LLM 설정 가져오기 (프롬프트 분석 기반 동적 할당)
         config = self.allocator.get_config_for_prompt(
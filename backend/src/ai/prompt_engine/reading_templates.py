@@ -0,0 +1,154 @@
+"""
+Reading Templates - 리딩 프롬프트 템플릿 사전 컴파일/캐시
+
+이 모듈의 목적:
+- 프롬프트 템플릿을 임포트 시 한 번만 로드/컴파일
+- 변수가 없는 시스템/출력 형식 프롬프트를 미리 렌더링
+- 언어별 템플릿 폴백(en -> ko) 결과를 (스프레드, 언어) 단위로 캐시
+- 병렬 리딩 엔진의 단계별 템플릿 캐시
+
+readings.py(일반 리딩), readings_stream.py(SSE 리딩), ParallelReadingEngine이 함께 사용합니다.
+"""
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound
+
+from src.ai.prompt_engine.spread_config import SPREAD_CONFIGS, get_prompt_template_path
+
+logger = logging.getLogger(__name__)
+
+# dict에 실제로 존재하는 속성 이름 (items, keys 등) - 이 이름들은 기존대로 속성 우선
+_DICT_ATTRIBUTES = frozenset(dir(dict))
+
+
+class _PromptEnvironment(Environment):
+    """
+    프롬프트 렌더링용 Jinja2 환경
+
+    템플릿 컨텍스트(cards, rag_context 등)는 대부분 중첩 dict이고 `{{ card.name }}`처럼
+    속성 문법으로 접근합니다. 기본 Environment.getattr은 getattr()이 AttributeError를
+    던진 뒤에야 키 조회로 넘어가므로, 일반 dict는 키를 먼저 조회해 예외 비용을 없앱니다.
+    dict 메서드 이름은 기존과 동일하게 속성으로 해석됩니다.
+    """
+
+    def getattr(self, obj: Any, attribute: str) -> Any:
+        if type(obj) is dict and attribute not in _DICT_ATTRIBUTES:
+            try:
+                return obj[attribute]
+            except KeyError:
+                return self.undefined(obj=obj, name=attribute)
+        return super().getattr(obj, attribute)
+
+
+# Jinja2 환경 설정 (프롬프트 템플릿용)
+# 프롬프트 파일은 배포 시점에 고정되므로 요청마다 파일 변경 여부(stat)를 확인하지 않음
+PROMPTS_DIR = Path(__file__).parent.parent.parent.parent / "prompts"
+jinja_env = _PromptEnvironment(
+    loader=FileSystemLoader(str(PROMPTS_DIR)),
+    autoescape=False,  # HTML이 아닌 프롬프트를 생성하므로 이스케이프 검사 불필요
+    auto_reload=False,
+    cache_size=-1,  # 템플릿 수가 고정되어 있으므로 컴파일 결과를 제한 없이 유지
+)
+
+# 변수가 없는 시스템/출력 형식 프롬프트는 임포트 시 한 번만 렌더링
+SYSTEM_PROMPT = jinja_env.get_template("system/tarot_expert.txt").render()
+OUTPUT_FORMAT = jinja_env.get_template("output/structured_response.txt").render()
+
+
+def _default_template_path(spread_type: str, language: str) -> str:
+    """spread_config에 메인 템플릿이 없을 때 사용하는 기본 명명 규칙"""
+    lang_suffix = "_en" if language == "en" else ""
+    return f"reading/{spread_type}{lang_suffix}.txt"
+
+
+def _reading_template_path(spread_type: str, language: str) -> str:
+    """스프레드/언어에 해당하는 메인 리딩 템플릿 경로"""
+    return get_prompt_template_path(
+        spread_type=spread_type,
+        template_key="main",
+        language=language,
+    ) or _default_template_path(spread_type, language)
+
+
+def _load_template(template_path: str) -> Optional[Template]:
+    """템플릿 로드 (파일이 없으면 None)"""
+    try:
+        return jinja_env.get_template(template_path)
+    except TemplateNotFound:
+        return None
+
+
+# (스프레드, 언어) -> (템플릿 경로, 컴파일된 템플릿) - 한국어 폴백까지 적용된 결과
+# 템플릿이 없으면 None을 저장해 이후 요청은 파일 조회 없이 바로 실패 처리
+_RESOLVED_READING_TEMPLATES: Dict[Tuple[str, str], Tuple[str, Optional[Template]]] = {}
+
+
+def resolve_reading_template(spread_type: str, language: str) -> Tuple[str, Optional[Template]]:
+    """
+    메인 리딩 템플릿 조회 (언어별 템플릿이 없으면 기본(한국어) 템플릿으로 폴백)
+
+    Returns:
+        (템플릿 경로, 컴파일된 템플릿) - 폴백 템플릿도 없으면 템플릿은 None
+    """
+    key = (spread_type, language)
+    resolved = _RESOLVED_READING_TEMPLATES.get(key)
+    if resolved is None:
+        template_path = _reading_template_path(spread_type, language)
+        template = _load_template(template_path)
+        if template is None and language == "en":
+            fallback_path = _reading_template_path(spread_type, "ko")
+            logger.warning(
+                "[Templates] Template %s not found, falling back to default (Korean) version %s",
+                template_path,
+                fallback_path,
+            )
+            template = _load_template(fallback_path)
+            if template is not None:
+                template_path = fallback_path
+        resolved = (template_path, template)
+        _RESOLVED_READING_TEMPLATES[key] = resolved
+    return resolved
+
+
+# 병렬 리딩 단계별 템플릿: 설정상 기본 경로 -> 컴파일된 영어 템플릿
+_PARALLEL_TEMPLATES: Dict[str, Template] = {}
+
+
+def get_parallel_template(template_base: str) -> Template:
+    """
+    병렬 리딩(카드 배치/종합/관계/조언) 템플릿 조회
+
+    병렬 프롬프트는 언어 설정과 무관하게 영어(_en) 템플릿을 사용합니다.
+
+    Raises:
+        TemplateNotFound: 템플릿 파일이 없는 경우
+    """
+    template = _PARALLEL_TEMPLATES.get(template_base)
+    if template is None:
+        template = jinja_env.get_template(template_base.replace(".txt", "_en.txt"))
+        _PARALLEL_TEMPLATES[template_base] = template
+    return template
+
+
+def invalidate_reading_templates() -> None:
+    """해석/컴파일된 리딩 템플릿 캐시 비우기 (스프레드 설정 등록·변경 시 호출)"""
+    _RESOLVED_READING_TEMPLATES.clear()
+    _PARALLEL_TEMPLATES.clear()
+
+
+def _preload_reading_templates() -> None:
+    """등록된 모든 스프레드의 메인(ko/en) 및 병렬 리딩 템플릿을 미리 컴파일"""
+    for spread_type, config in SPREAD_CONFIGS.items():
+        for language in ("ko", "en"):
+            resolve_reading_template(spread_type, language)
+        for template_base in (config.parallel_templates or {}).values():
+            try:
+                get_parallel_template(template_base)
+            except TemplateNotFound:
+                logger.warning("[Templates] Parallel template not found: %s", template_base)
+
+
+# 런타임에 등록된 스프레드는 최초 사용 시 추가됨
+_preload_reading_templates()
@@ -96,7 +96,11 @@ class ReadingValidator:
         Raises:
             ValidationError: 검증 실패 시
         """
-        logger.info(f"[ReadingValidator] 리딩 품질 검증 시작 (카드 수: {expected_card_count}, 스프레드: {spread_type})")
+        logger.info(
+            "[ReadingValidator] 리딩 품질 검증 시작 (카드 수: %s, 스프레드: %s)",
+            expected_card_count,
+            spread_type,
+        )
 
         # 1. 필수 필드 존재 확인 (Pydantic에서 이미 검증되지만 재확인)
         ReadingValidator._validate_required_fields(reading)
@@ -188,7 +192,7 @@ class ReadingValidator:
                 f"카드 수가 일치하지 않습니다. 예상: {expected_count}, 실제: {actual_count}"
             )
 
-        logger.debug(f"[ReadingValidator] 카드 수 검증 통과: {actual_count}장")
+        logger.debug("[ReadingValidator] 카드 수 검증 통과: %d장", actual_count)
 
     @staticmethod
     def validate_korean_content(reading: ReadingResponse, spread_type: Optional[str] = None) -> None:
@@ -100,15 +100,15 @@ class ResponseParser:
             logger.error("[ResponseParser] 빈 응답을 받았습니다")
             raise ParseError("AI 응답이 비어있습니다")
 
-        logger.info(f"[ResponseParser] 응답 파싱 시작 (길이: {len(response_text)}자)")
+        logger.info("[ResponseParser] 응답 파싱 시작 (길이: %d자)", len(response_text))
         logger.debug("[ResponseParser] 원본 응답:\n%s", response_text)
 
         # 1. JSON 추출
         try:
             json_text = ResponseParser.extract_json(response_text)
-            logger.debug(f"[ResponseParser] JSON 추출 성공 (길이: {len(json_text)}자)")
+            logger.debug("[ResponseParser] JSON 추출 성공 (길이: %d자)", len(json_text))
         except JSONExtractionError as e:
-            logger.error(f"[ResponseParser] JSON 추출 실패: {e}")
+            logger.error("[ResponseParser] JSON 추출 실패: %s", e)
             raise
 
         # 2. JSON 파싱
@@ -116,8 +116,8 @@ class ResponseParser:
             data = json.loads(json_text)
             logger.debug("[ResponseParser] JSON 파싱 성공")
         except json.JSONDecodeError as e:
-            logger.error(f"[ResponseParser] JSON 파싱 실패: {e}")
-            logger.error(f"[ResponseParser] 문제가 있는 JSON (전체 {len(json_text)}자):\n{json_text}")
+            logger.error("[ResponseParser] JSON 파싱 실패: %s", e)
+            logger.error("[ResponseParser] 문제가 있는 JSON (전체 %d자):\n%s", len(json_text), json_text)
 
             # Try to show context around the error
             if e.pos:
@@ -125,9 +125,9 @@ class ResponseParser:
                 end = min(len(json_text), e.pos + 50)
                 error_pos = e.pos - start
                 context = json_text[start:end]
-                logger.error(f"[ResponseParser] 오류 위치 (pos={e.pos}, line={e.lineno}, col={e.colno}):")
-                logger.error(f"{context}")
-                logger.error(f"{' ' * error_pos}^ ERROR HERE")
+                logger.error("[ResponseParser] 오류 위치 (pos=%d, line=%d, col=%d):", e.pos, e.lineno, e.colno)
+                logger.error("%s", context)
+                logger.error("%s^ ERROR HERE", " " * error_pos)
 
             # Enhanced truncation detection
             json_text_stripped = json_text.rstrip()
@@ -200,7 +200,7 @@ class ResponseParser:
             logger.info("[ResponseParser] 응답 검증 성공")
             return reading
         except ValidationError as e:
-            logger.error(f"[ResponseParser] 검증 실패: {e}")
+            logger.error("[ResponseParser] 검증 실패: %s", e)
             raise
 
     @staticmethod
@@ -337,7 +337,7 @@ class ResponseParser:
             return ResponseParser.sanitize_json(extracted)
 
         # JSON을 찾을 수 없음
-        logger.error(f"[ResponseParser] JSON을 찾을 수 없습니다. 응답 일부: {text[:200]}...")
+        logger.error("[ResponseParser] JSON을 찾을 수 없습니다. 응답 일부: %s...", text[:200])
         raise JSONExtractionError(
             "응답에서 유효한 JSON을 찾을 수 없습니다. "
             "AI가 올바른 형식으로 응답하지 않았을 수 있습니다."
@@ -393,7 +393,7 @@ class ResponseParser:
                     error_messages.append(f"{field}: {msg}")
 
             error_summary = '\n'.join(f"  - {msg}" for msg in error_messages)
-            logger.error(f"[ResponseParser] Pydantic 검증 실패:\n{error_summary}")
+            logger.error("[ResponseParser] Pydantic 검증 실패:\n%s", error_summary)
 
             raise ValidationError(
                 f"응답이 올바른 형식을 따르지 않습니다:\n{error_summary}"
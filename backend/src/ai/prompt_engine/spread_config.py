@@ -11,7 +11,7 @@ Spread Configuration - 스프레드 타입별 설정 관리
 - 병렬 처리 지원 여부 및 배치 크기 설정
 - 스프레드별 특화 설정 관리
 """
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 import logging
 
@@ -43,6 +43,18 @@ class SpreadConfig:
     max_concurrent_calls: Optional[int] = None
 
 
+# 단일 LLM 호출의 max_tokens 상한 (API 제한)
+MAX_TOKENS_LIMIT = 4096
+
+
+@dataclass(frozen=True)
+class SpreadMeta:
+    """리딩 요청 처리 시 매번 필요한 스프레드별 상수 (SPREAD_CONFIGS에서 파생)"""
+    card_count: int
+    max_tokens: int  # MAX_TOKENS_LIMIT 적용 후 값
+    position_names: Tuple[str, ...] = ()  # 포지션 이름 (한글)
+
+
 # 스프레드 설정 레지스트리
 SPREAD_CONFIGS: Dict[str, SpreadConfig] = {
     "one_card": SpreadConfig(
@@ -236,6 +248,12 @@ def register_spread_config(config: SpreadConfig):
         config: SpreadConfig 인스턴스
     """
     SPREAD_CONFIGS[config.spread_type] = config
+    _SPREAD_META.pop(config.spread_type, None)
+
+    # reading_templates가 모듈 로드 시 이 모듈을 import하므로 호출 시점에 import
+    from src.ai.prompt_engine.reading_templates import invalidate_reading_templates
+
+    invalidate_reading_templates()
     logger.info(f"Registered new spread config: {config.spread_type}")
 
 
@@ -265,3 +283,27 @@ def get_max_tokens(spread_type: str, language: str = "ko") -> int:
     else:
         return 2500
 
+
+# 스프레드 타입 -> SpreadMeta (요청 경로에서 설정 조회/계산을 반복하지 않도록 캐시)
+_SPREAD_META: Dict[str, SpreadMeta] = {}
+
+
+def get_spread_meta(spread_type: str) -> SpreadMeta:
+    """
+    스프레드 타입의 카드 수, 최대 토큰 수, 포지션 이름을 한 번에 반환
+
+    Args:
+        spread_type: 스프레드 타입 문자열
+
+    Returns:
+        SpreadMeta (알 수 없는 타입은 get_card_count/get_max_tokens 기본값 사용)
+    """
+    meta = _SPREAD_META.get(spread_type)
+    if meta is None:
+        meta = SpreadMeta(
+            card_count=get_card_count(spread_type),
+            max_tokens=min(get_max_tokens(spread_type), MAX_TOKENS_LIMIT),
+            position_names=tuple(get_position_names(spread_type)),
+        )
+        _SPREAD_META[spread_type] = meta
+    return meta
@@ -15,7 +15,7 @@ AI Provider 기본 클래스 및 인터페이스 모듈
 TASK-015: AI Provider 인터페이스 설계 구현
 """
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator, Union
 from datetime import datetime
 import time
 import logging
@@ -129,6 +129,43 @@ class AIProvider(ABC):
         """
         pass
 
+    async def stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        config: Optional[GenerationConfig] = None,
+        model: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[Union[str, AIResponse]]:
+        """
+        Stream generated text as it arrives
+
+        Yields text deltas (str) in order; the final item is the complete
+        AIResponse (full content, token usage, cost). The default
+        implementation falls back to a single generate() call, so providers
+        without native streaming still work with streaming callers.
+
+        Args:
+            prompt: User prompt/message
+            system_prompt: Optional system instruction
+            config: Generation configuration
+            model: Model to use (overrides default)
+            **kwargs: Additional provider-specific parameters
+
+        Raises:
+            Same errors as generate()
+        """
+        response = await self.generate(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            config=config,
+            model=model,
+            **kwargs
+        )
+        if response.content:
+            yield response.content
+        yield response
+
     @abstractmethod
     def estimate_cost(
         self,
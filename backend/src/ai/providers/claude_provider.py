@@ -5,10 +5,11 @@ Implements AIProvider interface for Anthropic's Claude models
 """
 import logging
 import time
-from typing import List, Optional, Dict, Any
-from anthropic import AsyncAnthropic, APIError, RateLimitError, AuthenticationError as AnthropicAuthError, APITimeoutError
+from typing import List, Optional, Dict, Any, AsyncIterator, Union
+from anthropic import DefaultAsyncHttpxClient, AsyncAnthropic, APIError, RateLimitError, AuthenticationError as AnthropicAuthError, APITimeoutError
 
 from src.ai.provider import AIProvider
+from src.ai.http_client import get_shared_http_client
 from src.ai.models import (
     AIResponse,
     AIProviderError,
@@ -68,7 +69,8 @@ class ClaudeProvider(AIProvider):
         api_key: str,
         default_model: str = "claude-sonnet-4-5-20250929",
         timeout: int = 30,
-        max_retries: int = 3
+        max_retries: int = 3,
+        http_client: Optional[DefaultAsyncHttpxClient] = None
     ):
         """
         Initialize Claude provider
@@ -78,14 +80,18 @@ class ClaudeProvider(AIProvider):
             default_model: Default model to use
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts
+            http_client: Optional SDK HTTP client (defaults to the shared keep-alive client)
         """
         super().__init__(api_key, default_model, timeout, max_retries)
 
         self.client = AsyncAnthropic(
             api_key=api_key,
             timeout=timeout,
-            max_retries=0  # We handle retries ourselves
+            max_retries=0,  # We handle retries ourselves
+            http_client=http_client or get_shared_http_client(DefaultAsyncHttpxClient),
         )
+        # 공용 클라이언트는 앱 종료 시 close_shared_http_clients()가 정리
+        self._owns_http_client = http_client is not None
 
     @property
     def provider_name(self) -> str:
@@ -214,38 +220,112 @@ class ClaudeProvider(AIProvider):
                 raw_response=response.model_dump() if hasattr(response, 'model_dump') else None
             )
 
-        except RateLimitError as e:
-            raise AIRateLimitError(
+        except Exception as e:
+            raise self._convert_error(e) from e
+
+    async def stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        config: Optional[GenerationConfig] = None,
+        model: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[Union[str, AIResponse]]:
+        """
+        Stream text from Anthropic's Messages streaming API
+
+        Yields text deltas as they arrive, then the complete AIResponse
+        built from the final message (usage, stop reason).
+        """
+        start_time = time.time()
+
+        if config is None:
+            config = GenerationConfig()
+        if model is None:
+            model = self.default_model
+        self._validate_model(model)
+
+        request_params = {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": config.max_tokens,
+            "temperature": config.temperature,
+        }
+        if system_prompt:
+            request_params["system"] = system_prompt
+        if config.stop_sequences:
+            request_params["stop_sequences"] = config.stop_sequences
+        request_params.update(kwargs)
+
+        try:
+            logger.info(
+                "[Anthropic] Streaming request model=%s max_tokens=%s temperature=%.2f timeout=%ss",
+                model,
+                config.max_tokens,
+                config.temperature,
+                self.timeout,
+            )
+            async with self.client.messages.stream(**request_params) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                response = await stream.get_final_message()
+        except Exception as e:
+            raise self._convert_error(e) from e
+
+        content = "".join(
+            block.text for block in response.content if getattr(block, "type", None) == "text"
+        )
+        usage = response.usage
+        prompt_tokens = usage.input_tokens if usage else 0
+        completion_tokens = usage.output_tokens if usage else 0
+
+        yield AIResponse(
+            content=content,
+            model=response.model,
+            provider=self.provider_name,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+            estimated_cost=self.estimate_cost(prompt_tokens, completion_tokens, model),
+            finish_reason=response.stop_reason,
+            latency_ms=self._track_latency(start_time),
+            raw_response=response.model_dump() if hasattr(response, 'model_dump') else None
+        )
+
+    def _convert_error(self, e: Exception) -> AIProviderError:
+        """Anthropic SDK 예외를 통합 AIProviderError 계열로 변환"""
+        if isinstance(e, AIProviderError):
+            return e
+        if isinstance(e, RateLimitError):
+            return AIRateLimitError(
                 str(e),
                 provider=self.provider_name,
                 retry_after=getattr(e, 'retry_after', None)
             )
-        except AnthropicAuthError as e:
-            raise AIAuthenticationError(str(e), provider=self.provider_name)
-        except APITimeoutError as e:
-            raise AITimeoutError(str(e), provider=self.provider_name)
-        except APIError as e:
+        if isinstance(e, AnthropicAuthError):
+            return AIAuthenticationError(str(e), provider=self.provider_name)
+        if isinstance(e, APITimeoutError):
+            return AITimeoutError(str(e), provider=self.provider_name)
+        if isinstance(e, APIError):
             # Generic Anthropic API error
             error_message = str(e)
 
             if "overloaded" in error_message.lower() or "unavailable" in error_message.lower():
-                raise AIServiceUnavailableError(error_message, provider=self.provider_name)
+                return AIServiceUnavailableError(error_message, provider=self.provider_name)
             elif "invalid" in error_message.lower():
-                raise AIInvalidRequestError(error_message, provider=self.provider_name)
-            else:
-                raise AIProviderError(
-                    error_message,
-                    provider=self.provider_name,
-                    error_type="UNKNOWN",
-                    original_error=e
-                )
-        except Exception as e:
-            raise AIProviderError(
-                f"Unexpected error: {str(e)}",
+                return AIInvalidRequestError(error_message, provider=self.provider_name)
+            return AIProviderError(
+                error_message,
                 provider=self.provider_name,
-                error_type="UNEXPECTED",
+                error_type="UNKNOWN",
                 original_error=e
             )
+        return AIProviderError(
+            f"Unexpected error: {str(e)}",
+            provider=self.provider_name,
+            error_type="UNEXPECTED",
+            original_error=e
+        )
 
     def _validate_model(self, model: str) -> None:
         """
@@ -355,5 +435,6 @@ class ClaudeProvider(AIProvider):
         return 200000
 
     async def close(self):
-        """Close the Anthropic client connection"""
-        await self.client.close()
+        """Close the Anthropic client connection (shared HTTP client is left open)"""
+        if self._owns_http_client:
+            await self.client.close()
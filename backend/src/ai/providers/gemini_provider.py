@@ -19,7 +19,7 @@ Gemini Provider 구현 모듈
 """
 import time
 import logging
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Union
 
 try:
     import google.generativeai as genai
@@ -251,37 +251,8 @@ class GeminiProvider(AIProvider):
             
             if hasattr(response, 'candidates') and response.candidates:
                 candidate = response.candidates[0]
-                finish_reason_raw = candidate.finish_reason
-                
-                # Convert Gemini finish_reason enum to standardized string
-                # 0: FINISH_REASON_UNSPECIFIED -> None
-                # 1: STOP -> "stop"
-                # 2: MAX_TOKENS -> "max_tokens"
-                # 3: SAFETY -> "safety"
-                # 4: RECITATION -> "recitation"
-                # 5: OTHER -> "other"
-                finish_reason_map = {
-                    0: None,  # FINISH_REASON_UNSPECIFIED
-                    1: "stop",  # STOP
-                    2: "max_tokens",  # MAX_TOKENS
-                    3: "safety",  # SAFETY
-                    4: "recitation",  # RECITATION
-                    5: "other",  # OTHER
-                }
-                
-                # Handle enum value (int) or string representation
-                if isinstance(finish_reason_raw, int):
-                    finish_reason = finish_reason_map.get(finish_reason_raw)
-                elif isinstance(finish_reason_raw, str):
-                    # Try to parse string representation
-                    try:
-                        finish_reason_int = int(finish_reason_raw)
-                        finish_reason = finish_reason_map.get(finish_reason_int)
-                    except ValueError:
-                        finish_reason = finish_reason_raw.lower() if finish_reason_raw else None
-                else:
-                    finish_reason = str(finish_reason_raw) if finish_reason_raw else None
-                
+                finish_reason = self._finish_reason(candidate)
+
                 # Try to extract content from parts
                 if hasattr(candidate, 'content') and candidate.content:
                     if hasattr(candidate.content, 'parts') and candidate.content.parts:
@@ -347,37 +318,169 @@ class GeminiProvider(AIProvider):
                 raw_response=None  # Gemini response objects are not directly serializable
             )
 
-        except google_exceptions.ResourceExhausted as e:
-            raise AIRateLimitError(
+        except Exception as e:
+            raise self._convert_error(e) from e
+
+    async def stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        config: Optional[GenerationConfig] = None,
+        model: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[Union[str, AIResponse]]:
+        """
+        Stream text using Gemini's streaming generate_content
+
+        Yields text deltas as they arrive, then the complete AIResponse
+        (usage metadata and finish reason come with the last chunk).
+        """
+        start_time = time.time()
+
+        if config is None:
+            config = GenerationConfig()
+        if model is None:
+            model = self.default_model
+        self._validate_model(model)
+
+        gemini_model = genai.GenerativeModel(
+            model_name=model,
+            safety_settings=self.safety_settings,
+        )
+        generation_config = genai.GenerationConfig(
+            temperature=config.temperature,
+            max_output_tokens=config.max_tokens,
+            top_p=config.top_p,
+            stop_sequences=config.stop_sequences if config.stop_sequences else None,
+        )
+        full_prompt = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+
+        text_parts: List[str] = []
+        finish_reason = None
+        usage = None
+        try:
+            logger.info(
+                "[Gemini] Streaming request model=%s max_tokens=%s temperature=%.2f timeout=%ss",
+                model,
+                config.max_tokens,
+                config.temperature,
+                self.timeout,
+            )
+            response = await gemini_model.generate_content_async(
+                full_prompt,
+                generation_config=generation_config,
+                request_options={"timeout": self.timeout},
+                stream=True,
+            )
+            # 응답 객체는 close를 제공하지 않으므로 순회 이터레이터를 직접 잡아
+            # 데드라인 취소나 클라이언트 연결 종료 시에도 스트림 소비를 정리
+            chunks = response.__aiter__()
+            try:
+                async for chunk in chunks:
+                    candidates = getattr(chunk, "candidates", None)
+                    if candidates:
+                        candidate = candidates[0]
+                        if candidate.finish_reason:
+                            finish_reason = self._finish_reason(candidate)
+                        content = getattr(candidate, "content", None)
+                        for part in (getattr(content, "parts", None) or []):
+                            text = getattr(part, "text", None)
+                            if text:
+                                text_parts.append(text)
+                                yield text
+                    if getattr(chunk, "usage_metadata", None):
+                        usage = chunk.usage_metadata
+            finally:
+                aclose = getattr(chunks, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+        except Exception as e:
+            raise self._convert_error(e) from e
+
+        prompt_tokens = getattr(usage, 'prompt_token_count', 0) if usage else 0
+        completion_tokens = getattr(usage, 'candidates_token_count', 0) if usage else 0
+        total_tokens = getattr(usage, 'total_token_count', 0) if usage else 0
+
+        yield AIResponse(
+            content="".join(text_parts),
+            model=model,
+            provider=self.provider_name,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=total_tokens,
+            estimated_cost=self.estimate_cost(prompt_tokens, completion_tokens, model),
+            finish_reason=finish_reason,
+            latency_ms=self._track_latency(start_time),
+            raw_response=None
+        )
+
+    @staticmethod
+    def _finish_reason(candidate: Any) -> Optional[str]:
+        """
+        Convert Gemini finish_reason enum to standardized string
+
+        0: FINISH_REASON_UNSPECIFIED -> None
+        1: STOP -> "stop"
+        2: MAX_TOKENS -> "max_tokens"
+        3: SAFETY -> "safety"
+        4: RECITATION -> "recitation"
+        5: OTHER -> "other"
+        """
+        finish_reason_raw = candidate.finish_reason
+        finish_reason_map = {
+            0: None,  # FINISH_REASON_UNSPECIFIED
+            1: "stop",  # STOP
+            2: "max_tokens",  # MAX_TOKENS
+            3: "safety",  # SAFETY
+            4: "recitation",  # RECITATION
+            5: "other",  # OTHER
+        }
+
+        # Handle enum value (int) or string representation
+        if isinstance(finish_reason_raw, int):
+            return finish_reason_map.get(finish_reason_raw)
+        if isinstance(finish_reason_raw, str):
+            # Try to parse string representation
+            try:
+                return finish_reason_map.get(int(finish_reason_raw))
+            except ValueError:
+                return finish_reason_raw.lower() if finish_reason_raw else None
+        return str(finish_reason_raw) if finish_reason_raw else None
+
+    def _convert_error(self, e: Exception) -> AIProviderError:
+        """Gemini API 예외를 통합 AIProviderError 계열로 변환"""
+        if isinstance(e, AIProviderError):
+            return e
+        if isinstance(e, google_exceptions.ResourceExhausted):
+            return AIRateLimitError(
                 str(e),
                 provider=self.provider_name,
                 retry_after=None
             )
-        except google_exceptions.Unauthenticated as e:
-            raise AIAuthenticationError(str(e), provider=self.provider_name)
-        except google_exceptions.DeadlineExceeded as e:
-            raise AITimeoutError(str(e), provider=self.provider_name)
-        except google_exceptions.ServiceUnavailable as e:
-            raise AIServiceUnavailableError(str(e), provider=self.provider_name)
-        except google_exceptions.InvalidArgument as e:
-            raise AIInvalidRequestError(str(e), provider=self.provider_name)
-        except Exception as e:
-            error_message = str(e)
-            
-            # Check for specific error patterns
-            if "quota" in error_message.lower() or "rate limit" in error_message.lower():
-                raise AIRateLimitError(error_message, provider=self.provider_name)
-            elif "unauthorized" in error_message.lower() or "authentication" in error_message.lower():
-                raise AIAuthenticationError(error_message, provider=self.provider_name)
-            elif "timeout" in error_message.lower():
-                raise AITimeoutError(error_message, provider=self.provider_name)
-            else:
-                raise AIProviderError(
-                    f"Unexpected error: {error_message}",
-                    provider=self.provider_name,
-                    error_type="UNEXPECTED",
-                    original_error=e
-                )
+        if isinstance(e, google_exceptions.Unauthenticated):
+            return AIAuthenticationError(str(e), provider=self.provider_name)
+        if isinstance(e, google_exceptions.DeadlineExceeded):
+            return AITimeoutError(str(e), provider=self.provider_name)
+        if isinstance(e, google_exceptions.ServiceUnavailable):
+            return AIServiceUnavailableError(str(e), provider=self.provider_name)
+        if isinstance(e, google_exceptions.InvalidArgument):
+            return AIInvalidRequestError(str(e), provider=self.provider_name)
+
+        error_message = str(e)
+
+        # Check for specific error patterns
+        if "quota" in error_message.lower() or "rate limit" in error_message.lower():
+            return AIRateLimitError(error_message, provider=self.provider_name)
+        elif "unauthorized" in error_message.lower() or "authentication" in error_message.lower():
+            return AIAuthenticationError(error_message, provider=self.provider_name)
+        elif "timeout" in error_message.lower():
+            return AITimeoutError(error_message, provider=self.provider_name)
+        return AIProviderError(
+            f"Unexpected error: {error_message}",
+            provider=self.provider_name,
+            error_type="UNEXPECTED",
+            original_error=e
+        )
 
     def _validate_model(self, model: str) -> None:
         """
@@ -14,7 +14,7 @@ OpenAI Provider 구현 모듈
 
 주요 기능:
 - System/User 프롬프트 분리 지원
-- 스트리밍 응답 가능 (추후 구현)
+- 스트리밍 응답 지원 (stream())
 - Rate Limit 및 Timeout 에러 핸들링
 - 1K 토큰당 비용 자동 계산
 
@@ -22,11 +22,12 @@ TASK-016: OpenAI Provider 구현
 """
 import time
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator, Union
 import tiktoken
-from openai import AsyncOpenAI, OpenAIError, RateLimitError, AuthenticationError as OpenAIAuthError, APITimeoutError
+from openai import DefaultAsyncHttpxClient, AsyncOpenAI, OpenAIError, RateLimitError, AuthenticationError as OpenAIAuthError, APITimeoutError
 
 from src.ai.provider import AIProvider
+from src.ai.http_client import get_shared_http_client
 from src.ai.models import (
     AIResponse,
     AIProviderError,
@@ -125,7 +126,8 @@ class OpenAIProvider(AIProvider):
         default_model: str = "gpt-4-turbo-preview",
         timeout: int = 30,
         max_retries: int = 3,
-        organization: Optional[str] = None
+        organization: Optional[str] = None,
+        http_client: Optional[DefaultAsyncHttpxClient] = None
     ):
         """
         Initialize OpenAI provider
@@ -136,6 +138,7 @@ class OpenAIProvider(AIProvider):
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts
             organization: Optional organization ID
+            http_client: Optional SDK HTTP client (defaults to the shared keep-alive client)
         """
         super().__init__(api_key, default_model, timeout, max_retries)
 
@@ -143,8 +146,11 @@ class OpenAIProvider(AIProvider):
             api_key=api_key,
             timeout=timeout,
             max_retries=0,  # We handle retries ourselves
-            organization=organization
+            organization=organization,
+            http_client=http_client or get_shared_http_client(DefaultAsyncHttpxClient),
         )
+        # 공용 클라이언트는 앱 종료 시 close_shared_http_clients()가 정리
+        self._owns_http_client = http_client is not None
 
         # Cache for tiktoken encoders
         self._encoders: Dict[str, tiktoken.Encoding] = {}
@@ -313,38 +319,128 @@ class OpenAIProvider(AIProvider):
                 raw_response=response.model_dump() if hasattr(response, 'model_dump') else None
             )
 
-        except RateLimitError as e:
-            raise AIRateLimitError(
+        except Exception as e:
+            raise self._convert_error(e) from e
+
+    async def stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        config: Optional[GenerationConfig] = None,
+        model: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[Union[str, AIResponse]]:
+        """
+        Stream text from OpenAI's chat completions API (stream=True)
+
+        Yields content deltas as they arrive, then the complete AIResponse.
+        Token usage comes from the trailing usage chunk
+        (stream_options.include_usage).
+        """
+        start_time = time.time()
+
+        if config is None:
+            config = GenerationConfig()
+        if model is None:
+            model = self.default_model
+        self._validate_model(model)
+
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        parts: List[str] = []
+        finish_reason = None
+        usage = None
+
+        try:
+            logger.info(
+                "[OpenAI] Streaming request model=%s max_tokens=%s temperature=%.2f timeout=%ss",
+                model,
+                config.max_tokens,
+                config.temperature,
+                self.timeout,
+            )
+            response_stream = await self.client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=config.temperature,
+                max_tokens=config.max_tokens,
+                top_p=config.top_p,
+                frequency_penalty=config.frequency_penalty,
+                presence_penalty=config.presence_penalty,
+                stop=config.stop_sequences,
+                stream=True,
+                stream_options={"include_usage": True},
+                **kwargs
+            )
+            # 데드라인 취소나 클라이언트 연결 종료로 중간에 빠져나가도 HTTP 스트림을 닫음
+            async with response_stream:
+                async for chunk in response_stream:
+                    if chunk.usage is not None:
+                        usage = chunk.usage
+                    if not chunk.choices:
+                        continue
+                    choice = chunk.choices[0]
+                    if choice.finish_reason:
+                        finish_reason = choice.finish_reason
+                    delta = choice.delta.content if choice.delta else None
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+        except Exception as e:
+            raise self._convert_error(e) from e
+
+        prompt_tokens = usage.prompt_tokens if usage else 0
+        completion_tokens = usage.completion_tokens if usage else 0
+
+        yield AIResponse(
+            content="".join(parts),
+            model=model,
+            provider=self.provider_name,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=usage.total_tokens if usage else 0,
+            estimated_cost=self.estimate_cost(prompt_tokens, completion_tokens, model),
+            finish_reason=finish_reason,
+            latency_ms=self._track_latency(start_time),
+        )
+
+    def _convert_error(self, e: Exception) -> AIProviderError:
+        """OpenAI SDK 예외를 통합 AIProviderError 계열로 변환"""
+        if isinstance(e, AIProviderError):
+            return e
+        if isinstance(e, RateLimitError):
+            return AIRateLimitError(
                 str(e),
                 provider=self.provider_name,
                 retry_after=getattr(e, 'retry_after', None)
             )
-        except OpenAIAuthError as e:
-            raise AIAuthenticationError(str(e), provider=self.provider_name)
-        except APITimeoutError as e:
-            raise AITimeoutError(str(e), provider=self.provider_name)
-        except OpenAIError as e:
+        if isinstance(e, OpenAIAuthError):
+            return AIAuthenticationError(str(e), provider=self.provider_name)
+        if isinstance(e, APITimeoutError):
+            return AITimeoutError(str(e), provider=self.provider_name)
+        if isinstance(e, OpenAIError):
             # Generic OpenAI error
             error_message = str(e)
 
             if "service_unavailable" in error_message.lower():
-                raise AIServiceUnavailableError(error_message, provider=self.provider_name)
+                return AIServiceUnavailableError(error_message, provider=self.provider_name)
             elif "invalid" in error_message.lower():
-                raise AIInvalidRequestError(error_message, provider=self.provider_name)
-            else:
-                raise AIProviderError(
-                    error_message,
-                    provider=self.provider_name,
-                    error_type="UNKNOWN",
-                    original_error=e
-                )
-        except Exception as e:
-            raise AIProviderError(
-                f"Unexpected error: {str(e)}",
+                return AIInvalidRequestError(error_message, provider=self.provider_name)
+            return AIProviderError(
+                error_message,
                 provider=self.provider_name,
-                error_type="UNEXPECTED",
+                error_type="UNKNOWN",
                 original_error=e
             )
+        return AIProviderError(
+            f"Unexpected error: {str(e)}",
+            provider=self.provider_name,
+            error_type="UNEXPECTED",
+            original_error=e
+        )
 
     def _validate_model(self, model: str) -> None:
         """
@@ -479,5 +575,6 @@ class OpenAIProvider(AIProvider):
         return 4096
 
     async def close(self):
-        """Close the OpenAI client connection"""
-        await self.client.close()
+        """Close the OpenAI client connection (shared HTTP client is left open)"""
+        if self._owns_http_client:
+            await self.client.close()
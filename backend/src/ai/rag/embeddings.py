@@ -8,6 +8,7 @@ Classes:
     EmbeddingModel: Singleton wrapper for sentence-transformers model
 """
 import logging
+import threading
 from typing import List, Optional
 from sentence_transformers import SentenceTransformer
 import numpy as np
@@ -115,6 +116,8 @@ class EmbeddingModel:
 
 # Singleton instance holder
 _embedding_model_instance: Optional[EmbeddingModel] = None
+# 검색은 executor 스레드에서 실행되므로 첫 동시 요청들이 모델을 중복 로드하지 않도록 보호
+_embedding_model_lock = threading.Lock()
 
 
 def get_embedding_model(model_name: str = "paraphrase-multilingual-MiniLM-L12-v2") -> EmbeddingModel:
@@ -133,8 +136,12 @@ def get_embedding_model(model_name: str = "paraphrase-multilingual-MiniLM-L12-v2
     """
     global _embedding_model_instance
 
-    if _embedding_model_instance is None:
-        logger.info("Creating new EmbeddingModel singleton instance")
-        _embedding_model_instance = EmbeddingModel(model_name=model_name)
+    instance = _embedding_model_instance
+    if instance is not None:
+        return instance
 
-    return _embedding_model_instance
+    with _embedding_model_lock:
+        if _embedding_model_instance is None:
+            logger.info("Creating new EmbeddingModel singleton instance")
+            _embedding_model_instance = EmbeddingModel(model_name=model_name)
+        return _embedding_model_instance
@@ -428,20 +428,20 @@ async def get_current_admin_user(
         
         if not user_email or user_email not in admin_emails:
             logger.warning(
-                f"[Auth] 관리자 권한 없음: user_id={current_user.id}, email={user_email}"
+                "[Auth] 관리자 권한 없음: user_id=%s, email=%s", current_user.id, user_email
             )
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="관리자 권한이 필요합니다. 관리자에게 문의하세요."
             )
         
-        logger.info(f"[Auth] 관리자 권한 확인 성공: email={user_email}")
+        logger.debug("[Auth] 관리자 권한 확인 성공: email=%s", user_email)
         return current_user
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"[Auth] 관리자 권한 확인 실패: {e}")
+        logger.error("[Auth] 관리자 권한 확인 실패: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="권한 확인 중 오류가 발생했습니다"
@@ -0,0 +1,25 @@
+"""
+리딩 응답/개수 캐시 공통 정의
+
+readings와 readings_stream 라우터가 함께 쓰는 Redis 캐시 키와 무효화 함수입니다.
+라우터 모듈끼리 서로 import하지 않도록 별도 모듈에 둡니다.
+"""
+import asyncio
+from typing import Optional
+
+from src.core.cache import cache
+
+# GET /readings/{id} 응답 캐시 (리딩은 생성 후 불변)
+READING_RESPONSE_CACHE_PREFIX = "read:reading:"
+READING_RESPONSE_CACHE_TTL = 300
+
+# 사용자별 리딩 수 캐시: {스프레드 필터(없으면 "*"): 개수} 형태로 사용자당 키 하나
+# 페이지 이동마다 COUNT를 반복하지 않고, 리딩 생성 시 키 하나만 삭제하면 무효화됨
+READING_COUNT_CACHE_PREFIX = "readings:count:"
+READING_COUNT_CACHE_TTL = 60
+
+
+async def invalidate_reading_count_cache(user_id: Optional[str]) -> None:
+    """사용자의 리딩 수 캐시 무효화 (리딩 생성 후 호출, 동기 Redis 호출은 스레드에서 실행)"""
+    if user_id:
+        await asyncio.to_thread(cache.delete, f"{READING_COUNT_CACHE_PREFIX}{user_id}")
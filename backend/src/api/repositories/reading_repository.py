@@ -13,6 +13,8 @@ Reading Repository - 타로 리딩 데이터 접근 계층
 - get_all(): 모든 Reading 목록 조회 (페이지네이션)
 - count_all(): 전체 Reading 개수 조회
 - get_by_user(): 특정 사용자의 Reading 목록 조회
+- count_by_user(): 특정 사용자의 Reading 개수 조회
+- get_by_user_paginated(): 사용자 Reading 목록 + 전체 개수 (단일 쿼리)
 
 구현 사항:
 - 정적 메서드 사용 (stateless repository 패턴)
@@ -56,10 +58,10 @@ TASK 참조:
     print(reading.question)
     print(reading.cards[0].card.name)
 """
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, func, insert
 
 from src.models import Reading, ReadingCard
 from src.core.logging import get_logger
@@ -115,13 +117,14 @@ class ReadingRepository:
 
             logger.info(f"[ReadingRepository] Reading 생성: ID={reading.id}, spread_type={reading.spread_type}")
 
-            # ReadingCard 생성
-            for card_data in cards_data:
-                reading_card = ReadingCard(
-                    reading_id=reading.id,
-                    **card_data
+            # ReadingCard 생성: 카드 수와 관계없이 한 번의 multi-row INSERT
+            if cards_data:
+                db.execute(
+                    insert(ReadingCard),
+                    [{"reading_id": reading.id, **card_data} for card_data in cards_data],
                 )
-                db.add(reading_card)
+                # bulk INSERT는 관계 컬렉션을 갱신하지 않으므로 다음 접근 시 다시 로드
+                db.expire(reading, ["cards"])
 
             logger.info(f"[ReadingRepository] {len(cards_data)}개의 ReadingCard 생성 완료")
 
@@ -271,11 +274,69 @@ class ReadingRepository:
         """
         try:
             count = db.query(Reading).filter(Reading.user_id == user_id).count()
-            logger.info(f"[ReadingRepository] 사용자 Reading 개수: user_id={user_id}, count={count}")
+            logger.info(
+                "[ReadingRepository] 사용자 Reading 개수: user_id=%s, count=%d",
+                user_id,
+                count,
+            )
             return count
 
         except Exception as e:
-            logger.error(f"[ReadingRepository] 사용자 Reading 개수 조회 실패: {e}")
+            logger.error("[ReadingRepository] 사용자 Reading 개수 조회 실패: %s", e)
+            raise
+
+    @staticmethod
+    def get_by_user_paginated(
+        db: Session,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 20
+    ) -> Tuple[List[Reading], int]:
+        """
+        특정 사용자의 Reading 목록과 전체 개수를 단일 쿼리로 조회
+
+        COUNT(*) OVER () 윈도우 컬럼으로 페이지네이션 스캔 중에 전체 개수를
+        함께 계산하여 별도의 COUNT 쿼리를 생략합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            user_id: 사용자 UUID
+            skip: 건너뛸 개수
+            limit: 최대 조회 개수
+
+        Returns:
+            Tuple[List[Reading], int]: (Reading 목록, 사용자의 전체 Reading 개수)
+        """
+        try:
+            rows = (
+                db.query(Reading, func.count().over().label("total"))
+                .filter(Reading.user_id == user_id)
+                .order_by(desc(Reading.created_at))
+                .offset(skip)
+                .limit(limit)
+                .all()
+            )
+
+            readings = [row[0] for row in rows]
+            if rows:
+                total = rows[0].total
+            elif skip > 0:
+                # 범위를 벗어난 페이지는 윈도우 값이 없으므로 개수만 별도로 조회
+                total = ReadingRepository.count_by_user(db, user_id)
+            else:
+                total = 0
+
+            logger.info(
+                "[ReadingRepository] 사용자 Reading 페이지 조회: user_id=%s, %d개 / 전체 %d개",
+                user_id,
+                len(readings),
+                total,
+            )
+
+            return readings, total
+
+        except Exception as e:
+            logger.error("[ReadingRepository] 사용자 Reading 페이지 조회 실패: %s", e)
             raise
 
     @staticmethod
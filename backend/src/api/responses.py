@@ -0,0 +1,19 @@
+"""
+API 공통 응답 클래스
+
+orjson 기반 JSON 응답을 제공합니다. 카드 dict와 해석 텍스트가 많이 포함된
+리딩 응답처럼 페이로드가 큰 라우터에서 stdlib json 대신 사용합니다.
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONResponse(JSONResponse):
+    """orjson으로 직렬화하는 JSON 응답 (naive datetime은 UTC로 간주, 'Z' 접미사 사용)"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=_ORJSON_OPTIONS)
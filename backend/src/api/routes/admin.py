@@ -18,6 +18,7 @@ from fastapi import APIRouter, Depends, Query
 
 from src.core.logging import get_logger
 from src.api.dependencies.auth import get_current_admin_user
+from src.api.routes.feedback import get_cached_feedback_statistics
 from src.database.factory import get_database_provider
 from src.database.provider import DatabaseProvider
 
@@ -70,7 +71,7 @@ async def get_dashboard_stats(
         )
         
         # Gather all statistics
-        feedback_stats = await db_provider.get_feedback_statistics()
+        feedback_stats = await get_cached_feedback_statistics(db_provider)
         
         # Get total users count
         total_users = await db_provider.get_total_users_count()
@@ -132,7 +133,7 @@ async def get_global_statistics(
     db_provider: DatabaseProvider = Depends(get_database_provider),
 ):
     logger.info("Admin stats requested by user_id=%s", getattr(current_user, "id", None))
-    stats = await db_provider.get_feedback_statistics()
+    stats = await get_cached_feedback_statistics(db_provider)
     logger.info("Global stats: %s", stats)
     return stats
 
@@ -196,7 +197,7 @@ class CacheInvalidationRequest(BaseModel):
     """캐시 무효화 요청"""
     cache_types: List[str] = Field(
         default=["orchestrator"],
-        description="Cache types to invalidate: orchestrator, rag, cards, all"
+        description="Cache types to invalidate: orchestrator, rag, cards, settings, all"
     )
 
 
@@ -226,6 +227,7 @@ async def invalidate_cache(
             - orchestrator: AI Orchestrator 캐시 (Provider 설정 변경 시)
             - rag: RAG 캐시 (Retriever, ContextEnricher)
             - cards: 카드 데이터 캐시
+            - settings: 앱 설정 캐시 (다른 인스턴스에서 설정을 변경한 경우)
             - all: 모든 캐시
     
     Returns:
@@ -265,6 +267,14 @@ async def invalidate_cache(
             db_provider.invalidate_cards_cache()  # Synchronous method
             invalidated.append("cards")
             logger.info("[Admin] ✓ Cards cache invalidated")
+
+        # 앱 설정 캐시 무효화 (설정 캐시를 사용하는 Provider만 해당)
+        if "settings" in request.cache_types or "all" in request.cache_types:
+            invalidate_settings_cache = getattr(db_provider, "invalidate_settings_cache", None)
+            if invalidate_settings_cache is not None:
+                invalidate_settings_cache()
+                invalidated.append("settings")
+                logger.info("[Admin] ✓ App settings cache invalidated")
         
         return CacheInvalidationResponse(
             success=True,
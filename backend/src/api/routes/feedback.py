@@ -3,12 +3,15 @@
 
 Firestore 및 PostgreSQL 제공자에 호환되도록 DatabaseProvider 추상화를 사용합니다.
 """
+import asyncio
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
 
 from src.core.logging import get_logger
+from src.core.cache import cache
 from src.api.dependencies.auth import get_current_active_user, get_current_superuser
 from src.database.factory import get_database_provider
 from src.database.provider import DatabaseProvider, Feedback as FeedbackDTO
@@ -23,18 +26,47 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/api/v1", tags=["feedback"])
 
 
+# 전체 피드백 통계 캐시 (관리자 통계 조회용, 피드백 생성/수정/삭제 시 무효화)
+FEEDBACK_STATS_CACHE_KEY = "read:feedback_stats"
+FEEDBACK_STATS_CACHE_TTL = 300
+
+# 목록 응답은 리스트 전체를 한 번의 검증 호출로 변환 (FeedbackResponse는 from_attributes)
+_FEEDBACK_LIST_ADAPTER = TypeAdapter(List[FeedbackResponse])
+
+
 def _feedback_to_response(feedback: FeedbackDTO) -> FeedbackResponse:
     """Convert provider Feedback DTO to API response schema"""
-    return FeedbackResponse(
-        id=str(feedback.id),
-        reading_id=str(feedback.reading_id),
-        user_id=str(feedback.user_id),
-        rating=feedback.rating,
-        comment=feedback.comment,
-        helpful=feedback.helpful,
-        accurate=feedback.accurate,
-        created_at=feedback.created_at,
-        updated_at=feedback.updated_at,
+    return FeedbackResponse.model_validate(feedback)
+
+
+async def get_cached_feedback_statistics(db_provider: DatabaseProvider) -> Dict[str, Any]:
+    """전체 피드백 통계 조회 (Redis 캐시 우선, 동기 Redis 호출은 스레드에서 실행)"""
+    stats = await asyncio.to_thread(cache.get, FEEDBACK_STATS_CACHE_KEY)
+    if stats is None:
+        stats = await db_provider.get_feedback_statistics()
+        await asyncio.to_thread(cache.set, FEEDBACK_STATS_CACHE_KEY, stats, FEEDBACK_STATS_CACHE_TTL)
+    return stats
+
+
+async def invalidate_feedback_stats_cache() -> None:
+    """전체 피드백 통계 캐시 무효화 (피드백 변경 후 호출)"""
+    await asyncio.to_thread(cache.delete, FEEDBACK_STATS_CACHE_KEY)
+
+
+async def _raise_feedback_not_found_or_forbidden(
+    db_provider: DatabaseProvider,
+    feedback_id: str,
+    forbidden_detail: str,
+) -> None:
+    """소유자 조건 수정/삭제가 0건일 때만 조회하여 404와 403을 구분"""
+    if await db_provider.get_feedback_by_id(feedback_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Feedback with id {feedback_id} not found",
+        )
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=forbidden_detail,
     )
 
 
@@ -70,22 +102,8 @@ async def create_feedback(
 
     user_id = str(getattr(current_user, "id", None))
 
-    existing_feedback = await db_provider.get_feedback_by_reading_and_user(
-        reading_id=reading_id,
-        user_id=user_id,
-    )
-    if existing_feedback:
-        logger.warning(
-            "Duplicate feedback attempt: reading_id=%s user_id=%s",
-            reading_id,
-            user_id,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="You have already submitted feedback for this reading",
-        )
-
-    feedback = await db_provider.create_feedback(
+    # 중복 여부 확인과 생성을 한 번에 처리 (동시 요청 간 경쟁 조건 방지)
+    feedback = await db_provider.create_feedback_if_absent(
         {
             "reading_id": reading_id,
             "user_id": user_id,
@@ -96,7 +114,18 @@ async def create_feedback(
             "spread_type": reading.spread_type,
         }
     )
+    if feedback is None:
+        logger.warning(
+            "Duplicate feedback attempt: reading_id=%s user_id=%s",
+            reading_id,
+            user_id,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="You have already submitted feedback for this reading",
+        )
 
+    await invalidate_feedback_stats_cache()
     return _feedback_to_response(feedback)
 
 
@@ -121,14 +150,6 @@ async def get_reading_feedback(
         page_size,
     )
 
-    reading = await db_provider.get_reading_by_id(reading_id)
-    if not reading:
-        logger.warning("Reading not found: %s", reading_id)
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Reading with id {reading_id} not found",
-        )
-
     skip = (page - 1) * page_size
     feedback_list = await db_provider.get_feedback_by_reading(
         reading_id=reading_id,
@@ -136,13 +157,21 @@ async def get_reading_feedback(
         limit=page_size,
     )
 
+    # 결과가 비어 있을 때만 리딩 존재 여부를 확인하여 404와 "피드백 없음"을 구분
+    if not feedback_list and not await db_provider.reading_exists(reading_id):
+        logger.warning("Reading not found: %s", reading_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Reading with id {reading_id} not found",
+        )
+
     logger.info(
         "Found %s feedbacks for reading_id=%s",
         len(feedback_list),
         reading_id,
     )
 
-    return [_feedback_to_response(feedback) for feedback in feedback_list]
+    return _FEEDBACK_LIST_ADAPTER.validate_python(feedback_list, from_attributes=True)
 
 
 @router.put(
@@ -165,29 +194,17 @@ async def update_feedback(
         getattr(current_user, "id", None),
     )
 
-    feedback = await db_provider.get_feedback_by_id(feedback_id)
-    if not feedback:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Feedback with id {feedback_id} not found",
-        )
-
-    if str(feedback.user_id) != str(getattr(current_user, "id", None)):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only update your own feedback",
-        )
-
-    updated_feedback = await db_provider.update_feedback(
+    updated_feedback = await db_provider.update_feedback_if_owner(
         feedback_id=feedback_id,
+        user_id=str(getattr(current_user, "id", None)),
         feedback_data=feedback_data.model_dump(exclude_none=True),
     )
     if not updated_feedback:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Feedback with id {feedback_id} not found",
+        await _raise_feedback_not_found_or_forbidden(
+            db_provider, feedback_id, "You can only update your own feedback"
         )
 
+    await invalidate_feedback_stats_cache()
     return _feedback_to_response(updated_feedback)
 
 
@@ -210,24 +227,14 @@ async def delete_feedback(
         getattr(current_user, "id", None),
     )
 
-    feedback = await db_provider.get_feedback_by_id(feedback_id)
-    if not feedback:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Feedback with id {feedback_id} not found",
-        )
-
-    if str(feedback.user_id) != str(getattr(current_user, "id", None)):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only delete your own feedback",
-        )
-
-    deleted = await db_provider.delete_feedback(feedback_id)
+    deleted = await db_provider.delete_feedback_if_owner(
+        feedback_id=feedback_id,
+        user_id=str(getattr(current_user, "id", None)),
+    )
     if not deleted:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Feedback with id {feedback_id} not found",
+        await _raise_feedback_not_found_or_forbidden(
+            db_provider, feedback_id, "You can only delete your own feedback"
         )
 
+    await invalidate_feedback_stats_cache()
     return None
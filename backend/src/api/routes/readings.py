@@ -14,21 +14,28 @@ Reading API Routes - 타로 리딩 API 엔드포인트
 """
 from __future__ import annotations
 
-from typing import Optional, List, Dict, Any
+import asyncio
+import base64
+import binascii
+import threading
+import logging
+import uuid
+import weakref
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timezone
-from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from jinja2 import Environment, FileSystemLoader
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
 from src.core.logging import get_logger
-from src.core.card_shuffle import CardShuffleService, DrawnCard
+from src.core.card_shuffle import CardShuffleService, DrawnCard, Orientation
 from src.core.config import settings
-from src.ai import AIOrchestrator, ProviderFactory, GenerationConfig
-from src.ai.prompt_engine.spread_config import (
-    get_card_count,
-    get_prompt_template_path,
-    get_max_tokens
+from src.core.cache import cache
+from src.ai import AIOrchestrator, ProviderFactory, GenerationConfig, ReadingCache
+from src.ai.prompt_engine.spread_config import MAX_TOKENS_LIMIT, get_spread_meta
+from src.ai.prompt_engine.reading_templates import (
+    SYSTEM_PROMPT,
+    OUTPUT_FORMAT,
+    resolve_reading_template,
 )
 from src.ai.prompt_engine.response_parser import ResponseParser
 from src.ai.prompt_engine.reading_validator import ReadingValidator
@@ -45,6 +52,14 @@ from src.ai.rag.retriever import Retriever
 from src.ai.rag.context_enricher import ContextEnricher
 from src.ai.provider_loader import load_providers_from_settings, get_default_timeout_from_settings
 from src.api.dependencies.auth import get_current_active_user
+from src.api.reading_cache import (
+    READING_COUNT_CACHE_PREFIX,
+    READING_COUNT_CACHE_TTL,
+    READING_RESPONSE_CACHE_PREFIX,
+    READING_RESPONSE_CACHE_TTL,
+    invalidate_reading_count_cache,
+)
+from src.api.responses import ORJSONResponse
 from src.database.factory import get_database_provider
 from src.database.provider import (
     DatabaseProvider,
@@ -52,6 +67,7 @@ from src.database.provider import (
     Card as CardDTO,
 )
 from src.schemas.reading import (
+    LLMUsageResponse,
     ReadingRequest,
     ReadingResponse,
     ReadingCardResponse,
@@ -61,17 +77,55 @@ from src.schemas.card import CardResponse
 
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/api/v1/readings", tags=["readings"])
-
-# Jinja2 환경 설정 (프롬프트 템플릿용)
-PROMPTS_DIR = Path(__file__).parent.parent.parent.parent / "prompts"
-jinja_env = Environment(loader=FileSystemLoader(str(PROMPTS_DIR)))
-
+router = APIRouter(
+    prefix="/api/v1/readings",
+    tags=["readings"],
+    default_response_class=ORJSONResponse,
+)
 
 # AI Orchestrator 초기화 (글로벌, 싱글톤 패턴)
 _orchestrator: Optional[AIOrchestrator] = None
 _retriever: Optional[Retriever] = None
 _context_enricher: Optional[ContextEnricher] = None
+_reading_cache: Optional[ReadingCache] = None
+_orchestrator_lock = asyncio.Lock()
+# RAG 싱글톤은 동기 getter이므로 스레드 락으로 중복 초기화 방지
+_rag_lock = threading.RLock()
+
+
+async def _build_orchestrator(db_provider: DatabaseProvider) -> AIOrchestrator:
+    """DB 설정(없으면 환경 변수)으로 AI Orchestrator 생성"""
+    # Load providers from database settings
+    providers = await load_providers_from_settings(
+        db_provider=db_provider,
+        fallback_to_env=True
+    )
+
+    # Sync model registry with loaded providers
+    try:
+        from src.ai.model_registry import get_registry
+        registry = get_registry()
+        if not registry._initialized:
+            registry.sync_from_providers(providers)
+            logger.info(
+                f"Model registry synced with {len(providers)} provider(s), "
+                f"{len(registry.models)} models registered"
+            )
+    except Exception as e:
+        logger.warning("Failed to sync model registry (non-critical): %s", e)
+
+    # Get timeout from settings
+    timeout = await get_default_timeout_from_settings(db_provider)
+
+    orchestrator = AIOrchestrator(
+        providers=providers,
+        provider_timeout=timeout,
+    )
+    logger.info(
+        f"AIOrchestrator initialized with {len(providers)} provider(s) from DB, "
+        f"timeout={timeout}s"
+    )
+    return orchestrator
 
 
 async def get_orchestrator(db_provider: DatabaseProvider) -> AIOrchestrator:
@@ -80,63 +134,70 @@ async def get_orchestrator(db_provider: DatabaseProvider) -> AIOrchestrator:
     
     데이터베이스에서 AI Provider 설정을 로드합니다.
     DB에 설정이 없으면 환경 변수로 폴백합니다.
+    앱 시작 시(lifespan) 미리 생성되며, 무효화 후 첫 요청에서는 lock으로
+    동시 요청이 Provider 클라이언트를 중복 생성하지 않도록 합니다.
     """
     global _orchestrator
-    
-    if _orchestrator is None:
-        # Load providers from database settings
-        providers = await load_providers_from_settings(
-            db_provider=db_provider,
-            fallback_to_env=True
-        )
-        
-        # Sync model registry with loaded providers
-        try:
-            from src.ai.model_registry import get_registry
-            registry = get_registry()
-            if not registry._initialized:
-                registry.sync_from_providers(providers)
-                logger.info(
-                    f"Model registry synced with {len(providers)} provider(s), "
-                    f"{len(registry.models)} models registered"
-                )
-        except Exception as e:
-            logger.warning(f"Failed to sync model registry (non-critical): {e}")
-        
-        # Get timeout from settings
-        timeout = await get_default_timeout_from_settings(db_provider)
-        
-        _orchestrator = AIOrchestrator(
-            providers=providers,
-            provider_timeout=timeout,
-        )
-        logger.info(
-            f"AIOrchestrator initialized with {len(providers)} provider(s) from DB, "
-            f"timeout={timeout}s"
-        )
 
-    return _orchestrator
+    orchestrator = _orchestrator
+    if orchestrator is not None:
+        return orchestrator
+
+    async with _orchestrator_lock:
+        if _orchestrator is None:
+            _orchestrator = await _build_orchestrator(db_provider)
+        return _orchestrator
 
 
 def get_retriever() -> Retriever:
     """RAG Retriever 싱글톤 인스턴스 반환"""
     global _retriever
-    if _retriever is None:
-        logger.info("Initializing RAG Retriever...")
-        _retriever = Retriever()
-        logger.info("RAG Retriever initialized successfully")
-    return _retriever
+    retriever = _retriever
+    if retriever is not None:
+        return retriever
+
+    with _rag_lock:
+        if _retriever is None:
+            logger.info("Initializing RAG Retriever...")
+            _retriever = Retriever()
+            logger.info("RAG Retriever initialized successfully")
+        return _retriever
 
 
 def get_context_enricher() -> ContextEnricher:
     """RAG Context Enricher 싱글톤 인스턴스 반환"""
     global _context_enricher
-    if _context_enricher is None:
-        logger.info("Initializing RAG Context Enricher...")
-        retriever = get_retriever()
-        _context_enricher = ContextEnricher(retriever)
-        logger.info("RAG Context Enricher initialized successfully")
-    return _context_enricher
+    context_enricher = _context_enricher
+    if context_enricher is not None:
+        return context_enricher
+
+    with _rag_lock:
+        if _context_enricher is None:
+            logger.info("Initializing RAG Context Enricher...")
+            retriever = get_retriever()
+            _context_enricher = ContextEnricher(retriever)
+            logger.info("RAG Context Enricher initialized successfully")
+        return _context_enricher
+
+
+def get_reading_cache() -> Optional[ReadingCache]:
+    """
+    파싱된 리딩 응답 캐시 싱글톤 반환 (AI_CACHE_ENABLED=False이면 None)
+
+    별도 연결을 만들지 않고 앱 공용 Redis 클라이언트를 재사용합니다.
+    공용 클라이언트는 명령마다 재연결하므로 Redis가 잠시 내려가도
+    캐시가 영구히 꺼지지 않고 그동안은 캐시 미스로 동작합니다.
+    """
+    global _reading_cache
+    if not settings.AI_CACHE_ENABLED:
+        return None
+
+    if _reading_cache is None:
+        _reading_cache = ReadingCache(
+            redis_client=cache.redis_client,
+            default_ttl=settings.AI_CACHE_TTL,
+        )
+    return _reading_cache
 
 
 def invalidate_orchestrator_cache() -> None:
@@ -168,27 +229,104 @@ def invalidate_rag_cache() -> None:
         logger.info("[CacheInvalidation] RAG cache is already empty")
 
 
+def _utc_now() -> datetime:
+    """파싱 실패 시 사용하는 현재 시각 (UTC, tz-aware)"""
+    return datetime.now(timezone.utc)
+
+
 def _parse_datetime(value: Optional[Any]) -> Optional[datetime]:
     """입력값을 datetime으로 변환"""
+    # 대부분의 값은 SQL 백엔드가 넘겨주는 datetime 그대로이므로 가장 먼저 확인
+    value_type = type(value)
+    if value_type is datetime:
+        return value
     if value is None:
         return None
+    if value_type is str:
+        # Python 3.11+ fromisoformat은 "Z" 접미사를 직접 처리하므로 문자열 가공 불필요
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return _utc_now()
+    # Firestore DatetimeWithNanoseconds 등 datetime 하위 클래스
     if isinstance(value, datetime):
         return value
-    if hasattr(value, "to_datetime"):
+    try:
         return value.to_datetime()
+    except AttributeError:
+        pass
     try:
-        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        return datetime.fromisoformat(str(value))
     except ValueError:
-        return datetime.utcnow().replace(tzinfo=timezone.utc)
+        return _utc_now()
+
 
+# 카드는 거의 변하지 않는 참조 데이터이므로 변환된 CardResponse를 재사용 (읽기 전용으로 사용)
+# - 프로바이더 CardDTO: DTO 객체 기준 (카드 캐시 무효화로 DTO가 해제되면 함께 제거)
+# - 리딩에 내장된 카드 dict: (id, updated_at) 기준 (카드 수정 시 새 키가 생김)
+_card_response_by_dto: "weakref.WeakKeyDictionary[CardDTO, CardResponse]" = weakref.WeakKeyDictionary()
+_card_response_by_key: Dict[Tuple[Any, Any], CardResponse] = {}
+_CARD_RESPONSE_CACHE_MAX = 512
 
-def _card_dto_to_dict(card: CardDTO) -> Dict[str, Any]:
-    """Card DTO를 직렬화된 딕셔너리로 변환"""
-    return card.to_dict()
+
+def _cached_card_dto_response(card: CardDTO) -> CardResponse:
+    """CardDTO → CardResponse (DTO별 캐시)"""
+    try:
+        return _card_response_by_dto[card]
+    except KeyError:
+        pass
+    except TypeError:
+        # 약한 참조를 지원하지 않는 객체는 캐시 없이 변환
+        return _card_dto_to_response(card)
+    card_response = _card_dto_to_response(card)
+    _card_response_by_dto[card] = card_response
+    return card_response
+
+
+def _cached_card_dict_response(card_dict: Dict[str, Any]) -> CardResponse:
+    """카드 dict → CardResponse ((id, updated_at)별 캐시)"""
+    card_id = card_dict.get("id")
+    if card_id is None:
+        return _card_dict_to_response(card_dict)
+
+    try:
+        key = (card_id, card_dict.get("updated_at"))
+        card_response = _card_response_by_key.get(key)
+    except TypeError:
+        # updated_at이 해시 불가능한 타입이면 캐시 없이 변환
+        return _card_dict_to_response(card_dict)
+    if card_response is None:
+        card_response = _card_dict_to_response(card_dict)
+        if len(_card_response_by_key) >= _CARD_RESPONSE_CACHE_MAX:
+            _card_response_by_key.clear()
+        _card_response_by_key[key] = card_response
+    return card_response
+
+
+def _card_dto_to_response(card: CardDTO) -> CardResponse:
+    """Card DTO를 CardResponse로 직접 변환 (to_dict → 재파싱 왕복 없이 속성 바인딩)"""
+    created_at = card.created_at or datetime.utcnow()
+    return CardResponse.model_construct(
+        id=card.id,
+        name=card.name_en,
+        name_ko=card.name_ko or card.name_en,
+        number=card.number,
+        arcana_type=card.arcana_type,
+        suit=card.suit,
+        keywords_upright=card.keywords_upright or [],
+        keywords_reversed=card.keywords_reversed or [],
+        meaning_upright=card.meaning_upright or "",
+        meaning_reversed=card.meaning_reversed or "",
+        description=card.description,
+        symbolism=card.symbolism,
+        image_url=card.image_url,
+        created_at=created_at,
+        updated_at=card.updated_at or created_at,
+    )
 
 
 def _card_dict_to_response(card_dict: Dict[str, Any]) -> CardResponse:
-    """카드 딕셔너리를 CardResponse로 변환"""
+    """카드 딕셔너리를 CardResponse로 변환 (저장된 카드 데이터이므로 검증 생략)"""
     if not card_dict:
         raise ValueError("Card data is missing")
 
@@ -199,7 +337,7 @@ def _card_dict_to_response(card_dict: Dict[str, Any]) -> CardResponse:
     created_at = _parse_datetime(card_dict.get("created_at")) or datetime.utcnow()
     updated_at = _parse_datetime(card_dict.get("updated_at")) or created_at
 
-    return CardResponse(
+    return CardResponse.model_construct(
         id=card_dict.get("id"),
         name=name,
         name_ko=card_dict.get("name_ko") or card_dict.get("nameKo") or name,
@@ -218,26 +356,27 @@ def _card_dict_to_response(card_dict: Dict[str, Any]) -> CardResponse:
     )
 
 
-async def _hydrate_card_entry(
+def _hydrate_card_entry(
     card_entry: Dict[str, Any],
     reading_id: str,
     index: int,
-    provider: DatabaseProvider,
+    cards_by_id: Dict[int, CardDTO],
 ) -> ReadingCardResponse:
-    """Firestore 카드 엔트리를 API 응답 형태로 변환"""
+    """Firestore 카드 엔트리를 API 응답 형태로 변환 (카드 정보는 미리 일괄 조회한 것을 사용)"""
     card_data = card_entry.get("card")
+    card_response: Optional[CardResponse] = None
 
-    if not card_data and card_entry.get("card_id") is not None:
-        card_dto = await provider.get_card_by_id(int(card_entry["card_id"]))
+    if card_data:
+        card_response = _cached_card_dict_response(card_data)
+    elif card_entry.get("card_id") is not None:
+        card_dto = cards_by_id.get(int(card_entry["card_id"]))
         if card_dto:
-            card_data = _card_dto_to_dict(card_dto)
+            card_response = _cached_card_dto_response(card_dto)
 
-    if not card_data:
+    if card_response is None:
         raise ValueError("Card details are unavailable for reading card entry")
 
-    card_response = _card_dict_to_response(card_data)
-
-    return ReadingCardResponse(
+    return ReadingCardResponse.model_construct(
         id=card_entry.get("id") or f"{reading_id}_card_{index}",
         reading_id=reading_id,
         card_id=card_response.id,
@@ -249,38 +388,77 @@ async def _hydrate_card_entry(
     )
 
 
+def _llm_usage_to_response(log_entry: Dict[str, Any], reading_id: str) -> LLMUsageResponse:
+    """저장된 LLM 사용 로그를 응답 모델로 변환 (model_construct로 검증 생략)"""
+    get = log_entry.get
+    return LLMUsageResponse.model_construct(
+        id=str(get("id", "")),
+        reading_id=str(get("reading_id") or reading_id),
+        provider=get("provider", ""),
+        model=get("model", ""),
+        prompt_tokens=get("prompt_tokens", 0),
+        completion_tokens=get("completion_tokens", 0),
+        total_tokens=get("total_tokens", 0),
+        estimated_cost=float(get("estimated_cost", 0.0)),
+        latency_seconds=float(get("latency_seconds", 0.0)),
+        purpose=get("purpose", "main_reading"),
+        created_at=_parse_datetime(get("created_at")),
+    )
+
+
+async def _fetch_unembedded_cards(
+    readings: List[ReadingDTO],
+    provider: DatabaseProvider,
+) -> Dict[int, CardDTO]:
+    """카드 정보가 내장되지 않은 엔트리의 카드를 한 번의 조회로 가져옴"""
+    card_ids = [
+        int(card_entry["card_id"])
+        for reading in readings
+        for card_entry in (reading.cards or [])
+        if not card_entry.get("card") and card_entry.get("card_id") is not None
+    ]
+    if not card_ids:
+        return {}
+    return await provider.get_cards_by_ids(card_ids)
+
+
 async def _build_reading_response(
     reading: ReadingDTO,
     provider: DatabaseProvider,
 ) -> ReadingResponse:
-    """Reading DTO를 API 응답으로 변환"""
-    from src.schemas.reading import LLMUsageResponse
+    """Reading DTO를 API 응답으로 변환 (내장되지 않은 카드는 한 번에 일괄 조회)"""
+    if not reading.cards:
+        # 카드가 아직 붙지 않은 리딩은 조회할 카드가 없음
+        return _reading_to_response(reading, {})
+    cards_by_id = await _fetch_unembedded_cards([reading], provider)
+    return _reading_to_response(reading, cards_by_id)
 
-    cards: List[ReadingCardResponse] = []
-    for index, card_entry in enumerate(reading.cards or []):
-        cards.append(await _hydrate_card_entry(card_entry, reading.id, index, provider))
+
+def _reading_to_response(
+    reading: ReadingDTO,
+    cards_by_id: Dict[int, CardDTO],
+) -> ReadingResponse:
+    """
+    미리 조회한 카드 맵으로 Reading DTO를 API 응답으로 변환 (DB 조회 없음)
+
+    응답 모델은 모두 서버가 저장한 데이터로 만들기 때문에 model_construct로 검증을 생략합니다.
+    타입 변환이 필요한 값(날짜 등)은 변환 헬퍼에서 미리 맞춥니다.
+    """
+    cards: List[ReadingCardResponse] = [
+        _hydrate_card_entry(card_entry, reading.id, index, cards_by_id)
+        for index, card_entry in enumerate(reading.cards or [])
+    ]
 
     created_at = _parse_datetime(reading.created_at) or datetime.utcnow()
     updated_at = _parse_datetime(reading.updated_at) or created_at
 
-    # Build LLM usage response objects
-    llm_usage_responses = []
-    for log_entry in reading.llm_usage:
-        llm_usage_responses.append(LLMUsageResponse(
-            id=log_entry.get("id", ""),
-            reading_id=log_entry.get("reading_id", reading.id),
-            provider=log_entry.get("provider", ""),
-            model=log_entry.get("model", ""),
-            prompt_tokens=log_entry.get("prompt_tokens", 0),
-            completion_tokens=log_entry.get("completion_tokens", 0),
-            total_tokens=log_entry.get("total_tokens", 0),
-            estimated_cost=log_entry.get("estimated_cost", 0.0),
-            latency_seconds=log_entry.get("latency_seconds", 0.0),
-            purpose=log_entry.get("purpose", "main_reading"),
-            created_at=_parse_datetime(log_entry.get("created_at")),
-        ))
-
-    return ReadingResponse(
+    # 저장된 로그는 서버가 기록한 신뢰 데이터이므로 검증 없이 바로 모델 구성
+    llm_usage_responses = [
+        _llm_usage_to_response(log_entry, reading.id)
+        for log_entry in reading.llm_usage
+    ]
+
+    return ReadingResponse.model_construct(
         id=reading.id,
         user_id=reading.user_id,
         spread_type=reading.spread_type,
@@ -297,30 +475,150 @@ async def _build_reading_response(
     )
 
 
+def _reading_response_from_components(
+    reading_dto: ReadingDTO,
+    reading_data: Dict[str, Any],
+    card_dicts: List[Dict[str, Any]],
+) -> ReadingResponse:
+    """
+    생성 직후 리딩 응답을 메모리에 있는 저장 payload로 구성
+
+    저장 후 다시 읽어온 카드 엔트리를 재해석하지 않고, 저장소가 부여한 값(ID, 시각, 카드 엔트리 ID)만
+    reading_dto에서 가져옵니다.
+    """
+    reading_id = reading_dto.id
+    stored_cards = reading_dto.cards or []
+    cards: List[ReadingCardResponse] = []
+    for index, payload in enumerate(reading_data["cards"]):
+        entry_id = stored_cards[index].get("id") if index < len(stored_cards) else None
+        card_response = _cached_card_dict_response(card_dicts[index])
+        cards.append(
+            ReadingCardResponse.model_construct(
+                id=entry_id or f"{reading_id}_card_{index}",
+                reading_id=reading_id,
+                card_id=card_response.id,
+                position=payload["position"],
+                orientation=payload["orientation"],
+                interpretation=payload["interpretation"],
+                key_message=payload["key_message"],
+                card=card_response,
+            )
+        )
+
+    created_at = _parse_datetime(reading_dto.created_at) or datetime.utcnow()
+    return ReadingResponse.model_construct(
+        id=reading_id,
+        user_id=reading_dto.user_id,
+        spread_type=reading_data["spread_type"],
+        question=reading_data["question"],
+        category=reading_data["category"],
+        cards=cards,
+        card_relationships=reading_data["card_relationships"],
+        overall_reading=reading_data["overall_reading"],
+        advice=reading_data["advice"],
+        summary=reading_data["summary"],
+        llm_usage=[
+            _llm_usage_to_response(log_entry, reading_id)
+            for log_entry in reading_dto.llm_usage
+        ],
+        created_at=created_at,
+        updated_at=_parse_datetime(reading_dto.updated_at) or created_at,
+    )
+
+
+def _encode_reading_cursor(reading: ReadingDTO) -> str:
+    """목록 키셋 커서 생성 (불투명 문자열: base64url("created_at|id"))"""
+    created_at = _parse_datetime(reading.created_at)
+    raw = f"{created_at.isoformat()}|{reading.id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_reading_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    키셋 커서 해석 (형식이 잘못되면 400)
+
+    id 부분도 DB provider가 받을 수 있는 값인지 확인합니다. PostgreSQL은 UUID,
+    Firestore는 비어 있거나 '/'가 들어간 문서 ID를 거부하므로, 검증하지 않으면
+    조작된 커서가 목록 조회에서 500으로 이어집니다.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at_str, reading_id = raw.split("|", 1)
+        created_at = datetime.fromisoformat(created_at_str)
+        if not reading_id or "/" in reading_id or reading_id in (".", ".."):
+            raise ValueError(f"invalid reading id in cursor: {reading_id!r}")
+        if settings.DATABASE_PROVIDER.lower() == "postgresql":
+            uuid.UUID(reading_id)
+        return created_at, reading_id
+    except (ValueError, UnicodeError, binascii.Error):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다")
+
+
 def _build_cards_payload(
     drawn_cards: List[DrawnCard],
     parsed_cards: List[Any],
+    card_dicts: List[Dict[str, Any]],
 ) -> List[Dict[str, Any]]:
-    """Firestore 저장을 위한 카드 payload 생성"""
-    payload: List[Dict[str, Any]] = []
-    for index, card_interp in enumerate(parsed_cards):
-        drawn_card = drawn_cards[index]
-        payload.append(
-            {
-                "card_id": drawn_card.card.id,
-                "position": card_interp.position,
-                "orientation": drawn_card.orientation.value,
-                "interpretation": card_interp.interpretation,
-                "key_message": card_interp.key_message,
-                "card": drawn_card.card.to_dict(),
-            }
-        )
-    return payload
+    """Firestore 저장을 위한 카드 payload 생성 (card_dicts: drawn_cards 순서의 카드 dict)"""
+    return [
+        {
+            "card_id": drawn_card.card.id,
+            "position": card_interp.position,
+            "orientation": drawn_card.orientation.value,
+            "interpretation": card_interp.interpretation,
+            "key_message": card_interp.key_message,
+            "card": card_dict,
+        }
+        for drawn_card, card_interp, card_dict in zip(drawn_cards, parsed_cards, card_dicts)
+    ]
+
+
+def _append_llm_logs(
+    llm_logs_batch: List[Dict[str, Any]],
+    orchestrator_response: Any,
+) -> Tuple[int, float, float]:
+    """
+    Orchestrator 응답의 provider 시도들을 LLM 로그 배치에 추가
+
+    파싱 성공 여부는 아직 알 수 없으므로 모두 parse_retry로 기록하고,
+    최종 응답으로 확정되면 _mark_final_llm_logs에서 purpose를 갱신합니다.
+
+    Returns:
+        (추가된 로그의 시작 인덱스, 비용 합계, 지연 시간 합계(초))
+    """
+    start = len(llm_logs_batch)
+    cost = 0.0
+    latency = 0.0
+    for attempt in orchestrator_response.all_attempts:
+        attempt_cost = attempt.estimated_cost or 0.0
+        attempt_latency = (attempt.latency_ms or 0) / 1000.0
+        cost += attempt_cost
+        latency += attempt_latency
+        llm_logs_batch.append({
+            "provider": attempt.provider,
+            "model": attempt.model,
+            "prompt_tokens": attempt.prompt_tokens or 0,
+            "completion_tokens": attempt.completion_tokens or 0,
+            "total_tokens": attempt.total_tokens or 0,
+            "estimated_cost": attempt_cost,
+            "latency_seconds": attempt_latency,
+            "purpose": "parse_retry",
+        })
+    return start, cost, latency
+
+
+def _mark_final_llm_logs(final_logs: List[Dict[str, Any]]) -> None:
+    """최종 파싱 시도의 로그: 마지막 provider 호출은 main_reading, 그 전은 retry"""
+    for entry in final_logs:
+        entry["purpose"] = "retry"
+    if final_logs:
+        final_logs[-1]["purpose"] = "main_reading"
 
 
 @router.post("", response_model=ReadingResponse, status_code=201)
 async def create_reading(
     request: ReadingRequest,
+    response: Response,
     current_user=Depends(get_current_active_user),
     db_provider: DatabaseProvider = Depends(get_database_provider),
 ):
@@ -334,11 +632,16 @@ async def create_reading(
     )
 
     try:
-        # Import card shuffle components (needed for both user selection and random modes)
-        from src.core.card_shuffle import DrawnCard, Orientation, CardData, CardShuffleService
-        
-        # 스프레드 설정에서 카드 수 가져오기
-        card_count = get_card_count(request.spread_type)
+        # 스프레드별 상수 (카드 수, 최대 토큰 수)는 캐시된 SpreadMeta에서 조회
+        spread_meta = get_spread_meta(request.spread_type)
+        card_count = spread_meta.card_count
+
+        # Orchestrator 준비(콜드 스타트 시 DB 설정 로드)는 카드 선택/RAG와 독립적이므로 먼저 시작
+        orchestrator_task = asyncio.ensure_future(get_orchestrator(db_provider))
+        # 카드 선택 단계에서 실패해 await되지 않는 경우에도 예외가 회수되도록 함
+        orchestrator_task.add_done_callback(
+            lambda task: task.cancelled() or task.exception()
+        )
 
         # Two modes: User Selection vs Random
         if request.selected_card_ids:
@@ -363,28 +666,17 @@ async def create_reading(
                         f"selected_card_ids 길이({len(request.selected_card_ids)})와 일치하지 않습니다."
                     )
             
+            # 선택된 카드를 한 번의 쿼리로 조회
+            cards_by_id = await db_provider.get_cards_by_ids(request.selected_card_ids)
+
             drawn_cards = []
             for idx, card_id in enumerate(request.selected_card_ids):
-                card_dto = await db_provider.get_card_by_id(card_id)
+                card_dto = cards_by_id.get(card_id)
                 if not card_dto:
                     raise ValueError(f"카드 ID {card_id}를 찾을 수 없습니다.")
                 
-                # Convert to CardData
-                card_data = CardData(
-                    id=card_dto.id,
-                    name=card_dto.name_en,
-                    name_ko=card_dto.name_ko,
-                    arcana_type=card_dto.arcana_type,
-                    number=card_dto.number,
-                    suit=card_dto.suit,
-                    keywords_upright=card_dto.keywords_upright,
-                    keywords_reversed=card_dto.keywords_reversed,
-                    meaning_upright=card_dto.meaning_upright,
-                    meaning_reversed=card_dto.meaning_reversed,
-                    description=card_dto.description,
-                    symbolism=card_dto.symbolism,
-                    image_url=card_dto.image_url,
-                )
+                # Convert to CardData (cached per card DTO)
+                card_data = CardShuffleService._convert_provider_card(card_dto)
                 
                 # Use provided reversed_states if available, otherwise randomly determine (30% chance for reversed)
                 if request.reversed_states is not None and idx < len(request.reversed_states):
@@ -394,10 +686,11 @@ async def create_reading(
                 
                 drawn_cards.append(DrawnCard(card_data, orientation))
             
-            logger.info(
-                "[CreateReading] 사용자 선택 카드: %s",
-                [f"{dc.card.name}({dc.orientation.value})" for dc in drawn_cards],
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "[CreateReading] 사용자 선택 카드: %s",
+                    [f"{dc.card.name}({dc.orientation.value})" for dc in drawn_cards],
+                )
         else:
             # Random Mode: Draw random cards
             logger.info("[CreateReading] Random Mode: drawing %d cards", card_count)
@@ -406,88 +699,47 @@ async def create_reading(
                 count=card_count,
                 provider=db_provider,
             )
-            logger.info(
-                "[CreateReading] 랜덤 카드 선택 완료: %s",
-                [f"{dc.card.name}({dc.orientation.value})" for dc in drawn_cards],
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "[CreateReading] 랜덤 카드 선택 완료: %s",
+                    [f"{dc.card.name}({dc.orientation.value})" for dc in drawn_cards],
+                )
 
         # RAG context enrichment
         context_enricher = get_context_enricher()
-        card_data = [
-            {"id": dc.card.id, "is_reversed": dc.orientation.value == "reversed"}
-            for dc in drawn_cards
-        ]
-        rag_context = await context_enricher.enrich_prompt_context_async(
-            cards=card_data,
-            spread_type=request.spread_type,
-            question=request.question,
-            category=request.category or "general",
-            language="ko",
+        # RAG 입력과 프롬프트용 카드 컨텍스트를 한 번의 순회로 구성
+        card_data: List[Dict[str, Any]] = []
+        cards_context: List[Dict[str, Any]] = []
+        for dc in drawn_cards:
+            card_data.append({"id": dc.card.id, "is_reversed": dc.orientation.value == "reversed"})
+            cards_context.append(ContextBuilder.build_card_context(dc))
+        # RAG 검색은 이미 시작한 Orchestrator 준비와 겹쳐서 수행
+        rag_context, orchestrator = await asyncio.gather(
+            context_enricher.enrich_prompt_context_async(
+                cards=card_data,
+                spread_type=request.spread_type,
+                question=request.question,
+                category=request.category or "general",
+                language="ko",
+            ),
+            orchestrator_task,
         )
         logger.info("[CreateReading] RAG 컨텍스트 강화 완료")
 
-        cards_context = [ContextBuilder.build_card_context(dc) for dc in drawn_cards]
-
-        # Build prompts using Jinja2 templates
+        # Build prompts using pre-compiled Jinja2 templates
         # Select template based on prompt language setting
         prompt_lang = settings.PROMPT_LANGUAGE
-        lang_suffix = f"_{prompt_lang}" if prompt_lang == "en" else ""
-
-        # 스프레드 설정에서 템플릿 경로 가져오기
-        template_path = get_prompt_template_path(
-            spread_type=request.spread_type,
-            template_key="main",
-            language=prompt_lang
-        )
-        
-        if not template_path:
-            # Fallback to default naming convention
-            template_path = f"reading/{request.spread_type}{lang_suffix}.txt"
+        template_path, reading_template = resolve_reading_template(request.spread_type, prompt_lang)
+        if reading_template is None:
+            logger.error("[CreateReading] Failed to load template %s", template_path)
+            raise HTTPException(
+                status_code=500,
+                detail=f"템플릿 파일을 로드할 수 없습니다: {template_path}",
+            )
 
-        logger.info(f"[CreateReading] Using prompt template: {template_path} (language: {prompt_lang})")
+        logger.info("[CreateReading] Using prompt template: %s (language: %s)", template_path, prompt_lang)
 
-        system_template = jinja_env.get_template("system/tarot_expert.txt")
-        system_prompt = system_template.render()
-
-        # Try to load template with language suffix, fallback to default (Korean) if not found
-        try:
-            reading_template = jinja_env.get_template(template_path)
-            logger.debug(f"[CreateReading] Template loaded successfully: {template_path}")
-        except Exception as e:
-            # If language-specific template doesn't exist, fallback to default (Korean) version
-            if lang_suffix:
-                logger.warning(
-                    f"[CreateReading] Template {template_path} not found (error: {e}), "
-                    f"falling back to default (Korean) version"
-                )
-                # Remove language suffix to use default template
-                base_template_path = get_prompt_template_path(
-                    spread_type=request.spread_type,
-                    template_key="main",
-                    language="ko"  # Default Korean
-                )
-                if not base_template_path:
-                    base_template_path = f"reading/{request.spread_type}.txt"
-                
-                try:
-                    reading_template = jinja_env.get_template(base_template_path)
-                    logger.info(f"[CreateReading] Using fallback template: {base_template_path}")
-                except Exception as fallback_error:
-                    logger.error(
-                        f"[CreateReading] Failed to load both primary ({template_path}) and "
-                        f"fallback ({base_template_path}) templates: {fallback_error}"
-                    )
-                    raise HTTPException(
-                        status_code=500,
-                        detail=f"템플릿 파일을 로드할 수 없습니다: {base_template_path}",
-                    )
-            else:
-                # If already using default template, re-raise the error
-                logger.error(f"[CreateReading] Failed to load template {template_path}: {e}")
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"템플릿 파일을 로드할 수 없습니다: {template_path}",
-                )
+        system_prompt = SYSTEM_PROMPT
 
         if request.spread_type == "one_card":
             prompt_context = {
@@ -507,126 +759,202 @@ async def create_reading(
             }
 
         reading_prompt = reading_template.render(**prompt_context)
-        output_template = jinja_env.get_template("output/structured_response.txt")
-        output_format = output_template.render()
-
-        full_prompt = f"{reading_prompt}\n\n{output_format}"
+        full_prompt = f"{reading_prompt}\n\n{OUTPUT_FORMAT}"
 
-        orchestrator = await get_orchestrator(db_provider)
-        # 스프레드 설정에서 최대 토큰 수 가져오기
-        max_tokens = get_max_tokens(request.spread_type, prompt_lang)
-        # Ensure max_tokens doesn't exceed API limit
-        max_tokens = min(max_tokens, 4096)
+        # 스프레드 설정의 최대 토큰 수 (API 제한 적용됨)
+        max_tokens = spread_meta.max_tokens
 
         # Retry logic for parsing failures
         MAX_PARSE_RETRIES = 2  # 최대 2번 재시도 (총 3번 시도)
         parsed_response = None
         last_parse_error = None
-        all_orchestrator_responses = []  # 모든 시도의 응답 저장 (LLM 로그용)
-
-        for parse_attempt in range(MAX_PARSE_RETRIES + 1):
-            try:
-                # Generate response (재시도 시에는 새로운 응답 생성)
-                if parse_attempt > 0:
-                    logger.warning(
-                        "[CreateReading] 파싱 재시도 %d/%d: 이전 오류=%s",
-                        parse_attempt,
-                        MAX_PARSE_RETRIES,
-                        str(last_parse_error)[:100]
-                    )
-                    # 재시도 시 max_tokens를 증가시켜 응답이 잘리지 않도록 함 (API 제한 고려)
-                    previous_max_tokens = max_tokens
-                    max_tokens = min(int(max_tokens * 1.3), 4096)  # Cap at API limit
-                    logger.info(
-                        "[CreateReading] max_tokens 증가: %d → %d (API 제한: 4096)",
-                        previous_max_tokens,
-                        max_tokens
-                    )
-
-                orchestrator_response = await orchestrator.generate(
-                    prompt=full_prompt,
-                    system_prompt=system_prompt,
-                    config=GenerationConfig(
-                        max_tokens=max_tokens,
-                        temperature=0.7,
-                    ),
-                )
-
-                # 모든 시도 저장 (LLM 로그용)
-                all_orchestrator_responses.append(orchestrator_response)
-
-                # Extract successful response
-                ai_response = orchestrator_response.response
-                raw_response = ai_response.content
-
-                # Check if response was truncated due to max_tokens limit
-                if ai_response.finish_reason == "max_tokens" or ai_response.finish_reason == "length":
-                    logger.warning(
-                        "[CreateReading] 응답이 max_tokens 제한으로 잘렸을 수 있습니다. "
-                        "finish_reason=%s, tokens=%d/%d, attempt=%d",
-                        ai_response.finish_reason,
-                        ai_response.completion_tokens,
-                        max_tokens,
-                        parse_attempt + 1
-                    )
-
-                # Try to parse the response
-                parsed_response = ResponseParser.parse(raw_response)
+        last_truncated = False
+        # 모든 시도의 LLM 로그를 응답이 도착하는 즉시 기록 (응답 객체는 보관하지 않음)
+        llm_logs_batch: List[Dict[str, Any]] = []
+        final_logs_start = 0
+        orchestrator_calls = 0
+        total_llm_cost = 0.0
+        total_latency = 0.0
+
+        # 동일한 프롬프트/모델 조합은 파싱·검증이 끝난 응답을 캐시에서 재사용
+        # 동기 Redis 클라이언트이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        reading_cache = get_reading_cache()
+        primary_provider = orchestrator.primary_provider
+        cache_model = f"{primary_provider.provider_name}/{primary_provider.default_model}"
+        if reading_cache is not None:
+            parsed_response = await asyncio.to_thread(
+                reading_cache.get,
+                prompt=full_prompt,
+                system_prompt=system_prompt,
+                model=cache_model,
+            )
+        cache_hit = parsed_response is not None
+        response.headers["X-Cache"] = "hit" if cache_hit else "miss"
+
+        def _generate(tokens: int):
+            return orchestrator.generate(
+                prompt=full_prompt,
+                system_prompt=system_prompt,
+                config=GenerationConfig(
+                    max_tokens=tokens,
+                    temperature=0.7,
+                ),
+            )
 
-                # Parsing succeeded!
-                if parse_attempt > 0:
-                    logger.info(
-                        "[CreateReading] 파싱 성공! (재시도 %d회 후)",
-                        parse_attempt
-                    )
-                break  # Exit retry loop on success
+        # 잘린 응답에 대해 미리 시작한 다음 시도 (파싱 성공 또는 루프 이탈 시 취소)
+        speculative_task: Optional[asyncio.Task] = None
 
-            except (ParseError, JSONExtractionError, ValidationError) as e:
-                last_parse_error = e
+        try:
+            for parse_attempt in range(0 if cache_hit else MAX_PARSE_RETRIES + 1):
+                try:
+                    # Generate response (재시도 시에는 새로운 응답 생성)
+                    if parse_attempt > 0:
+                        logger.warning(
+                            "[CreateReading] 파싱 재시도 %d/%d: 이전 오류=%s",
+                            parse_attempt,
+                            MAX_PARSE_RETRIES,
+                            str(last_parse_error)[:100]
+                        )
+                        # 이전 응답이 잘린 경우에만 max_tokens를 증가시킴 (API 제한 고려)
+                        if last_truncated:
+                            previous_max_tokens = max_tokens
+                            max_tokens = min(int(max_tokens * 1.3), MAX_TOKENS_LIMIT)  # Cap at API limit
+                            logger.info(
+                                "[CreateReading] max_tokens 증가: %d → %d (API 제한: 4096)",
+                                previous_max_tokens,
+                                max_tokens
+                            )
+
+                    if speculative_task is not None:
+                        orchestrator_response = await speculative_task
+                        speculative_task = None
+                    else:
+                        orchestrator_response = await _generate(max_tokens)
+
+                    # 모든 시도 기록 (LLM 로그용)
+                    final_logs_start, cost, latency = _append_llm_logs(llm_logs_batch, orchestrator_response)
+                    total_llm_cost += cost
+                    total_latency += latency
+                    orchestrator_calls += 1
+
+                    # Extract successful response
+                    ai_response = orchestrator_response.response
+                    raw_response = ai_response.content
+
+                    # Check if response was truncated due to max_tokens limit
+                    last_truncated = ai_response.finish_reason in ("max_tokens", "length")
+                    if last_truncated:
+                        logger.warning(
+                            "[CreateReading] 응답이 max_tokens 제한으로 잘렸을 수 있습니다. "
+                            "finish_reason=%s, tokens=%d/%d, attempt=%d",
+                            ai_response.finish_reason,
+                            ai_response.completion_tokens,
+                            max_tokens,
+                            parse_attempt + 1
+                        )
+                        # 잘린 응답은 파싱 실패 가능성이 높으므로 파싱과 겹쳐서 다음 시도를 미리 시작
+                        if parse_attempt < MAX_PARSE_RETRIES:
+                            speculative_task = asyncio.create_task(
+                                _generate(min(int(max_tokens * 1.3), MAX_TOKENS_LIMIT))
+                            )
+                            # 취소되지 않고 버려진 경우에도 예외가 회수되도록 함
+                            speculative_task.add_done_callback(
+                                lambda task: task.cancelled() or task.exception()
+                            )
+
+                    # Try to parse the response
+                    if speculative_task is not None:
+                        # 파싱을 스레드로 넘겨 이벤트 루프가 선행 재시도 요청을 먼저 보내도록 함
+                        parsed_response = await asyncio.to_thread(ResponseParser.parse, raw_response)
+                    else:
+                        parsed_response = ResponseParser.parse(raw_response)
+
+                    # Parsing succeeded!
+                    if parse_attempt > 0:
+                        logger.info(
+                            "[CreateReading] 파싱 성공! (재시도 %d회 후)",
+                            parse_attempt
+                        )
+                    final_logs = llm_logs_batch[final_logs_start:]
+                    if speculative_task is not None:
+                        if (
+                            speculative_task.done()
+                            and not speculative_task.cancelled()
+                            and speculative_task.exception() is None
+                        ):
+                            # 이미 완료(과금)된 선행 호출은 사용하지 않더라도 최종 시도 앞에 로그로 남김
+                            del llm_logs_batch[final_logs_start:]
+                            _, cost, latency = _append_llm_logs(llm_logs_batch, speculative_task.result())
+                            total_llm_cost += cost
+                            total_latency += latency
+                            llm_logs_batch.extend(final_logs)
+                            orchestrator_calls += 1
+                        speculative_task.cancel()
+                        speculative_task = None
+                    _mark_final_llm_logs(final_logs)
+                    break  # Exit retry loop on success
+
+                except (ParseError, JSONExtractionError, ValidationError) as e:
+                    last_parse_error = e
                 
-                # Enhanced error logging with context
-                error_type = type(e).__name__
-                error_summary = str(e)[:300]  # Truncate for logging
+                    # Enhanced error logging with context
+                    error_type = type(e).__name__
+                    error_summary = str(e)[:300]  # Truncate for logging
                 
-                # Check if response was truncated
-                was_truncated = (
-                    ai_response.finish_reason in ("max_tokens", "length") 
-                    if 'ai_response' in locals() else False
-                )
+                    # Check if response was truncated
+                    was_truncated = (
+                        ai_response.finish_reason in ("max_tokens", "length") 
+                        if 'ai_response' in locals() else False
+                    )
                 
-                logger.warning(
-                    "[CreateReading] 파싱 실패 (시도 %d/%d): %s - %s%s",
-                    parse_attempt + 1,
-                    MAX_PARSE_RETRIES + 1,
-                    error_type,
-                    error_summary,
-                    " (응답이 잘림)" if was_truncated else ""
-                )
-
-                # 마지막 시도였다면 예외를 다시 던짐
-                if parse_attempt >= MAX_PARSE_RETRIES:
-                    logger.error(
-                        "[CreateReading] 모든 파싱 재시도 실패 (%d회 시도). "
-                        "마지막 오류: %s - %s",
+                    logger.warning(
+                        "[CreateReading] 파싱 실패 (시도 %d/%d): %s - %s%s",
                         parse_attempt + 1,
+                        MAX_PARSE_RETRIES + 1,
                         error_type,
-                        error_summary
+                        error_summary,
+                        " (응답이 잘림)" if was_truncated else ""
                     )
-                    raise
 
-                # 아직 재시도 가능하면 계속 진행
-                continue
+                    # 마지막 시도였다면 예외를 다시 던짐
+                    if parse_attempt >= MAX_PARSE_RETRIES:
+                        logger.error(
+                            "[CreateReading] 모든 파싱 재시도 실패 (%d회 시도). "
+                            "마지막 오류: %s - %s",
+                            parse_attempt + 1,
+                            error_type,
+                            error_summary
+                        )
+                        raise
+
+                    # 아직 재시도 가능하면 계속 진행
+                    continue
+        finally:
+            # 요청 취소나 예상치 못한 예외로 루프를 벗어나면 아무도 기다리지 않는 선행 호출을 취소
+            if speculative_task is not None:
+                speculative_task.cancel()
 
         # 파싱이 성공하지 못했다면 (이론적으로 도달 불가능)
         if parsed_response is None:
             raise ParseError("파싱 재시도 후에도 응답을 처리할 수 없습니다")
 
-        ReadingValidator.validate_reading_quality(
-            reading=parsed_response,
-            expected_card_count=card_count,
-            spread_type=request.spread_type,
-        )
+        if not cache_hit:
+            ReadingValidator.validate_reading_quality(
+                reading=parsed_response,
+                expected_card_count=card_count,
+                spread_type=request.spread_type,
+            )
+            if reading_cache is not None:
+                await asyncio.to_thread(
+                    reading_cache.set,
+                    parsed_response,
+                    prompt=full_prompt,
+                    system_prompt=system_prompt,
+                    model=cache_model,
+                )
 
+        # 카드 dict는 한 번만 만들어 저장 payload와 응답 구성에 함께 사용
+        card_dicts = [dc.card.to_dict() for dc in drawn_cards]
         reading_data = {
             "spread_type": request.spread_type,
             "question": request.question,
@@ -636,69 +964,37 @@ async def create_reading(
             "advice": parsed_response.advice.model_dump(),
             "summary": parsed_response.summary,
             "user_id": getattr(current_user, "id", None),
-            "cards": _build_cards_payload(drawn_cards, parsed_response.cards),
+            "cards": _build_cards_payload(drawn_cards, parsed_response.cards, card_dicts),
         }
 
         reading_dto = await db_provider.create_reading(reading_data)
+        await invalidate_reading_count_cache(reading_data["user_id"])
 
-        # Phase 3 Optimization: Build LLM usage logs for batch creation
-        llm_logs_batch = []
-        total_llm_attempts = 0
-        total_llm_cost = 0.0
-
-        for orch_resp_idx, orch_resp in enumerate(all_orchestrator_responses):
-            # 각 파싱 시도마다 orchestrator가 여러 provider를 시도할 수 있음
-            for attempt_idx, attempt in enumerate(orch_resp.all_attempts):
-                # purpose 결정
-                if orch_resp_idx == len(all_orchestrator_responses) - 1:
-                    # 마지막 파싱 시도
-                    if attempt_idx == len(orch_resp.all_attempts) - 1:
-                        purpose = "main_reading"  # 최종 성공
-                    else:
-                        purpose = "retry"  # 같은 파싱 시도 내 재시도
-                else:
-                    # 이전 파싱 시도들
-                    purpose = "parse_retry"  # 파싱 실패 후 재시도
-
-                llm_logs_batch.append({
-                    "provider": attempt.provider,
-                    "model": attempt.model,
-                    "prompt_tokens": attempt.prompt_tokens or 0,
-                    "completion_tokens": attempt.completion_tokens or 0,
-                    "total_tokens": attempt.total_tokens or 0,
-                    "estimated_cost": attempt.estimated_cost or 0.0,
-                    "latency_seconds": (attempt.latency_ms or 0) / 1000.0,
-                    "purpose": purpose,
-                })
-
-                total_llm_attempts += 1
-                total_llm_cost += attempt.estimated_cost or 0.0
-        
         # Phase 3: Create all LLM logs in one batch operation
+        # 비용/지연 합계는 로그를 쌓을 때 함께 누적됨
+        total_llm_attempts = len(llm_logs_batch)
+        avg_latency = total_latency / total_llm_attempts if llm_logs_batch else 0.0
         if llm_logs_batch:
             await db_provider.create_llm_usage_logs_batch(
                 reading_dto.id,
                 llm_logs_batch
             )
-            
-            # Log latency statistics
-            total_latency = sum(log['latency_seconds'] for log in llm_logs_batch)
-            avg_latency = total_latency / len(llm_logs_batch) if llm_logs_batch else 0
             logger.info(
                 "[CreateReading] LLM 로그 저장 완료: %d개, 평균 응답시간: %.2fs",
                 len(llm_logs_batch),
                 avg_latency
             )
 
-        reading_response = await _build_reading_response(reading_dto, db_provider)
+        reading_response = _reading_response_from_components(reading_dto, reading_data, card_dicts)
 
         logger.info(
-            "[CreateReading] 리딩 생성 성공: %s (LLM attempts: %d, Parsing retries: %d, Total cost: $%.4f, Avg latency: %.2fs)",
+            "[CreateReading] 리딩 생성 성공: %s (cache: %s, LLM attempts: %d, Parsing retries: %d, Total cost: $%.4f, Avg latency: %.2fs)",
             reading_response.id,
+            "hit" if cache_hit else "miss",
             total_llm_attempts,
-            len(all_orchestrator_responses) - 1,  # 첫 시도는 제외
+            max(orchestrator_calls - 1, 0),  # 첫 시도는 제외
             total_llm_cost,
-            avg_latency if llm_logs_batch else 0
+            avg_latency
         )
         return reading_response
 
@@ -751,13 +1047,28 @@ async def create_reading(
         logger.exception("[CreateReading] 리딩 생성 실패: %s", e)
         # Log the actual error type for debugging
         error_type = type(e).__name__
-        logger.error(f"[CreateReading] 예상치 못한 오류 타입: {error_type}")
+        logger.error("[CreateReading] 예상치 못한 오류 타입: %s", error_type)
         raise HTTPException(
             status_code=500,
             detail="리딩 생성 중 예상치 못한 오류가 발생했습니다. 잠시 후 다시 시도해주세요.",
         )
 
 
+def _check_reading_owner(owner_id: Optional[str], requester_id: Optional[str]) -> None:
+    """리딩 소유자가 아니면 403"""
+    if owner_id and requester_id:
+        if owner_id != requester_id:
+            logger.warning(
+                "[GetReading] 권한 없음: requester=%s owner=%s",
+                requester_id,
+                owner_id,
+            )
+            raise HTTPException(
+                status_code=403,
+                detail="이 리딩에 접근할 권한이 없습니다",
+            )
+
+
 @router.get("/{reading_id}", response_model=ReadingResponse)
 async def get_reading(
     reading_id: str,
@@ -766,26 +1077,41 @@ async def get_reading(
 ):
     """
     리딩 상세 조회 (인증 필요)
+
+    리딩은 생성 후 변경되지 않으므로 직렬화된 응답을 Redis에 짧게 캐시합니다.
     """
+    # 요청자 ID 문자열은 요청당 한 번만 만들어 권한 검사에 사용
+    requester_id = str(current_user.id) if getattr(current_user, "id", None) else None
+
     try:
+        cache_key = f"{READING_RESPONSE_CACHE_PREFIX}{reading_id}"
+        # 동기 Redis 클라이언트이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        cached_payload = await asyncio.to_thread(cache.get, cache_key)
+        if cached_payload is not None:
+            # 캐시에는 model_dump(mode="json") 결과가 저장되어 있으므로
+            # 재검증 없이 orjson으로 바로 직렬화
+            _check_reading_owner(cached_payload.get("user_id"), requester_id)
+            return ORJSONResponse(
+                cached_payload,
+                headers={"Cache-Control": "private, max-age=60", "X-Cache": "hit"},
+            )
+
         reading = await db_provider.get_reading_by_id(reading_id)
         if not reading:
             logger.warning("[GetReading] 리딩을 찾을 수 없음: %s", reading_id)
             raise HTTPException(status_code=404, detail="리딩을 찾을 수 없습니다")
 
-        if reading.user_id and getattr(current_user, "id", None):
-            if reading.user_id != str(current_user.id):
-                logger.warning(
-                    "[GetReading] 권한 없음: requester=%s owner=%s",
-                    current_user.id,
-                    reading.user_id,
-                )
-                raise HTTPException(
-                    status_code=403,
-                    detail="이 리딩에 접근할 권한이 없습니다",
-                )
+        _check_reading_owner(reading.user_id, requester_id)
 
-        return await _build_reading_response(reading, db_provider)
+        reading_response = await _build_reading_response(reading, db_provider)
+        # 캐시에 저장할 JSON 호환 dict를 그대로 응답 본문으로 사용
+        # (response_model 재검증과 jsonable_encoder 순회를 건너뜀)
+        payload = reading_response.model_dump(mode="json")
+        await asyncio.to_thread(cache.set, cache_key, payload, READING_RESPONSE_CACHE_TTL)
+        return ORJSONResponse(
+            payload,
+            headers={"Cache-Control": "private, max-age=60", "X-Cache": "miss"},
+        )
 
     except HTTPException:
         raise
@@ -802,38 +1128,96 @@ async def list_readings(
     page: int = Query(1, ge=1, description="페이지 번호"),
     page_size: int = Query(20, ge=1, le=100, description="페이지당 항목 수"),
     spread_type: Optional[str] = Query(None, description="스프레드 타입 필터"),
+    cursor: Optional[str] = Query(
+        None,
+        description="이전 응답의 next_cursor (지정 시 page 대신 키셋 페이지네이션 사용)",
+    ),
+    # 기본값은 True: total은 클라이언트가 include_total=false로 COUNT를 생략할 때만 null
+    include_total: bool = Query(
+        True,
+        description="전체 개수 포함 여부 (false면 COUNT를 생략하고 total=null, has_more로 다음 페이지 판단)",
+    ),
     current_user=Depends(get_current_active_user),
     db_provider: DatabaseProvider = Depends(get_database_provider),
 ):
     """
     리딩 목록 조회 (인증 필요)
+
+    cursor를 지정하면 (created_at, id) 키셋 페이지네이션으로 앞 페이지 행을 스캔하지 않고
+    다음 페이지를 조회합니다. 응답의 next_cursor를 그대로 다음 요청에 전달하면 됩니다.
     """
     try:
         skip = (page - 1) * page_size
+        # 다음 페이지 존재 여부는 한 건을 더 조회해 판단 (별도 COUNT 불필요)
+        fetch_limit = page_size + 1
+
+        user_id = str(current_user.id)
+
+        # 전체 개수가 캐시되어 있으면 목록만 조회하고, 없으면 목록+개수를 함께 조회해 캐시
+        count_cache_key = f"{READING_COUNT_CACHE_PREFIX}{user_id}"
+        count_field = spread_type or "*"
+        cached_counts: Dict[str, int] = {}
+        total: Optional[int] = None
+        if include_total:
+            cached_counts = await asyncio.to_thread(cache.get, count_cache_key) or {}
+            total = cached_counts.get(count_field)
+
+        if cursor is not None:
+            after_created_at, after_id = _decode_reading_cursor(cursor)
+            readings = await db_provider.get_readings_by_user_after(
+                user_id=user_id,
+                after_created_at=after_created_at,
+                after_id=after_id,
+                limit=fetch_limit,
+                spread_type=spread_type,
+            )
+            if include_total and total is None:
+                total = await db_provider.get_total_readings_count(
+                    user_id=user_id,
+                    spread_type=spread_type,
+                )
+                cached_counts[count_field] = total
+                await asyncio.to_thread(cache.set, count_cache_key, cached_counts, READING_COUNT_CACHE_TTL)
+        elif include_total and total is None:
+            readings, total = await db_provider.get_readings_by_user_paginated(
+                user_id=user_id,
+                skip=skip,
+                limit=fetch_limit,
+                spread_type=spread_type,
+            )
+            cached_counts[count_field] = total
+            await asyncio.to_thread(cache.set, count_cache_key, cached_counts, READING_COUNT_CACHE_TTL)
+        else:
+            readings = await db_provider.get_readings_by_user(
+                user_id=user_id,
+                skip=skip,
+                limit=fetch_limit,
+                spread_type=spread_type,
+            )
 
-        readings = await db_provider.get_readings_by_user(
-            user_id=str(current_user.id),
-            skip=skip,
-            limit=page_size,
-            spread_type=spread_type,
-        )
-
-        total = await db_provider.get_total_readings_count(
-            user_id=str(current_user.id),
-            spread_type=spread_type,
-        )
+        has_more = len(readings) > page_size
+        readings = readings[:page_size]
 
-        reading_responses: List[ReadingResponse] = []
-        for reading in readings:
-            reading_responses.append(await _build_reading_response(reading, db_provider))
+        # 페이지 전체에서 필요한 카드를 한 번에 조회
+        cards_by_id = await _fetch_unembedded_cards(readings, db_provider)
+        reading_responses: List[ReadingResponse] = [
+            _reading_to_response(reading, cards_by_id)
+            for reading in readings
+        ]
 
-        return ReadingListResponse(
+        reading_list = ReadingListResponse.model_construct(
             total=total,
             page=page,
             page_size=page_size,
             readings=reading_responses,
+            has_more=has_more,
+            next_cursor=_encode_reading_cursor(readings[-1]) if has_more else None,
         )
+        # 중첩이 깊은 목록 응답은 직접 직렬화해 response_model 재검증/jsonable_encoder를 생략
+        return ORJSONResponse(reading_list.model_dump(mode="json"))
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.exception("[ListReadings] 리딩 목록 조회 실패: %s", e)
         raise HTTPException(
@@ -5,20 +5,21 @@ This module provides Server-Sent Events (SSE) streaming for real-time
 tarot reading generation with progress updates.
 """
 import asyncio
+import logging
+import threading
 import time
 import traceback
-from typing import AsyncGenerator, Optional, List, Dict, Any, Set
+from typing import AsyncGenerator, Optional, List, Dict, Any, Tuple
 from datetime import datetime, timezone
-from pathlib import Path
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import StreamingResponse
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import TemplateNotFound
 
 from src.core.logging import get_logger
 from src.core.config import settings
-from src.core.card_shuffle import CardShuffleService, DrawnCard
+from src.core.card_shuffle import CardShuffleService, DrawnCard, Orientation
 from src.database.factory import get_database_provider
 from src.database.provider import DatabaseProvider
 from src.schemas.reading import ReadingRequest
@@ -31,35 +32,38 @@ from src.schemas.sse_events import (
     create_section_complete_event,
     create_complete_event,
     create_error_event,
+    format_ai_token_event,
     StartedEvent,
     RAGEnrichmentEvent,
     AIGenerationEvent,
 )
 from src.ai import AIOrchestrator, ProviderFactory, GenerationConfig
+from src.ai.models import OrchestratorResponse
 from src.ai.prompt_engine.context_builder import ContextBuilder
 from src.ai.prompt_engine.response_parser import ResponseParser
+from src.ai.prompt_engine.schemas import ParseError
 from src.ai.prompt_engine.reading_validator import ReadingValidator
 from src.ai.prompt_engine.parallel_reading_engine import ParallelReadingEngine
+from src.ai.prompt_engine.reading_templates import (
+    SYSTEM_PROMPT,
+    OUTPUT_FORMAT,
+    resolve_reading_template,
+)
 from src.ai.prompt_engine.spread_config import (
-    get_card_count,
-    get_position_names,
+    MAX_TOKENS_LIMIT,
+    get_spread_meta,
     supports_parallel_processing,
-    get_prompt_template_path,
-    get_max_tokens
 )
 from src.ai.rag.retriever import Retriever
 from src.ai.rag.context_enricher import ContextEnricher
 from src.ai.provider_loader import load_providers_from_settings, get_default_timeout_from_settings
 from src.api.dependencies.auth import get_current_active_user
+from src.api.reading_cache import invalidate_reading_count_cache
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/v1/readings", tags=["readings-stream"])
 
-# Jinja2 environment for prompt templates
-PROMPTS_DIR = Path(__file__).parent.parent.parent.parent / "prompts"
-jinja_env = Environment(loader=FileSystemLoader(str(PROMPTS_DIR)))
-
 # Singleton holders for RAG components
 _retriever: Optional[Retriever] = None
 _context_enricher: Optional[ContextEnricher] = None
@@ -67,24 +71,59 @@ _context_enricher: Optional[ContextEnricher] = None
 
 # Cache for AI Orchestrator instance
 _orchestrator: Optional[AIOrchestrator] = None
-
-
-# Track background persistence tasks to avoid premature GC
-_persistence_tasks: Set[asyncio.Task] = set()
-
-
-async def get_orchestrator(db_provider: DatabaseProvider) -> AIOrchestrator:
-    """
-    Get or create AI Orchestrator singleton with configured providers
-    
-    데이터베이스에서 AI Provider 설정을 로드합니다.
-    DB에 설정이 없으면 환경 변수로 폴백합니다.
-    """
-    global _orchestrator
-
-    if _orchestrator is not None:
-        return _orchestrator
-
+_orchestrator_lock = asyncio.Lock()
+# RAG 싱글톤은 동기 getter이므로 스레드 락으로 중복 초기화 방지
+_rag_lock = threading.RLock()
+
+
+# SSE 응답 헤더 (프록시 버퍼링 비활성화)
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",  # Disable nginx buffering
+}
+# 이벤트 없이 이 시간(초)이 지나면 SSE 주석 프레임을 보내 프록시 유휴 타임아웃으로 끊기지 않도록 함
+SSE_KEEPALIVE_INTERVAL = 15.0
+SSE_KEEPALIVE_FRAME = ": keep-alive\n\n"
+
+# 단계/진행률/메시지가 고정된 진행 이벤트는 임포트 시 한 번만 SSE 문자열로 만들어 재사용
+PROGRESS_INITIALIZING = create_progress_event(ReadingStage.INITIALIZING, 0, "리딩 준비 중...").to_sse_format()
+PROGRESS_PREPARING_SELECTED_CARDS = create_progress_event(ReadingStage.DRAWING_CARDS, 10, "선택한 카드를 준비하는 중...").to_sse_format()
+PROGRESS_DRAWING_CARDS = create_progress_event(ReadingStage.DRAWING_CARDS, 10, "카드를 뽑는 중...").to_sse_format()
+PROGRESS_ENRICHING_CONTEXT = create_progress_event(
+    ReadingStage.ENRICHING_CONTEXT, 35, "카드 의미 검색 중...", "타로 지식 데이터베이스에서 카드 정보를 가져오고 있습니다"
+).to_sse_format()
+PROGRESS_CONTEXT_READY = create_progress_event(ReadingStage.ENRICHING_CONTEXT, 50, "컨텍스트 준비 완료").to_sse_format()
+PROGRESS_PARALLEL_GENERATING = create_progress_event(
+    ReadingStage.GENERATING_AI, 60, "병렬 AI 리딩 생성 중...", "여러 AI 모델이 동시에 카드 해석을 생성하고 있습니다"
+).to_sse_format()
+PROGRESS_PARALLEL_GENERATED = create_progress_event(ReadingStage.GENERATING_AI, 80, "병렬 AI 리딩 생성 완료").to_sse_format()
+PROGRESS_GENERATING = create_progress_event(
+    ReadingStage.GENERATING_AI, 60, "AI 리딩 생성 중...", "AI가 타로 리딩을 해석하고 있습니다"
+).to_sse_format()
+PROGRESS_GENERATED = create_progress_event(ReadingStage.GENERATING_AI, 80, "AI 리딩 생성 완료").to_sse_format()
+PROGRESS_ANALYZING = create_progress_event(ReadingStage.FINALIZING, 82, "리딩 분석 중...").to_sse_format()
+PROGRESS_SCHEDULING_SAVE = create_progress_event(ReadingStage.FINALIZING, 92, "리딩 저장 예약 중...").to_sse_format()
+PROGRESS_SAVING_IN_BACKGROUND = create_progress_event(ReadingStage.FINALIZING, 95, "저장 백그라운드 처리 중").to_sse_format()
+PROGRESS_COMPLETED = create_progress_event(ReadingStage.COMPLETED, 100, "리딩 완료!").to_sse_format()
+
+# 백그라운드 리딩 저장: 요청마다 태스크를 만들지 않고 고정된 수의 워커가 큐에서 꺼내 저장
+# 큐가 가득 차면 put()이 대기하므로 급격한 부하에서도 대기 중인 저장 작업 수가 제한됨
+PERSISTENCE_QUEUE_MAXSIZE = 1000
+PERSISTENCE_WORKER_COUNT = 4
+
+_persistence_queue: Optional["asyncio.Queue[Tuple[DatabaseProvider, Dict[str, Any]]]"] = None
+_persistence_workers: List[asyncio.Task] = []
+_persistence_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# SSE 리딩 동시 생성 수 제한 (settings.MAX_CONCURRENT_STREAMS, 매 입장 시 다시 읽으므로 런타임 변경 가능)
+_admission_condition: Optional[asyncio.Condition] = None
+_admission_loop: Optional[asyncio.AbstractEventLoop] = None
+_active_streams = 0
+
+
+async def _build_orchestrator(db_provider: DatabaseProvider) -> AIOrchestrator:
+    """Create AI Orchestrator from DB provider settings (env var fallback)"""
     try:
         # Load AI providers from database settings (with fallback to env vars)
         providers = await load_providers_from_settings(
@@ -99,51 +138,84 @@ async def get_orchestrator(db_provider: DatabaseProvider) -> AIOrchestrator:
             if not registry._initialized:
                 registry.sync_from_providers(providers)
                 logger.info(
-                    f"Model registry synced with {len(providers)} provider(s), "
-                    f"{len(registry.models)} models registered"
+                    "Model registry synced with %d provider(s), %d models registered",
+                    len(providers),
+                    len(registry.models),
                 )
         except Exception as e:
-            logger.warning(f"Failed to sync model registry (non-critical): {e}")
+            logger.warning("Failed to sync model registry (non-critical): %s", e)
         
         # Get default timeout from settings (with buffer for complex tarot readings)
         default_timeout = await get_default_timeout_from_settings(db_provider)
         provider_timeout = max(90, default_timeout + 60)  # At least 90s
         
         # Initialize orchestrator with loaded providers
-        _orchestrator = AIOrchestrator(
+        orchestrator = AIOrchestrator(
             providers=providers,
             provider_timeout=provider_timeout,
             max_retries=2
         )
         logger.info(
-            f"AIOrchestrator initialized with {len(providers)} provider(s) from DB, "
-            f"timeout={provider_timeout}s"
+            "AIOrchestrator initialized with %d provider(s) from DB, timeout=%ss",
+            len(providers),
+            provider_timeout,
         )
 
-        return _orchestrator
+        return orchestrator
 
     except Exception as e:
-        logger.error(f"Failed to initialize AIOrchestrator: {e}")
+        logger.error("Failed to initialize AIOrchestrator: %s", e)
         raise
 
 
+async def get_orchestrator(db_provider: DatabaseProvider) -> AIOrchestrator:
+    """
+    Get or create AI Orchestrator singleton with configured providers
+    
+    데이터베이스에서 AI Provider 설정을 로드합니다.
+    DB에 설정이 없으면 환경 변수로 폴백합니다.
+    Warmed up in the app lifespan; after invalidation the lock keeps
+    concurrent first requests from building duplicate provider clients.
+    """
+    global _orchestrator
+
+    orchestrator = _orchestrator
+    if orchestrator is not None:
+        return orchestrator
+
+    async with _orchestrator_lock:
+        if _orchestrator is None:
+            _orchestrator = await _build_orchestrator(db_provider)
+        return _orchestrator
+
+
 def get_retriever() -> Retriever:
     """Get or create RAG Retriever singleton"""
     global _retriever
-    if _retriever is None:
-        logger.info("Initializing RAG Retriever for streaming...")
-        _retriever = Retriever()
-    return _retriever
+    retriever = _retriever
+    if retriever is not None:
+        return retriever
+
+    with _rag_lock:
+        if _retriever is None:
+            logger.info("Initializing RAG Retriever for streaming...")
+            _retriever = Retriever()
+        return _retriever
 
 
 def get_context_enricher() -> ContextEnricher:
     """Get or create RAG Context Enricher singleton"""
     global _context_enricher
-    if _context_enricher is None:
-        logger.info("Initializing RAG Context Enricher for streaming...")
-        retriever = get_retriever()
-        _context_enricher = ContextEnricher(retriever)
-    return _context_enricher
+    context_enricher = _context_enricher
+    if context_enricher is not None:
+        return context_enricher
+
+    with _rag_lock:
+        if _context_enricher is None:
+            logger.info("Initializing RAG Context Enricher for streaming...")
+            retriever = get_retriever()
+            _context_enricher = ContextEnricher(retriever)
+        return _context_enricher
 
 
 def invalidate_orchestrator_cache() -> None:
@@ -180,73 +252,178 @@ def _build_cards_payload(
     parsed_cards: List[Any],
 ) -> List[Dict[str, Any]]:
     """Firestore 저장을 위한 카드 payload 생성"""
-    payload: List[Dict[str, Any]] = []
-    for index, card_interp in enumerate(parsed_cards):
-        drawn_card = drawn_cards[index]
-        payload.append(
-            {
-                "card_id": drawn_card.card.id,
-                "position": card_interp.position,
-                "orientation": drawn_card.orientation.value,
-                "interpretation": card_interp.interpretation,
-                "key_message": card_interp.key_message,
-                "card": drawn_card.card.to_dict(),
-            }
+    return [
+        {
+            "card_id": drawn_card.card.id,
+            "position": card_interp.position,
+            "orientation": drawn_card.orientation.value,
+            "interpretation": card_interp.interpretation,
+            "key_message": card_interp.key_message,
+            "card": drawn_card.card.to_dict(),
+        }
+        for drawn_card, card_interp in zip(drawn_cards, parsed_cards)
+    ]
+
+
+async def _persist_reading(db_provider: DatabaseProvider, reading_data: Dict[str, Any]) -> None:
+    """스트리밍으로 생성된 리딩 저장 (실패는 로그만 남김)"""
+    reading_id = reading_data["id"]
+    try:
+        await db_provider.create_reading(reading_data)
+        await invalidate_reading_count_cache(reading_data.get("user_id"))
+        logger.info("[SSE] Background reading persistence complete: reading_id=%s", reading_id)
+    except Exception as persistence_error:
+        logger.error(
+            "[SSE] Background reading persistence failed: id=%s error=%s",
+            reading_id,
+            persistence_error
         )
-    return payload
+        logger.error(traceback.format_exc())
+
+
+async def _persistence_worker(
+    queue: "asyncio.Queue[Tuple[DatabaseProvider, Dict[str, Any]]]",
+) -> None:
+    """큐에 쌓인 리딩을 하나씩 저장하는 워커"""
+    while True:
+        db_provider, reading_data = await queue.get()
+        try:
+            await _persist_reading(db_provider, reading_data)
+        finally:
+            queue.task_done()
+
+
+def _get_persistence_queue() -> "asyncio.Queue[Tuple[DatabaseProvider, Dict[str, Any]]]":
+    """저장 큐 반환 (현재 이벤트 루프에서 처음 사용할 때 워커를 시작)"""
+    global _persistence_queue, _persistence_loop
+
+    loop = asyncio.get_running_loop()
+    if _persistence_queue is None or _persistence_loop is not loop:
+        _persistence_queue = asyncio.Queue(maxsize=PERSISTENCE_QUEUE_MAXSIZE)
+        _persistence_loop = loop
+        _persistence_workers[:] = [
+            asyncio.create_task(
+                _persistence_worker(_persistence_queue),
+                name=f"reading-persistence-{index}",
+            )
+            for index in range(PERSISTENCE_WORKER_COUNT)
+        ]
+    return _persistence_queue
+
+
+async def stop_persistence_workers(timeout: float = 10.0) -> None:
+    """대기 중인 저장을 최대 timeout초 동안 마친 뒤 워커 종료 (앱 종료 시 호출)"""
+    global _persistence_queue, _persistence_loop
+
+    queue = _persistence_queue
+    if queue is None or _persistence_loop is not asyncio.get_running_loop():
+        return
+    try:
+        await asyncio.wait_for(queue.join(), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning(
+            "[SSE] Stopping persistence workers with %d reading(s) unsaved",
+            queue.qsize(),
+        )
+    for worker in _persistence_workers:
+        worker.cancel()
+    await asyncio.gather(*_persistence_workers, return_exceptions=True)
+    _persistence_workers.clear()
+    _persistence_queue = None
+    _persistence_loop = None
+
+
+def _get_admission_condition() -> asyncio.Condition:
+    """동시 생성 수 제한용 Condition 반환 (이벤트 루프가 바뀌면 카운터와 함께 새로 생성)"""
+    global _admission_condition, _admission_loop, _active_streams
+
+    loop = asyncio.get_running_loop()
+    if _admission_condition is None or _admission_loop is not loop:
+        _admission_condition = asyncio.Condition()
+        _admission_loop = loop
+        _active_streams = 0
+    return _admission_condition
+
+
+async def _with_admission(events: AsyncGenerator[str, None]) -> AsyncGenerator[str, None]:
+    """
+    동시에 생성 중인 SSE 리딩 수를 settings.MAX_CONCURRENT_STREAMS로 제한
+
+    한도를 넘은 요청은 슬롯이 빌 때까지 대기한 뒤 리딩 생성을 시작합니다.
+    (대기 중에도 바깥의 keep-alive 프레임으로 연결은 유지됨)
+    """
+    global _active_streams
+
+    condition = _get_admission_condition()
+    async with condition:
+        try:
+            while _active_streams >= settings.MAX_CONCURRENT_STREAMS:
+                await condition.wait()
+        except asyncio.CancelledError:
+            # 알림을 받은 직후 취소된 경우 다음 대기자에게 넘겨 빈 슬롯이 방치되지 않도록 함
+            condition.notify(1)
+            raise
+        _active_streams += 1
+
+    try:
+        async for event in events:
+            yield event
+    finally:
+        await events.aclose()
+        async with condition:
+            _active_streams -= 1
+            condition.notify(1)
+
+
+async def _client_disconnected(http_request: Optional[Request]) -> bool:
+    """SSE 클라이언트 연결이 끊어졌는지 확인 (요청 객체가 없으면 연결된 것으로 간주)"""
+    return http_request is not None and await http_request.is_disconnected()
 
 
 async def generate_reading_stream(
     request: ReadingRequest,
     user_id: str,
-    db_provider: DatabaseProvider
+    db_provider: DatabaseProvider,
+    http_request: Optional[Request] = None,
 ) -> AsyncGenerator[str, None]:
     """
     Generate tarot reading with SSE progress updates
 
+    AI 생성처럼 비용이 큰 단계에 들어가기 전에 클라이언트 연결을 확인하고,
+    이미 끊어졌으면 이후 단계를 건너뛰고 종료합니다.
+
     Args:
         request: Reading creation request
         user_id: Authenticated user ID
         db_provider: Database provider instance
+        http_request: 연결 종료 감지용 HTTP 요청 (없으면 확인 생략)
 
     Yields:
         SSE formatted event strings
     """
     start_time = time.time()
     reading_id = None
+    rag_task: Optional[asyncio.Task] = None
 
     try:
         # ===== Stage 1: Initialize =====
-        yield create_progress_event(
-            ReadingStage.INITIALIZING,
-            0,
-            "리딩 준비 중..."
-        ).to_sse_format()
-
-        yield create_sse_event(
+        # 같은 시점에 발생하는 이벤트는 하나의 청크로 묶어 전송 (이벤트 자체는 그대로 유지)
+        yield PROGRESS_INITIALIZING + create_sse_event(
             SSEEventType.STARTED,
             StartedEvent()
         ).to_sse_format()
 
-        await asyncio.sleep(0.1)
-
         # ===== Stage 2: Draw Cards =====
-        # Import card shuffle components (needed for both user selection and random modes)
-        from src.core.card_shuffle import DrawnCard, Orientation, CardData, CardShuffleService
-        
-        # 스프레드 설정에서 카드 수 가져오기
-        card_count = get_card_count(request.spread_type)
+        # 스프레드별 상수 (카드 수, 최대 토큰 수)는 캐시된 SpreadMeta에서 조회
+        spread_meta = get_spread_meta(request.spread_type)
+        card_count = spread_meta.card_count
 
         # Two modes: User Selection vs Random
         if request.selected_card_ids:
             # User Selection Mode: Use selected cards
-            yield create_progress_event(
-                ReadingStage.DRAWING_CARDS,
-                10,
-                "선택한 카드를 준비하는 중..."
-            ).to_sse_format()
+            yield PROGRESS_PREPARING_SELECTED_CARDS
             
-            logger.info(f"[SSE] User Selection Mode: {request.selected_card_ids}")
+            logger.info("[SSE] User Selection Mode: %s", request.selected_card_ids)
             
             # Validate card count
             if len(request.selected_card_ids) != card_count:
@@ -263,28 +440,17 @@ async def generate_reading_stream(
                         f"selected_card_ids 길이({len(request.selected_card_ids)})와 일치하지 않습니다."
                     )
             
+            # 선택된 카드를 한 번의 쿼리로 조회
+            cards_by_id = await db_provider.get_cards_by_ids(request.selected_card_ids)
+
             drawn_cards = []
             for idx, card_id in enumerate(request.selected_card_ids):
-                card_dto = await db_provider.get_card_by_id(card_id)
+                card_dto = cards_by_id.get(card_id)
                 if not card_dto:
                     raise ValueError(f"카드 ID {card_id}를 찾을 수 없습니다.")
                 
-                # Convert to CardData
-                card_data = CardData(
-                    id=card_dto.id,
-                    name=card_dto.name_en,
-                    name_ko=card_dto.name_ko,
-                    arcana_type=card_dto.arcana_type,
-                    number=card_dto.number,
-                    suit=card_dto.suit,
-                    keywords_upright=card_dto.keywords_upright,
-                    keywords_reversed=card_dto.keywords_reversed,
-                    meaning_upright=card_dto.meaning_upright,
-                    meaning_reversed=card_dto.meaning_reversed,
-                    description=card_dto.description,
-                    symbolism=card_dto.symbolism,
-                    image_url=card_dto.image_url,
-                )
+                # Convert to CardData (cached per card DTO)
+                card_data = CardShuffleService._convert_provider_card(card_dto)
                 
                 # Use provided reversed_states if available, otherwise randomly determine (30% chance for reversed)
                 if request.reversed_states is not None and idx < len(request.reversed_states):
@@ -295,21 +461,33 @@ async def generate_reading_stream(
                 drawn_cards.append(DrawnCard(card_data, orientation))
         else:
             # Random Mode: Draw random cards
-            yield create_progress_event(
-                ReadingStage.DRAWING_CARDS,
-                10,
-                "카드를 뽑는 중..."
-            ).to_sse_format()
+            yield PROGRESS_DRAWING_CARDS
             
-            logger.info(f"[SSE] Random Mode: drawing {card_count} cards")
+            logger.info("[SSE] Random Mode: drawing %d cards", card_count)
             
             drawn_cards = await CardShuffleService.draw_cards(
                 count=card_count,
                 provider=db_provider,
             )
 
+        # RAG 검색은 카드 공개 이벤트 연출과 독립적이므로 카드가 정해지는 즉시 시작해 겹쳐서 수행
+        context_enricher = get_context_enricher()
+        card_data = [
+            {"id": dc.card.id, "is_reversed": dc.orientation.value == "reversed"}
+            for dc in drawn_cards
+        ]
+        rag_task = asyncio.create_task(
+            context_enricher.enrich_prompt_context_async(
+                cards=card_data,
+                spread_type=request.spread_type,
+                question=request.question,
+                category=request.category or "general",
+                language="ko",
+            )
+        )
+
         # Send card drawn events
-        position_names = get_position_names(request.spread_type)
+        position_names = spread_meta.position_names
 
         for idx, drawn_card in enumerate(drawn_cards):
             progress = 10 + int((idx + 1) / len(drawn_cards) * 20)  # 10-30%
@@ -324,35 +502,21 @@ async def generate_reading_stream(
                 progress=progress
             ).to_sse_format()
 
-            await asyncio.sleep(0.2)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[SSE] 카드 선택 완료: %s",
+                [f"{dc.card.name}({dc.orientation.value})" for dc in drawn_cards],
+            )
 
-        logger.info(
-            "[SSE] 카드 선택 완료: %s",
-            [f"{dc.card.name}({dc.orientation.value})" for dc in drawn_cards],
-        )
+        if await _client_disconnected(http_request):
+            logger.info("[SSE] Client disconnected after card draw, aborting reading")
+            return
 
         # ===== Stage 3: RAG Context Enrichment =====
-        yield create_progress_event(
-            ReadingStage.ENRICHING_CONTEXT,
-            35,
-            "카드 의미 검색 중...",
-            "타로 지식 데이터베이스에서 카드 정보를 가져오고 있습니다"
-        ).to_sse_format()
+        yield PROGRESS_ENRICHING_CONTEXT
 
-        context_enricher = get_context_enricher()
-        card_data = [
-            {"id": dc.card.id, "is_reversed": dc.orientation.value == "reversed"}
-            for dc in drawn_cards
-        ]
-
-        # Phase 2 Optimization: Use async version for parallel RAG queries
-        rag_context = await context_enricher.enrich_prompt_context_async(
-            cards=card_data,
-            spread_type=request.spread_type,
-            question=request.question,
-            category=request.category or "general",
-            language="ko",
-        )
+        # Phase 2 Optimization: RAG queries run in parallel (started after card draw)
+        rag_context = await rag_task
 
         yield create_sse_event(
             SSEEventType.RAG_ENRICHMENT,
@@ -361,29 +525,21 @@ async def generate_reading_stream(
                 spread_context_loaded=bool(rag_context.get("spread_context")),
                 category_context_loaded=bool(rag_context.get("category_guidance"))
             )
-        ).to_sse_format()
-
-        yield create_progress_event(
-            ReadingStage.ENRICHING_CONTEXT,
-            50,
-            "컨텍스트 준비 완료"
-        ).to_sse_format()
+        ).to_sse_format() + PROGRESS_CONTEXT_READY
 
         logger.info("[SSE] RAG 컨텍스트 강화 완료")
-        await asyncio.sleep(0.1)
+
+        if await _client_disconnected(http_request):
+            logger.info("[SSE] Client disconnected before AI generation, aborting reading")
+            return
 
         # ===== Stage 4: AI Generation =====
         # Check if this spread type supports parallel processing
-        use_parallel_engine = supports_parallel_processing(request.spread_type) and len(drawn_cards) == get_card_count(request.spread_type)
+        use_parallel_engine = supports_parallel_processing(request.spread_type) and len(drawn_cards) == card_count
         
         if use_parallel_engine:
             # Use ParallelReadingEngine for Celtic Cross
-            yield create_progress_event(
-                ReadingStage.GENERATING_AI,
-                60,
-                "병렬 AI 리딩 생성 중...",
-                "여러 AI 모델이 동시에 카드 해석을 생성하고 있습니다"
-            ).to_sse_format()
+            yield PROGRESS_PARALLEL_GENERATING
             
             orchestrator = await get_orchestrator(db_provider)
             parallel_engine = ParallelReadingEngine(
@@ -399,47 +555,39 @@ async def generate_reading_stream(
                     rag_context=rag_context
                 )
                 
-                yield create_progress_event(
-                    ReadingStage.GENERATING_AI,
-                    80,
-                    "병렬 AI 리딩 생성 완료"
-                ).to_sse_format()
+                yield PROGRESS_PARALLEL_GENERATED
                 
                 logger.info("[SSE] Parallel AI reading generation complete")
                 
                 # Build LLM usage logs from all orchestrator responses
-                llm_usage_logs = []
-                for orch_resp in all_llm_responses:
-                    # 각 orchestrator response는 여러 시도를 포함할 수 있음
-                    for attempt in orch_resp.all_attempts:
-                        log_entry = {
-                            "provider": attempt.provider,
-                            "model": attempt.model,
-                            "prompt_tokens": attempt.prompt_tokens or 0,
-                            "completion_tokens": attempt.completion_tokens or 0,
-                            "total_tokens": attempt.total_tokens or 0,
-                            "estimated_cost": attempt.estimated_cost or 0.0,
-                            "latency_seconds": (attempt.latency_ms or 0) / 1000.0,
-                            "purpose": "main_reading",  # 병렬 엔진은 모두 메인 리딩의 일부
-                            "created_at": datetime.now(timezone.utc),
-                        }
-                        llm_usage_logs.append(log_entry)
+                # 각 orchestrator response는 여러 시도를 포함할 수 있음
+                logged_at = datetime.now(timezone.utc)
+                llm_usage_logs = [
+                    {
+                        "provider": attempt.provider,
+                        "model": attempt.model,
+                        "prompt_tokens": attempt.prompt_tokens or 0,
+                        "completion_tokens": attempt.completion_tokens or 0,
+                        "total_tokens": attempt.total_tokens or 0,
+                        "estimated_cost": attempt.estimated_cost or 0.0,
+                        "latency_seconds": (attempt.latency_ms or 0) / 1000.0,
+                        "purpose": "main_reading",  # 병렬 엔진은 모두 메인 리딩의 일부
+                        "created_at": logged_at,
+                    }
+                    for orch_resp in all_llm_responses
+                    for attempt in orch_resp.all_attempts
+                ]
                 
-                logger.info(f"[SSE] Parallel engine: Collected {len(llm_usage_logs)} LLM usage logs from {len(all_llm_responses)} orchestrator responses")
+                logger.info("[SSE] Parallel engine: Collected %d LLM usage logs from %d orchestrator responses", len(llm_usage_logs), len(all_llm_responses))
                 
             except Exception as e:
-                logger.error(f"[SSE] Parallel reading generation failed: {e}")
+                logger.error("[SSE] Parallel reading generation failed: %s", e)
                 logger.error(traceback.format_exc())
                 raise
         
         else:
             # Use traditional single LLM approach for other spreads
-            yield create_progress_event(
-                ReadingStage.GENERATING_AI,
-                60,
-                "AI 리딩 생성 중...",
-                "AI가 타로 리딩을 해석하고 있습니다"
-            ).to_sse_format()
+            yield PROGRESS_GENERATING
 
             # Build context for AI generation
             cards_context = [ContextBuilder.build_card_context(dc) for dc in drawn_cards]
@@ -459,75 +607,25 @@ async def generate_reading_stream(
                     "rag_context": rag_context,
                 }
 
-            # Build prompts using Jinja2 templates
+            # Build prompts using pre-compiled Jinja2 templates
             # Select template based on prompt language setting
             prompt_lang = settings.PROMPT_LANGUAGE
-            lang_suffix = f"_{prompt_lang}" if prompt_lang == "en" else ""
-
-            # 스프레드 설정에서 템플릿 경로 가져오기
-            template_path = get_prompt_template_path(
-                spread_type=request.spread_type,
-                template_key="main",
-                language=prompt_lang
-            )
-            
-            if not template_path:
-                # Fallback to default naming convention
-                template_path = f"reading/{request.spread_type}{lang_suffix}.txt"
+            template_path, reading_template = resolve_reading_template(request.spread_type, prompt_lang)
+            if reading_template is None:
+                logger.error("[SSE] Failed to load template %s", template_path)
+                raise TemplateNotFound(template_path)
 
-            logger.info(f"[SSE] Using prompt template: {template_path} (language: {prompt_lang})")
+            logger.info("[SSE] Using prompt template: %s (language: %s)", template_path, prompt_lang)
 
-            system_template = jinja_env.get_template("system/tarot_expert.txt")
-            system_prompt = system_template.render()
-
-            # Try to load template with language suffix, fallback to default (Korean) if not found
-            try:
-                reading_template = jinja_env.get_template(template_path)
-                logger.debug(f"[SSE] Template loaded successfully: {template_path}")
-            except Exception as e:
-                # If language-specific template doesn't exist, fallback to default (Korean) version
-                if lang_suffix:
-                    logger.warning(
-                        f"[SSE] Template {template_path} not found (error: {e}), "
-                        f"falling back to default (Korean) version"
-                    )
-                    # Remove language suffix to use default template
-                    base_template_map = {
-                        "one_card": "reading/one_card.txt",
-                        "three_card_past_present_future": "reading/three_card_past_present_future.txt",
-                        "three_card_situation_action_outcome": "reading/three_card_situation_action_outcome.txt",
-                        "celtic_cross": "reading/celtic_cross.txt",
-                    }
-                    fallback_template_path = base_template_map.get(
-                        request.spread_type, "reading/one_card.txt"
-                    )
-                    try:
-                        reading_template = jinja_env.get_template(fallback_template_path)
-                        logger.info(f"[SSE] Using fallback template: {fallback_template_path}")
-                    except Exception as fallback_error:
-                        logger.error(
-                            f"[SSE] Failed to load both primary ({template_path}) and "
-                            f"fallback ({fallback_template_path}) templates: {fallback_error}"
-                        )
-                        raise
-                else:
-                    # If already using default template, re-raise the error
-                    logger.error(f"[SSE] Failed to load template {template_path}: {e}")
-                    raise
+            system_prompt = SYSTEM_PROMPT
             reading_prompt = reading_template.render(**prompt_context)
-
-            output_template = jinja_env.get_template("output/structured_response.txt")
-            output_format = output_template.render()
-
-            full_prompt = f"{reading_prompt}\n\n{output_format}"
+            full_prompt = f"{reading_prompt}\n\n{OUTPUT_FORMAT}"
 
             orchestrator = await get_orchestrator(db_provider)
             card_count = len(drawn_cards)
 
-            # 스프레드 설정에서 최대 토큰 수 가져오기
-            max_tokens = get_max_tokens(request.spread_type, prompt_lang)
-            # Ensure max_tokens doesn't exceed API limit
-            max_tokens = min(max_tokens, 4096)
+            # 스프레드 설정의 최대 토큰 수 (API 제한 적용됨)
+            max_tokens = spread_meta.max_tokens
 
             yield create_sse_event(
                 SSEEventType.AI_GENERATION,
@@ -542,11 +640,12 @@ async def generate_reading_stream(
             MAX_PARSE_RETRIES = 2
             parsed_response = None
             last_parse_error = None
+            last_truncated = False
             all_llm_results = []
 
             for parse_attempt in range(MAX_PARSE_RETRIES + 1):
                 try:
-                    # Generate response (재시도 시 max_tokens 증가, 단 4096 제한 준수)
+                    # Generate response (이전 응답이 잘린 경우에만 max_tokens 증가, 단 4096 제한 준수)
                     if parse_attempt > 0:
                         logger.warning(
                             "[SSE] 파싱 재시도 %d/%d: 이전 오류=%s",
@@ -554,8 +653,12 @@ async def generate_reading_stream(
                             MAX_PARSE_RETRIES,
                             str(last_parse_error)[:100]
                         )
-                        # Increase max_tokens but cap at 4096 (API limit)
-                        max_tokens = min(int(max_tokens * 1.3), 4096)
+                        if await _client_disconnected(http_request):
+                            logger.info("[SSE] Client disconnected before parse retry, aborting reading")
+                            return
+                        if last_truncated:
+                            # Increase max_tokens but cap at 4096 (API limit)
+                            max_tokens = min(int(max_tokens * 1.3), MAX_TOKENS_LIMIT)
 
                         yield create_progress_event(
                             ReadingStage.GENERATING_AI,
@@ -563,20 +666,28 @@ async def generate_reading_stream(
                             f"AI 리딩 재생성 중... (시도 {parse_attempt + 1}/{MAX_PARSE_RETRIES + 1})"
                         ).to_sse_format()
 
-                    llm_result = await orchestrator.generate(
+                    # 토큰은 도착하는 대로 ai_token 이벤트로 전달하고, 파싱은 완료 후 전체 응답으로 수행
+                    # attempt 값이 바뀌면 클라이언트는 이전 재시도의 텍스트를 버림
+                    llm_result = None
+                    async for item in orchestrator.stream(
                         prompt=full_prompt,
                         system_prompt=system_prompt,
                         config=GenerationConfig(
                             max_tokens=max_tokens,
                             temperature=0.7,
-                            timeout=90,
                         ),
-                    )
+                        timeout=90,
+                    ):
+                        if isinstance(item, OrchestratorResponse):
+                            llm_result = item
+                        else:
+                            yield format_ai_token_event(item, parse_attempt)
 
                     all_llm_results.append(llm_result)
 
                     # Check if response was truncated
-                    if llm_result.response.finish_reason in ("max_tokens", "length"):
+                    last_truncated = llm_result.response.finish_reason in ("max_tokens", "length")
+                    if last_truncated:
                         logger.warning(
                             "[SSE] 응답이 잘렸을 수 있음: finish_reason=%s, tokens=%d/%d",
                             llm_result.response.finish_reason,
@@ -594,7 +705,9 @@ async def generate_reading_stream(
 
                     break  # Exit retry loop
 
-                except Exception as e:
+                except ParseError as e:
+                    # 모델 출력 문제(잘림, 잘못된 JSON, 스키마 불일치)만 재생성으로 재시도
+                    # AI 호출 오류 등은 orchestrator가 이미 재시도/폴백했으므로 바로 전달
                     last_parse_error = e
 
                     if parse_attempt >= MAX_PARSE_RETRIES:
@@ -608,60 +721,45 @@ async def generate_reading_stream(
                     continue
 
             if parsed_response is None:
-                from src.ai.prompt_engine.schemas import ParseError
                 raise ParseError("파싱 재시도 후에도 응답을 처리할 수 없습니다")
 
-            yield create_progress_event(
-                ReadingStage.GENERATING_AI,
-                80,
-                "AI 리딩 생성 완료"
-            ).to_sse_format()
+            yield PROGRESS_GENERATED
 
             logger.info("[SSE] AI 리딩 생성 완료: %d 토큰 사용", llm_result.response.total_tokens)
             
             # Build LLM usage logs for all attempts (including retries)
+            # 모든 시도를 parse_retry로 기록한 뒤, 마지막 파싱 시도의 로그만 한 번에 갱신
             llm_usage_logs = []
-            logger.info(f"[SSE] Building LLM usage logs: {len(all_llm_results)} parse attempts")
-            for result_idx, result in enumerate(all_llm_results):
-                # Each orchestrator result may have multiple provider attempts
-                logger.info(f"[SSE]   Parse attempt {result_idx + 1}: {len(result.all_attempts)} provider attempts")
-                for attempt_idx, attempt in enumerate(result.all_attempts):
-                    # Determine purpose
-                    if result_idx == len(all_llm_results) - 1:
-                        # Last parsing attempt
-                        if attempt_idx == len(result.all_attempts) - 1:
-                            purpose = "main_reading"  # Final success
-                        else:
-                            purpose = "retry"  # Provider retry within same parse attempt
-                    else:
-                        # Previous parsing attempts
-                        purpose = "parse_retry"  # Parse failure retry
-
-                    log_entry = {
+            final_logs_start = 0
+            logged_at = datetime.now(timezone.utc)
+            logger.debug("[SSE] Building LLM usage logs: %d parse attempts", len(all_llm_results))
+            for result in all_llm_results:
+                final_logs_start = len(llm_usage_logs)
+                llm_usage_logs.extend(
+                    {
                         "provider": attempt.provider,
                         "model": attempt.model,
                         "prompt_tokens": attempt.prompt_tokens or 0,
                         "completion_tokens": attempt.completion_tokens or 0,
                         "total_tokens": attempt.total_tokens or 0,
                         "estimated_cost": attempt.estimated_cost or 0.0,
-                        "latency_seconds": (attempt.latency_ms or 0) / 1000.0,  # 🐛 Fix: Convert ms to seconds
-                        "purpose": purpose,
-                        "created_at": datetime.now(timezone.utc),
+                        "latency_seconds": (attempt.latency_ms or 0) / 1000.0,
+                        "purpose": "parse_retry",  # Parse failure retry
+                        "created_at": logged_at,
                     }
-                    llm_usage_logs.append(log_entry)
-                    logger.info(
-                        f"[SSE]     - {purpose}: {attempt.provider}/{attempt.model}, "
-                        f"{attempt.total_tokens} tokens, {log_entry['latency_seconds']:.2f}s"
-                    )
+                    for attempt in result.all_attempts
+                )
+
+            # 최종 파싱 시도: 같은 시도 내 provider 재시도는 retry, 마지막 호출은 main_reading
+            for log_entry in llm_usage_logs[final_logs_start:-1]:
+                log_entry["purpose"] = "retry"
+            if llm_usage_logs:
+                llm_usage_logs[-1]["purpose"] = "main_reading"
 
-            logger.info(f"[SSE] Total LLM usage logs: {len(llm_usage_logs)}")
+            logger.info("[SSE] Total LLM usage logs: %d", len(llm_usage_logs))
 
         # ===== Stage 5: Validate =====
-        yield create_progress_event(
-            ReadingStage.FINALIZING,
-            82,
-            "리딩 분석 중..."
-        ).to_sse_format()
+        yield PROGRESS_ANALYZING
 
         validator = ReadingValidator()
         card_count = len(drawn_cards)
@@ -672,49 +770,38 @@ async def generate_reading_stream(
         )
         # Note: validate_reading_quality raises ValidationError on failure, no return value
 
-        # ===== Send section-complete events as data becomes available =====
-
-        # 1. Summary section
-        yield create_section_complete_event(
-            section="summary",
-            data={"summary": parsed_response.summary},
-            progress=84
-        ).to_sse_format()
-        await asyncio.sleep(0.1)
-
-        # 2. Cards section
+        # ===== Send section-complete events =====
+        # 네 섹션이 모두 준비된 상태이므로 이벤트는 그대로 두고 하나의 청크로 묶어 전송
+        # (yield/ASGI 전송/chunked 프레이밍을 섹션마다 반복하지 않음)
         cards_payload = _build_cards_payload(drawn_cards, parsed_response.cards)
-        yield create_section_complete_event(
-            section="cards",
-            data={"cards": cards_payload},
-            progress=86
-        ).to_sse_format()
-        await asyncio.sleep(0.1)
-
-        # 3. Overall reading section
-        yield create_section_complete_event(
-            section="overall_reading",
-            data={"overall_reading": parsed_response.overall_reading},
-            progress=88
-        ).to_sse_format()
-        await asyncio.sleep(0.1)
-
-        # 4. Advice section
-        yield create_section_complete_event(
-            section="advice",
-            data={"advice": parsed_response.advice.model_dump()},
-            progress=90
-        ).to_sse_format()
-        await asyncio.sleep(0.1)
+        yield "".join((
+            create_section_complete_event(
+                section="summary",
+                data={"summary": parsed_response.summary},
+                progress=84
+            ).to_sse_format(),
+            create_section_complete_event(
+                section="cards",
+                data={"cards": cards_payload},
+                progress=86
+            ).to_sse_format(),
+            create_section_complete_event(
+                section="overall_reading",
+                data={"overall_reading": parsed_response.overall_reading},
+                progress=88
+            ).to_sse_format(),
+            create_section_complete_event(
+                section="advice",
+                data={"advice": parsed_response.advice.model_dump()},
+                progress=90
+            ).to_sse_format(),
+        ))
 
         # ===== Stage 6: Save to Database =====
-        yield create_progress_event(
-            ReadingStage.FINALIZING,
-            92,
-            "리딩 저장 예약 중..."
-        ).to_sse_format()
+        yield PROGRESS_SCHEDULING_SAVE
 
         reading_id = str(uuid4())
+        created_at = datetime.now(timezone.utc)
 
         reading_data = {
             "id": reading_id,
@@ -727,53 +814,17 @@ async def generate_reading_stream(
             "overall_reading": parsed_response.overall_reading,
             "advice": parsed_response.advice.model_dump(),
             "summary": parsed_response.summary,
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc),
+            "created_at": created_at,
+            "updated_at": created_at,
             "llm_usage": llm_usage_logs,
         }
 
-        async def _persist_reading() -> None:
-            try:
-                await db_provider.create_reading(reading_data)
-                logger.info("[SSE] Background reading persistence complete: reading_id=%s", reading_id)
-            except Exception as persistence_error:
-                logger.error(
-                    "[SSE] Background reading persistence failed: id=%s error=%s",
-                    reading_id,
-                    persistence_error
-                )
-                logger.error(traceback.format_exc())
-
-        persistence_task = asyncio.create_task(_persist_reading())
-        _persistence_tasks.add(persistence_task)
-
-        def _cleanup_task(task: asyncio.Task) -> None:
-            _persistence_tasks.discard(task)
-            if task.cancelled():
-                logger.warning("[SSE] Background persistence task cancelled: reading_id=%s", reading_id)
-            elif task.exception():
-                logger.error(
-                    "[SSE] Background persistence task raised: reading_id=%s error=%s",
-                    reading_id,
-                    task.exception()
-                )
-
-        persistence_task.add_done_callback(_cleanup_task)
-
-        yield create_progress_event(
-            ReadingStage.FINALIZING,
-            95,
-            "저장 백그라운드 처리 중"
-        ).to_sse_format()
+        await _get_persistence_queue().put((db_provider, reading_data))
 
         # ===== Stage 7: Complete =====
-        total_time = time.time() - start_time
+        yield PROGRESS_SAVING_IN_BACKGROUND + PROGRESS_COMPLETED
 
-        yield create_progress_event(
-            ReadingStage.COMPLETED,
-            100,
-            "리딩 완료!"
-        ).to_sse_format()
+        total_time = time.time() - start_time
 
         reading_summary = {
             "reading_id": reading_id,
@@ -789,10 +840,10 @@ async def generate_reading_stream(
             total_time=round(total_time, 2),
             reading_summary=reading_summary
         ).to_sse_format()
-        logger.info(f"[SSE] Reading {reading_id} generated (persistence scheduled) in {total_time:.2f}s")
+        logger.info("[SSE] Reading %s generated (persistence scheduled) in %.2fs", reading_id, total_time)
 
     except Exception as e:
-        logger.error(f"[SSE] Error generating reading: {e}")
+        logger.error("[SSE] Error generating reading: %s", e)
         logger.error(traceback.format_exc())
 
         yield create_error_event(
@@ -802,10 +853,48 @@ async def generate_reading_stream(
             stage=ReadingStage.GENERATING_AI
         ).to_sse_format()
 
+    finally:
+        # 클라이언트 연결 종료 등으로 중단된 경우 진행 중인 RAG 검색 취소
+        # (AI 생성은 제너레이터 안에서 직접 await하므로 취소가 그대로 전파됨)
+        if rag_task is not None and not rag_task.done():
+            rag_task.cancel()
+
+
+async def _with_keepalive(
+    events: AsyncGenerator[str, None],
+    interval: float = SSE_KEEPALIVE_INTERVAL,
+) -> AsyncGenerator[str, None]:
+    """
+    SSE 이벤트 스트림에 keep-alive 주석 프레임 추가
+
+    다음 이벤트가 interval초 안에 오지 않으면 주석(": keep-alive")을 보냅니다.
+    SSE 클라이언트는 주석 줄을 무시하므로 이벤트 내용에는 영향이 없습니다.
+    """
+    next_event = asyncio.ensure_future(events.__anext__())
+    try:
+        while True:
+            done, _ = await asyncio.wait({next_event}, timeout=interval)
+            if not done:
+                yield SSE_KEEPALIVE_FRAME
+                continue
+            try:
+                event = next_event.result()
+            except StopAsyncIteration:
+                return
+            yield event
+            next_event = asyncio.ensure_future(events.__anext__())
+    finally:
+        # 클라이언트 연결 종료 시 진행 중인 이벤트 생성을 취소한 뒤 원본 제너레이터 정리
+        if not next_event.done():
+            next_event.cancel()
+        await asyncio.gather(next_event, return_exceptions=True)
+        await events.aclose()
+
 
 @router.post("/stream/test", response_class=StreamingResponse)
 async def create_reading_stream_test(
     request: ReadingRequest,
+    http_request: Request,
     db_provider: DatabaseProvider = Depends(get_database_provider),
 ):
     """
@@ -815,22 +904,19 @@ async def create_reading_stream_test(
     """
     # Use a test user ID
     test_user_id = "test-user-sse"
-    logger.info(f"[SSE Test] Starting streamed reading for test user: {request.spread_type}")
+    logger.info("[SSE Test] Starting streamed reading for test user: %s", request.spread_type)
 
     return StreamingResponse(
-        generate_reading_stream(request, test_user_id, db_provider),
+        _with_keepalive(_with_admission(generate_reading_stream(request, test_user_id, db_provider, http_request))),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",  # Disable nginx buffering
-        }
+        headers=SSE_HEADERS,
     )
 
 
 @router.post("/stream", response_class=StreamingResponse)
 async def create_reading_stream(
     request: ReadingRequest,
+    http_request: Request,
     current_user=Depends(get_current_active_user),
     db_provider: DatabaseProvider = Depends(get_database_provider),
 ):
@@ -855,14 +941,10 @@ async def create_reading_stream(
     """
     # Extract user_id - both FirebaseUser and SQLAlchemy User models use 'id' attribute
     user_id = current_user.id
-    logger.info(f"[SSE] Starting streamed reading for user {user_id}: {request.spread_type}")
+    logger.info("[SSE] Starting streamed reading for user %s: %s", user_id, request.spread_type)
 
     return StreamingResponse(
-        generate_reading_stream(request, user_id, db_provider),
+        _with_keepalive(_with_admission(generate_reading_stream(request, user_id, db_provider, http_request))),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",  # Disable nginx buffering
-        }
+        headers=SSE_HEADERS,
     )
@@ -17,10 +17,13 @@ Settings API Routes - 애플리케이션 설정 관리 API
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Path
 
+from src.api.responses import ORJSONResponse
 from src.core.logging import get_logger
 from src.database.factory import get_database_provider
 from src.database.provider import DatabaseProvider
 from src.api.dependencies.auth import get_current_admin_user
+from src.api.routes.readings import invalidate_orchestrator_cache as invalidate_readings_orchestrator
+from src.api.routes.readings_stream import invalidate_orchestrator_cache as invalidate_stream_orchestrator
 from src.schemas.settings import (
     SettingsResponse,
     UpdateAdminSettingsRequest,
@@ -32,7 +35,63 @@ from src.schemas.settings import (
 
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/api/v1/settings", tags=["settings"])
+router = APIRouter(
+    prefix="/api/v1/settings",
+    tags=["settings"],
+    default_response_class=ORJSONResponse,
+)
+
+
+def _invalidate_orchestrators() -> None:
+    """일반/SSE 리딩 라우트의 AI Orchestrator 캐시 무효화 (Provider 설정 변경 후 호출)"""
+    invalidate_readings_orchestrator()
+    invalidate_stream_orchestrator()
+
+
+def _mask_provider(provider: dict) -> dict:
+    """Provider 설정의 API 키 마스킹 (앞 7자리와 뒤 4자리만 표시)"""
+    api_key = provider.get('api_key', '')
+    if api_key and len(api_key) > 10:
+        return {**provider, 'api_key': f"{api_key[:7]}***{api_key[-4:]}"}
+    return provider
+
+
+def _mask_providers(providers: List[dict]) -> List[dict]:
+    """응답용 Provider 목록의 API 키 마스킹"""
+    return [_mask_provider(provider) for provider in providers]
+
+
+def _build_settings_response(settings_data: dict) -> SettingsResponse:
+    """저장된 설정 dict를 API 키가 마스킹된 SettingsResponse로 변환 (스키마 검증 수행)"""
+    ai_settings = settings_data.get('ai', {})
+    return SettingsResponse(
+        admin=AdminSettings(**settings_data.get('admin', {})),
+        ai=AISettings(**{**ai_settings, 'providers': _mask_providers(ai_settings.get('providers', []))}),
+        updated_at=settings_data.get('updated_at'),
+        updated_by=settings_data.get('updated_by')
+    )
+
+
+def _construct_settings_response(settings_data: dict) -> SettingsResponse:
+    """
+    방금 저장한 설정으로 SettingsResponse 생성 (검증 생략)
+
+    변경 핸들러는 요청 스키마로 검증된 값을 저장한 직후의 설정을 반환하므로
+    model_construct로 Pydantic 검증을 다시 수행하지 않습니다.
+    """
+    ai_settings = settings_data.get('ai', {})
+    return SettingsResponse.model_construct(
+        admin=AdminSettings.model_construct(**settings_data.get('admin', {})),
+        ai=AISettings.model_construct(**{
+            **ai_settings,
+            'providers': [
+                LLMProviderConfig.model_construct(**provider)
+                for provider in _mask_providers(ai_settings.get('providers', []))
+            ],
+        }),
+        updated_at=settings_data.get('updated_at'),
+        updated_by=settings_data.get('updated_by')
+    )
 
 
 @router.get("", response_model=SettingsResponse)
@@ -62,27 +121,7 @@ async def get_settings(
                 updated_by=None
             )
         
-        # Mask API keys for security
-        ai_settings = settings_data.get('ai', {})
-        providers = ai_settings.get('providers', [])
-        
-        masked_providers = []
-        for provider in providers:
-            masked_provider = provider.copy()
-            api_key = masked_provider.get('api_key', '')
-            if api_key and len(api_key) > 10:
-                # Show only first 7 and last 4 characters
-                masked_provider['api_key'] = f"{api_key[:7]}***{api_key[-4:]}"
-            masked_providers.append(masked_provider)
-        
-        ai_settings['providers'] = masked_providers
-        
-        return SettingsResponse(
-            admin=AdminSettings(**settings_data.get('admin', {})),
-            ai=AISettings(**ai_settings),
-            updated_at=settings_data.get('updated_at'),
-            updated_by=settings_data.get('updated_by')
-        )
+        return _build_settings_response(settings_data)
         
     except Exception as e:
         logger.error(f"[Settings] 설정 조회 실패: {e}")
@@ -113,29 +152,19 @@ async def update_admin_settings(
         
         logger.info(f"[Settings] 관리자 설정 업데이트 by {admin_email}")
         
-        # Get current settings
-        current_settings = await db_provider.get_app_settings() or {}
-        
         # Update admin settings
-        updated_settings = {
-            **current_settings,
-            'admin': {
+        def apply_admin_settings(settings_data: dict) -> None:
+            settings_data['admin'] = {
                 'admin_emails': request.admin_emails
             }
-        }
         
-        # Save to database
-        result = await db_provider.update_app_settings(
-            updated_settings,
+        # Save to database (조회-수정-저장을 한 번에 수행)
+        result = await db_provider.modify_app_settings(
+            apply_admin_settings,
             updated_by=str(user_id)
         )
         
-        return SettingsResponse(
-            admin=AdminSettings(**result.get('admin', {})),
-            ai=AISettings(**result.get('ai', {})),
-            updated_at=result.get('updated_at'),
-            updated_by=result.get('updated_by')
-        )
+        return _construct_settings_response(result)
         
     except Exception as e:
         logger.error(f"[Settings] 관리자 설정 업데이트 실패: {e}")
@@ -166,55 +195,27 @@ async def update_ai_settings(
         
         logger.info(f"[Settings] AI 설정 업데이트 by {admin_email}")
         
-        # Get current settings
-        current_settings = await db_provider.get_app_settings() or {}
-        current_ai = current_settings.get('ai', {})
-        
         # Update AI settings (only provided fields)
-        updated_ai = current_ai.copy()
-        if request.provider_priority is not None:
-            updated_ai['provider_priority'] = request.provider_priority
-        if request.providers is not None:
-            updated_ai['providers'] = [p.model_dump() for p in request.providers]
-        if request.default_timeout is not None:
-            updated_ai['default_timeout'] = request.default_timeout
-        
-        updated_settings = {
-            **current_settings,
-            'ai': updated_ai
-        }
-        
-        # Save to database
-        result = await db_provider.update_app_settings(
-            updated_settings,
+        def apply_ai_settings(settings_data: dict) -> None:
+            updated_ai = settings_data.setdefault('ai', {})
+            if request.provider_priority is not None:
+                updated_ai['provider_priority'] = request.provider_priority
+            if request.providers is not None:
+                updated_ai['providers'] = [p.model_dump() for p in request.providers]
+            if request.default_timeout is not None:
+                updated_ai['default_timeout'] = request.default_timeout
+        
+        # Save to database (조회-수정-저장을 한 번에 수행)
+        result = await db_provider.modify_app_settings(
+            apply_ai_settings,
             updated_by=str(user_id)
         )
         
         # Invalidate orchestrator cache to apply new settings
-        from src.api.routes.readings import invalidate_orchestrator_cache as inv_readings
-        from src.api.routes.readings_stream import invalidate_orchestrator_cache as inv_stream
-        inv_readings()
-        inv_stream()
+        _invalidate_orchestrators()
         logger.info("[Settings] ✓ AI Orchestrator cache invalidated after settings update")
         
-        # Mask API keys in response
-        ai_result = result.get('ai', {})
-        providers = ai_result.get('providers', [])
-        masked_providers = []
-        for provider in providers:
-            masked_provider = provider.copy()
-            api_key = masked_provider.get('api_key', '')
-            if api_key and len(api_key) > 10:
-                masked_provider['api_key'] = f"{api_key[:7]}***{api_key[-4:]}"
-            masked_providers.append(masked_provider)
-        ai_result['providers'] = masked_providers
-        
-        return SettingsResponse(
-            admin=AdminSettings(**result.get('admin', {})),
-            ai=AISettings(**ai_result),
-            updated_at=result.get('updated_at'),
-            updated_by=result.get('updated_by')
-        )
+        return _construct_settings_response(result)
         
     except Exception as e:
         logger.error(f"[Settings] AI 설정 업데이트 실패: {e}")
@@ -281,18 +282,25 @@ async def remove_admin_email(
         admin_email = getattr(current_admin, 'email', 'unknown')
         user_id = getattr(current_admin, 'id', 'unknown')
         
-        # Prevent removing self if last admin
-        admin_emails = await db_provider.get_admin_emails()
-        
-        if email == admin_email and len(admin_emails) <= 1:
-            raise HTTPException(
-                status_code=400,
-                detail="마지막 관리자는 제거할 수 없습니다"
-            )
-        
         logger.info(f"[Settings] 관리자 이메일 제거: {email} by {admin_email}")
         
-        await db_provider.remove_admin_email(email, updated_by=str(user_id))
+        def apply_remove_admin_email(settings_data: dict) -> None:
+            admin_emails = settings_data.setdefault('admin', {}).setdefault('admin_emails', [])
+            if email not in admin_emails:
+                return
+            
+            # Prevent removing the last admin (같은 트랜잭션에서 확인하므로 동시 제거에도 안전)
+            if len(admin_emails) <= 1:
+                raise HTTPException(
+                    status_code=400,
+                    detail="마지막 관리자는 제거할 수 없습니다"
+                )
+            admin_emails.remove(email)
+        
+        await db_provider.modify_app_settings(
+            apply_remove_admin_email,
+            updated_by=str(user_id)
+        )
         
         return {
             "message": f"관리자 이메일 '{email}'이(가) 제거되었습니다",
@@ -330,70 +338,38 @@ async def add_provider(
         
         logger.info(f"[Settings] Provider 추가: {provider.name} by {admin_email}")
         
-        # Get current settings
-        current_settings = await db_provider.get_app_settings() or {}
-        current_ai = current_settings.get('ai', {})
-        providers = current_ai.get('providers', [])
-        
-        # Check for duplicate provider name
-        existing_names = [p.get('name') for p in providers]
-        if provider.name in existing_names:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Provider '{provider.name}'은(는) 이미 존재합니다"
-            )
-        
-        # Add new provider
-        new_provider = provider.model_dump()
-        providers.append(new_provider)
-        
-        # Update AI settings
-        updated_ai = current_ai.copy()
-        updated_ai['providers'] = providers
-        
-        # Add to priority list if not exists
-        provider_priority = updated_ai.get('provider_priority', [])
-        if provider.name not in provider_priority:
-            provider_priority.append(provider.name)
-            updated_ai['provider_priority'] = provider_priority
-        
-        # Save to database
-        updated_settings = {
-            **current_settings,
-            'ai': updated_ai
-        }
-        
-        result = await db_provider.update_app_settings(
-            updated_settings,
+        def apply_add_provider(settings_data: dict) -> None:
+            updated_ai = settings_data.setdefault('ai', {})
+            providers = updated_ai.setdefault('providers', [])
+            
+            # Check for duplicate provider name
+            if any(p.get('name') == provider.name for p in providers):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Provider '{provider.name}'은(는) 이미 존재합니다"
+                )
+            
+            # Add new provider
+            providers.append(provider.model_dump())
+            
+            # Add to priority list if not exists
+            provider_priority = updated_ai.setdefault('provider_priority', [])
+            if provider.name not in provider_priority:
+                provider_priority.append(provider.name)
+        
+        # Save to database (조회-수정-저장을 한 번에 수행)
+        result = await db_provider.modify_app_settings(
+            apply_add_provider,
             updated_by=str(user_id)
         )
         
         # Invalidate orchestrator cache to apply new provider
-        from src.api.routes.readings import invalidate_orchestrator_cache as inv_readings
-        from src.api.routes.readings_stream import invalidate_orchestrator_cache as inv_stream
-        inv_readings()
-        inv_stream()
+        _invalidate_orchestrators()
         logger.info(f"[Settings] ✓ AI Orchestrator cache invalidated after adding provider '{provider.name}'")
         
-        # Mask API keys in response
-        ai_result = result.get('ai', {})
-        masked_providers = []
-        for p in ai_result.get('providers', []):
-            masked_p = p.copy()
-            api_key = masked_p.get('api_key', '')
-            if api_key and len(api_key) > 10:
-                masked_p['api_key'] = f"{api_key[:7]}***{api_key[-4:]}"
-            masked_providers.append(masked_p)
-        ai_result['providers'] = masked_providers
-        
         logger.info(f"[Settings] Provider '{provider.name}' 추가 완료")
         
-        return SettingsResponse(
-            admin=AdminSettings(**result.get('admin', {})),
-            ai=AISettings(**ai_result),
-            updated_at=result.get('updated_at'),
-            updated_by=result.get('updated_by')
-        )
+        return _construct_settings_response(result)
         
     except HTTPException:
         raise
@@ -426,68 +402,39 @@ async def delete_provider(
         
         logger.info(f"[Settings] Provider 삭제: {provider_name} by {admin_email}")
         
-        # Get current settings
-        current_settings = await db_provider.get_app_settings() or {}
-        current_ai = current_settings.get('ai', {})
-        providers = current_ai.get('providers', [])
-        
-        # Find and remove provider
-        original_count = len(providers)
-        providers = [p for p in providers if p.get('name') != provider_name]
-        
-        if len(providers) == original_count:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Provider '{provider_name}'을(를) 찾을 수 없습니다"
-            )
-        
-        # Update AI settings
-        updated_ai = current_ai.copy()
-        updated_ai['providers'] = providers
-        
-        # Remove from priority list
-        provider_priority = updated_ai.get('provider_priority', [])
-        if provider_name in provider_priority:
-            provider_priority.remove(provider_name)
-            updated_ai['provider_priority'] = provider_priority
-        
-        # Save to database
-        updated_settings = {
-            **current_settings,
-            'ai': updated_ai
-        }
-        
-        result = await db_provider.update_app_settings(
-            updated_settings,
+        def apply_delete_provider(settings_data: dict) -> None:
+            updated_ai = settings_data.setdefault('ai', {})
+            providers = updated_ai.get('providers', [])
+            
+            # Find and remove provider
+            remaining = [p for p in providers if p.get('name') != provider_name]
+            
+            if len(remaining) == len(providers):
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Provider '{provider_name}'을(를) 찾을 수 없습니다"
+                )
+            
+            updated_ai['providers'] = remaining
+            
+            # Remove from priority list
+            provider_priority = updated_ai.get('provider_priority', [])
+            if provider_name in provider_priority:
+                provider_priority.remove(provider_name)
+        
+        # Save to database (조회-수정-저장을 한 번에 수행)
+        result = await db_provider.modify_app_settings(
+            apply_delete_provider,
             updated_by=str(user_id)
         )
         
         # Invalidate orchestrator cache after deleting provider
-        from src.api.routes.readings import invalidate_orchestrator_cache as inv_readings
-        from src.api.routes.readings_stream import invalidate_orchestrator_cache as inv_stream
-        inv_readings()
-        inv_stream()
+        _invalidate_orchestrators()
         logger.info(f"[Settings] ✓ AI Orchestrator cache invalidated after deleting provider '{provider_name}'")
         
-        # Mask API keys in response
-        ai_result = result.get('ai', {})
-        masked_providers = []
-        for p in ai_result.get('providers', []):
-            masked_p = p.copy()
-            api_key = masked_p.get('api_key', '')
-            if api_key and len(api_key) > 10:
-                masked_p['api_key'] = f"{api_key[:7]}***{api_key[-4:]}"
-            masked_providers.append(masked_p)
-        ai_result['providers'] = masked_providers
-        
         logger.info(f"[Settings] Provider '{provider_name}' 삭제 완료")
         
-        return SettingsResponse(
-            admin=AdminSettings(**result.get('admin', {})),
-            ai=AISettings(**ai_result),
-            updated_at=result.get('updated_at'),
-            updated_by=result.get('updated_by')
-        )
+        return _construct_settings_response(result)
         
     except HTTPException:
         raise
@@ -520,66 +467,29 @@ async def toggle_provider(
         
         logger.info(f"[Settings] Provider 토글: {provider_name} by {admin_email}")
         
-        # Get current settings
-        current_settings = await db_provider.get_app_settings() or {}
-        current_ai = current_settings.get('ai', {})
-        providers = current_ai.get('providers', [])
-        
-        # Find and toggle provider
-        provider_found = False
-        for provider in providers:
-            if provider.get('name') == provider_name:
-                provider['enabled'] = not provider.get('enabled', True)
-                provider_found = True
-                new_status = "활성화" if provider['enabled'] else "비활성화"
-                logger.info(f"[Settings] Provider '{provider_name}' -> {new_status}")
-                break
+        # 해당 Provider의 enabled 값만 반전해 저장
+        result = await db_provider.toggle_ai_provider(
+            provider_name,
+            updated_by=str(user_id)
+        )
         
-        if not provider_found:
+        if result is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Provider '{provider_name}'을(를) 찾을 수 없습니다"
             )
         
-        # Update AI settings
-        updated_ai = current_ai.copy()
-        updated_ai['providers'] = providers
-        
-        # Save to database
-        updated_settings = {
-            **current_settings,
-            'ai': updated_ai
-        }
-        
-        result = await db_provider.update_app_settings(
-            updated_settings,
-            updated_by=str(user_id)
-        )
+        for provider in result.get('ai', {}).get('providers', []):
+            if provider.get('name') == provider_name:
+                new_status = "활성화" if provider.get('enabled', True) else "비활성화"
+                logger.info("[Settings] Provider '%s' -> %s", provider_name, new_status)
+                break
         
         # Invalidate orchestrator cache after toggling provider
-        from src.api.routes.readings import invalidate_orchestrator_cache as inv_readings
-        from src.api.routes.readings_stream import invalidate_orchestrator_cache as inv_stream
-        inv_readings()
-        inv_stream()
+        _invalidate_orchestrators()
         logger.info(f"[Settings] ✓ AI Orchestrator cache invalidated after toggling provider '{provider_name}'")
         
-        # Mask API keys in response
-        ai_result = result.get('ai', {})
-        masked_providers = []
-        for p in ai_result.get('providers', []):
-            masked_p = p.copy()
-            api_key = masked_p.get('api_key', '')
-            if api_key and len(api_key) > 10:
-                masked_p['api_key'] = f"{api_key[:7]}***{api_key[-4:]}"
-            masked_providers.append(masked_p)
-        ai_result['providers'] = masked_providers
-        
-        return SettingsResponse(
-            admin=AdminSettings(**result.get('admin', {})),
-            ai=AISettings(**ai_result),
-            updated_at=result.get('updated_at'),
-            updated_by=result.get('updated_by')
-        )
+        return _construct_settings_response(result)
         
     except HTTPException:
         raise
@@ -618,68 +528,44 @@ async def update_provider_priority(
             f"[Settings] Provider 우선순위 변경 by {admin_email}: {provider_priority}"
         )
         
-        # Get current settings
-        current_settings = await db_provider.get_app_settings() or {}
-        current_ai = current_settings.get('ai', {})
-        providers = current_ai.get('providers', [])
-        
-        # Validate: all providers in priority list must exist
-        existing_provider_names = {p.get('name') for p in providers}
-        for name in provider_priority:
-            if name not in existing_provider_names:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Provider '{name}'이(가) 존재하지 않습니다"
-                )
-        
-        # Check for duplicate names
-        if len(provider_priority) != len(set(provider_priority)):
-            raise HTTPException(
-                status_code=400,
-                detail="중복된 Provider 이름이 있습니다"
-            )
-        
-        # Update AI settings
-        updated_ai = current_ai.copy()
-        updated_ai['provider_priority'] = provider_priority
-        
-        # Save to database
-        updated_settings = {
-            **current_settings,
-            'ai': updated_ai
-        }
+        def apply_provider_priority(settings_data: dict) -> None:
+            updated_ai = settings_data.setdefault('ai', {})
+            
+            # Validate: 존재하지 않는 이름과 중복된 이름을 한 번에 수집
+            existing_provider_names = {p.get('name') for p in updated_ai.get('providers', [])}
+            seen = set()
+            missing, duplicates = [], []
+            for name in provider_priority:
+                if name in seen:
+                    duplicates.append(name)
+                    continue
+                seen.add(name)
+                if name not in existing_provider_names:
+                    missing.append(name)
+            
+            errors = []
+            if missing:
+                errors.append(f"Provider {', '.join(repr(n) for n in missing)}이(가) 존재하지 않습니다")
+            if duplicates:
+                errors.append(f"중복된 Provider 이름이 있습니다: {', '.join(duplicates)}")
+            if errors:
+                raise HTTPException(status_code=400, detail=" / ".join(errors))
+            
+            updated_ai['provider_priority'] = provider_priority
         
-        result = await db_provider.update_app_settings(
-            updated_settings,
+        # Save to database (조회-수정-저장을 한 번에 수행)
+        result = await db_provider.modify_app_settings(
+            apply_provider_priority,
             updated_by=str(user_id)
         )
         
         # Invalidate orchestrator cache after priority change
-        from src.api.routes.readings import invalidate_orchestrator_cache as inv_readings
-        from src.api.routes.readings_stream import invalidate_orchestrator_cache as inv_stream
-        inv_readings()
-        inv_stream()
+        _invalidate_orchestrators()
         logger.info(f"[Settings] ✓ AI Orchestrator cache invalidated after priority change")
         
-        # Mask API keys in response
-        ai_result = result.get('ai', {})
-        masked_providers = []
-        for p in ai_result.get('providers', []):
-            masked_p = p.copy()
-            api_key = masked_p.get('api_key', '')
-            if api_key and len(api_key) > 10:
-                masked_p['api_key'] = f"{api_key[:7]}***{api_key[-4:]}"
-            masked_providers.append(masked_p)
-        ai_result['providers'] = masked_providers
-        
         logger.info(f"[Settings] Provider 우선순위 변경 완료: {provider_priority}")
         
-        return SettingsResponse(
-            admin=AdminSettings(**result.get('admin', {})),
-            ai=AISettings(**ai_result),
-            updated_at=result.get('updated_at'),
-            updated_by=result.get('updated_by')
-        )
+        return _construct_settings_response(result)
         
     except HTTPException:
         raise
@@ -596,3 +596,11 @@ class AuthOrchestrator:
             metadata["providers"][provider_name] = provider.get_metadata()
 
         return metadata
+
+    async def close_all(self) -> None:
+        """Close all provider HTTP connections"""
+        for provider_name, provider in self.providers.items():
+            try:
+                await provider.close()
+            except Exception as e:
+                logger.warning(f"[AuthOrchestrator] Error closing {provider_name}: {e}")
@@ -21,6 +21,8 @@ from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, List
 import logging
 
+import httpx
+
 from src.auth.models import (
     AuthResponse,
     UserProfile,
@@ -74,6 +76,7 @@ class AuthProvider(ABC):
         self.config = config
         self.timeout = timeout
         self.max_retries = max_retries
+        self._http_client: Optional[httpx.AsyncClient] = None
         self._validate_config()
 
     @property
@@ -361,6 +364,23 @@ class AuthProvider(ABC):
                 provider=self.provider_name
             )
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """
+        Provider 전용 keep-alive HTTP 클라이언트 반환 (최초 사용 시 생성)
+
+        요청마다 새 클라이언트를 만들면 매번 TCP/TLS 핸드셰이크가 발생하므로
+        REST API를 호출하는 Provider는 이 클라이언트를 재사용합니다.
+        """
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(timeout=self.timeout)
+        return self._http_client
+
+    async def close(self) -> None:
+        """HTTP 클라이언트 연결 종료"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(provider={self.provider_name})"
 
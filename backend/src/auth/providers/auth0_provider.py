@@ -6,7 +6,6 @@ Auth0를 사용한 인증 구현
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 import logging
-import httpx
 
 from src.auth.provider import AuthProvider
 from src.auth.models import (
@@ -99,27 +98,27 @@ class Auth0Provider(AuthProvider):
         if self.management_token:
             return self.management_token
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.base_url}/oauth/token",
-                json={
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "audience": f"{self.base_url}/api/v2/",
-                    "grant_type": "client_credentials"
-                }
-            )
+        client = self._get_http_client()
+        response = await client.post(
+            f"{self.base_url}/oauth/token",
+            json={
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "audience": f"{self.base_url}/api/v2/",
+                "grant_type": "client_credentials"
+            }
+        )
 
-            if response.status_code != 200:
-                raise AuthProviderError(
-                    "Failed to get management token",
-                    provider=self.provider_name,
-                    error_type="AUTH_ERROR"
-                )
+        if response.status_code != 200:
+            raise AuthProviderError(
+                "Failed to get management token",
+                provider=self.provider_name,
+                error_type="AUTH_ERROR"
+            )
 
-            data = response.json()
-            self.management_token = data["access_token"]
-            return self.management_token
+        data = response.json()
+        self.management_token = data["access_token"]
+        return self.management_token
 
     async def sign_up(
         self,
@@ -158,33 +157,33 @@ class Auth0Provider(AuthProvider):
                 user_data["name"] = display_name
                 user_data["nickname"] = display_name
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/v2/users",
-                    json=user_data,
-                    headers={"Authorization": f"Bearer {token}"}
+            client = self._get_http_client()
+            response = await client.post(
+                f"{self.base_url}/api/v2/users",
+                json=user_data,
+                headers={"Authorization": f"Bearer {token}"}
+            )
+
+            if response.status_code == 409:
+                raise AuthEmailAlreadyExistsError(
+                    f"Email already exists: {email}",
+                    provider=self.provider_name
                 )
 
-                if response.status_code == 409:
-                    raise AuthEmailAlreadyExistsError(
-                        f"Email already exists: {email}",
+            if response.status_code != 201:
+                error_data = response.json()
+                if "PasswordStrengthError" in str(error_data):
+                    raise AuthWeakPasswordError(
+                        "Password does not meet requirements",
                         provider=self.provider_name
                     )
+                raise AuthProviderError(
+                    f"Failed to create user: {error_data}",
+                    provider=self.provider_name,
+                    error_type="SIGN_UP_ERROR"
+                )
 
-                if response.status_code != 201:
-                    error_data = response.json()
-                    if "PasswordStrengthError" in str(error_data):
-                        raise AuthWeakPasswordError(
-                            "Password does not meet requirements",
-                            provider=self.provider_name
-                        )
-                    raise AuthProviderError(
-                        f"Failed to create user: {error_data}",
-                        provider=self.provider_name,
-                        error_type="SIGN_UP_ERROR"
-                    )
-
-                auth0_user = response.json()
+            auth0_user = response.json()
 
             # Authenticate to get tokens
             auth_response = await self.sign_in(email, password)
@@ -222,35 +221,35 @@ class Auth0Provider(AuthProvider):
         """
         try:
             # Resource Owner Password Grant
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/oauth/token",
-                    json={
-                        "grant_type": "password",
-                        "username": email,
-                        "password": password,
-                        "client_id": self.client_id,
-                        "client_secret": self.client_secret,
-                        "audience": self.audience,
-                        "scope": "openid profile email"
-                    }
-                )
+            client = self._get_http_client()
+            response = await client.post(
+                f"{self.base_url}/oauth/token",
+                json={
+                    "grant_type": "password",
+                    "username": email,
+                    "password": password,
+                    "client_id": self.client_id,
+                    "client_secret": self.client_secret,
+                    "audience": self.audience,
+                    "scope": "openid profile email"
+                }
+            )
 
-                if response.status_code == 403:
-                    raise AuthInvalidCredentialsError(
-                        "Invalid email or password",
-                        provider=self.provider_name
-                    )
+            if response.status_code == 403:
+                raise AuthInvalidCredentialsError(
+                    "Invalid email or password",
+                    provider=self.provider_name
+                )
 
-                if response.status_code != 200:
-                    error_data = response.json()
-                    raise AuthProviderError(
-                        f"Authentication failed: {error_data}",
-                        provider=self.provider_name,
-                        error_type="SIGN_IN_ERROR"
-                    )
+            if response.status_code != 200:
+                error_data = response.json()
+                raise AuthProviderError(
+                    f"Authentication failed: {error_data}",
+                    provider=self.provider_name,
+                    error_type="SIGN_IN_ERROR"
+                )
 
-                token_data = response.json()
+            token_data = response.json()
 
             # Get user info
             user_info_response = await client.get(
@@ -334,33 +333,33 @@ class Auth0Provider(AuthProvider):
             TokenVerificationResult
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/userinfo",
-                    headers={"Authorization": f"Bearer {token}"}
-                )
+            client = self._get_http_client()
+            response = await client.get(
+                f"{self.base_url}/userinfo",
+                headers={"Authorization": f"Bearer {token}"}
+            )
 
-                if response.status_code == 401:
-                    raise AuthInvalidTokenError(
-                        "Invalid or expired token",
-                        provider=self.provider_name
-                    )
+            if response.status_code == 401:
+                raise AuthInvalidTokenError(
+                    "Invalid or expired token",
+                    provider=self.provider_name
+                )
 
-                if response.status_code != 200:
-                    raise AuthProviderError(
-                        "Token verification failed",
-                        provider=self.provider_name,
-                        error_type="VERIFICATION_ERROR"
-                    )
+            if response.status_code != 200:
+                raise AuthProviderError(
+                    "Token verification failed",
+                    provider=self.provider_name,
+                    error_type="VERIFICATION_ERROR"
+                )
 
-                user_info = response.json()
+            user_info = response.json()
 
-                return TokenVerificationResult(
-                    valid=True,
-                    user_id=user_info['sub'],
-                    email=user_info.get('email'),
-                    claims=user_info
-                )
+            return TokenVerificationResult(
+                valid=True,
+                user_id=user_info['sub'],
+                email=user_info.get('email'),
+                claims=user_info
+            )
 
         except (AuthInvalidTokenError, AuthProviderError):
             raise
@@ -384,31 +383,31 @@ class Auth0Provider(AuthProvider):
             New AuthTokens
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/oauth/token",
-                    json={
-                        "grant_type": "refresh_token",
-                        "client_id": self.client_id,
-                        "client_secret": self.client_secret,
-                        "refresh_token": refresh_token
-                    }
-                )
+            client = self._get_http_client()
+            response = await client.post(
+                f"{self.base_url}/oauth/token",
+                json={
+                    "grant_type": "refresh_token",
+                    "client_id": self.client_id,
+                    "client_secret": self.client_secret,
+                    "refresh_token": refresh_token
+                }
+            )
 
-                if response.status_code != 200:
-                    raise AuthInvalidTokenError(
-                        "Invalid or expired refresh token",
-                        provider=self.provider_name
-                    )
+            if response.status_code != 200:
+                raise AuthInvalidTokenError(
+                    "Invalid or expired refresh token",
+                    provider=self.provider_name
+                )
 
-                token_data = response.json()
+            token_data = response.json()
 
-                return AuthTokens(
-                    access_token=token_data['access_token'],
-                    refresh_token=token_data.get('refresh_token', refresh_token),
-                    token_type=token_data.get('token_type', 'Bearer'),
-                    expires_in=token_data.get('expires_in', 3600)
-                )
+            return AuthTokens(
+                access_token=token_data['access_token'],
+                refresh_token=token_data.get('refresh_token', refresh_token),
+                token_type=token_data.get('token_type', 'Bearer'),
+                expires_in=token_data.get('expires_in', 3600)
+            )
 
         except AuthInvalidTokenError:
             raise
@@ -434,28 +433,28 @@ class Auth0Provider(AuthProvider):
         try:
             token = await self._get_management_token()
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/api/v2/users/{user_id}",
-                    headers={"Authorization": f"Bearer {token}"}
-                )
+            client = self._get_http_client()
+            response = await client.get(
+                f"{self.base_url}/api/v2/users/{user_id}",
+                headers={"Authorization": f"Bearer {token}"}
+            )
 
-                if response.status_code == 404:
-                    raise AuthUserNotFoundError(
-                        f"User not found: {user_id}",
-                        provider=self.provider_name
-                    )
+            if response.status_code == 404:
+                raise AuthUserNotFoundError(
+                    f"User not found: {user_id}",
+                    provider=self.provider_name
+                )
 
-                if response.status_code != 200:
-                    raise AuthProviderError(
-                        "Failed to get user",
-                        provider=self.provider_name,
-                        error_type="GET_USER_ERROR"
-                    )
+            if response.status_code != 200:
+                raise AuthProviderError(
+                    "Failed to get user",
+                    provider=self.provider_name,
+                    error_type="GET_USER_ERROR"
+                )
 
-                auth0_user = response.json()
+            auth0_user = response.json()
 
-                return self._auth0_user_to_profile(auth0_user)
+            return self._auth0_user_to_profile(auth0_user)
 
         except (AuthUserNotFoundError, AuthProviderError):
             raise
@@ -496,30 +495,30 @@ class Auth0Provider(AuthProvider):
             if photo_url is not None:
                 update_data["picture"] = photo_url
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.patch(
-                    f"{self.base_url}/api/v2/users/{user_id}",
-                    json=update_data,
-                    headers={"Authorization": f"Bearer {token}"}
-                )
+            client = self._get_http_client()
+            response = await client.patch(
+                f"{self.base_url}/api/v2/users/{user_id}",
+                json=update_data,
+                headers={"Authorization": f"Bearer {token}"}
+            )
 
-                if response.status_code == 404:
-                    raise AuthUserNotFoundError(
-                        f"User not found: {user_id}",
-                        provider=self.provider_name
-                    )
+            if response.status_code == 404:
+                raise AuthUserNotFoundError(
+                    f"User not found: {user_id}",
+                    provider=self.provider_name
+                )
 
-                if response.status_code != 200:
-                    raise AuthProviderError(
-                        "Failed to update user",
-                        provider=self.provider_name,
-                        error_type="UPDATE_USER_ERROR"
-                    )
+            if response.status_code != 200:
+                raise AuthProviderError(
+                    "Failed to update user",
+                    provider=self.provider_name,
+                    error_type="UPDATE_USER_ERROR"
+                )
 
-                auth0_user = response.json()
-                logger.info(f"[Auth0] Updated user: {user_id}")
+            auth0_user = response.json()
+            logger.info(f"[Auth0] Updated user: {user_id}")
 
-                return self._auth0_user_to_profile(auth0_user)
+            return self._auth0_user_to_profile(auth0_user)
 
         except (AuthUserNotFoundError, AuthProviderError):
             raise
@@ -545,27 +544,27 @@ class Auth0Provider(AuthProvider):
         try:
             token = await self._get_management_token()
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.delete(
-                    f"{self.base_url}/api/v2/users/{user_id}",
-                    headers={"Authorization": f"Bearer {token}"}
-                )
+            client = self._get_http_client()
+            response = await client.delete(
+                f"{self.base_url}/api/v2/users/{user_id}",
+                headers={"Authorization": f"Bearer {token}"}
+            )
 
-                if response.status_code == 404:
-                    raise AuthUserNotFoundError(
-                        f"User not found: {user_id}",
-                        provider=self.provider_name
-                    )
+            if response.status_code == 404:
+                raise AuthUserNotFoundError(
+                    f"User not found: {user_id}",
+                    provider=self.provider_name
+                )
 
-                if response.status_code != 204:
-                    raise AuthProviderError(
-                        "Failed to delete user",
-                        provider=self.provider_name,
-                        error_type="DELETE_USER_ERROR"
-                    )
+            if response.status_code != 204:
+                raise AuthProviderError(
+                    "Failed to delete user",
+                    provider=self.provider_name,
+                    error_type="DELETE_USER_ERROR"
+                )
 
-                logger.info(f"[Auth0] Deleted user: {user_id}")
-                return True
+            logger.info(f"[Auth0] Deleted user: {user_id}")
+            return True
 
         except (AuthUserNotFoundError, AuthProviderError):
             raise
@@ -589,26 +588,26 @@ class Auth0Provider(AuthProvider):
             bool: Success status
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/dbconnections/change_password",
-                    json={
-                        "client_id": self.client_id,
-                        "email": email,
-                        "connection": self.connection
-                    }
-                )
+            client = self._get_http_client()
+            response = await client.post(
+                f"{self.base_url}/dbconnections/change_password",
+                json={
+                    "client_id": self.client_id,
+                    "email": email,
+                    "connection": self.connection
+                }
+            )
 
-                if response.status_code != 200:
-                    error_data = response.json()
-                    raise AuthProviderError(
-                        f"Failed to send password reset email: {error_data}",
-                        provider=self.provider_name,
-                        error_type="RESET_PASSWORD_ERROR"
-                    )
+            if response.status_code != 200:
+                error_data = response.json()
+                raise AuthProviderError(
+                    f"Failed to send password reset email: {error_data}",
+                    provider=self.provider_name,
+                    error_type="RESET_PASSWORD_ERROR"
+                )
 
-                logger.info(f"[Auth0] Password reset email sent to: {email}")
-                return True
+            logger.info(f"[Auth0] Password reset email sent to: {email}")
+            return True
 
         except AuthProviderError:
             raise
@@ -483,26 +483,26 @@ class FirebaseAuthProvider(AuthProvider):
         try:
             url = f"https://identitytoolkit.googleapis.com/v1/accounts:sendOobCode?key={self.api_key}"
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    url,
-                    json={
-                        "requestType": "PASSWORD_RESET",
-                        "email": email
-                    }
-                )
+            client = self._get_http_client()
+            response = await client.post(
+                url,
+                json={
+                    "requestType": "PASSWORD_RESET",
+                    "email": email
+                }
+            )
 
-                if response.status_code == 200:
-                    logger.info(f"[Firebase] Password reset email sent to: {email}")
-                    return True
-                else:
-                    error_data = response.json()
-                    logger.error(f"[Firebase] Password reset failed: {error_data}")
-                    raise AuthProviderError(
-                        f"Password reset failed: {error_data.get('error', {}).get('message', 'Unknown error')}",
-                        provider=self.provider_name,
-                        error_type="PASSWORD_RESET_FAILED"
-                    )
+            if response.status_code == 200:
+                logger.info(f"[Firebase] Password reset email sent to: {email}")
+                return True
+            else:
+                error_data = response.json()
+                logger.error(f"[Firebase] Password reset failed: {error_data}")
+                raise AuthProviderError(
+                    f"Password reset failed: {error_data.get('error', {}).get('message', 'Unknown error')}",
+                    provider=self.provider_name,
+                    error_type="PASSWORD_RESET_FAILED"
+                )
 
         except httpx.HTTPError as e:
             logger.error(f"[Firebase] HTTP error during password reset: {e}")
@@ -554,40 +554,40 @@ class FirebaseAuthProvider(AuthProvider):
         try:
             url = f"https://identitytoolkit.googleapis.com/v1/accounts:resetPassword?key={self.api_key}"
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    url,
-                    json={
-                        "oobCode": reset_code,
-                        "newPassword": new_password
-                    }
-                )
+            client = self._get_http_client()
+            response = await client.post(
+                url,
+                json={
+                    "oobCode": reset_code,
+                    "newPassword": new_password
+                }
+            )
+
+            if response.status_code == 200:
+                logger.info("[Firebase] Password reset confirmed successfully")
+                return True
+            else:
+                error_data = response.json()
+                error_message = error_data.get('error', {}).get('message', 'Unknown error')
+
+                logger.error(f"[Firebase] Password reset confirmation failed: {error_message}")
 
-                if response.status_code == 200:
-                    logger.info("[Firebase] Password reset confirmed successfully")
-                    return True
+                # Firebase specific error codes
+                if 'EXPIRED_OOB_CODE' in error_message or 'INVALID_OOB_CODE' in error_message:
+                    raise AuthTokenExpiredError(
+                        "Password reset link has expired or is invalid",
+                        provider=self.provider_name
+                    )
+                elif 'WEAK_PASSWORD' in error_message:
+                    raise AuthWeakPasswordError(
+                        "Password is too weak",
+                        provider=self.provider_name
+                    )
                 else:
-                    error_data = response.json()
-                    error_message = error_data.get('error', {}).get('message', 'Unknown error')
-
-                    logger.error(f"[Firebase] Password reset confirmation failed: {error_message}")
-
-                    # Firebase specific error codes
-                    if 'EXPIRED_OOB_CODE' in error_message or 'INVALID_OOB_CODE' in error_message:
-                        raise AuthTokenExpiredError(
-                            "Password reset link has expired or is invalid",
-                            provider=self.provider_name
-                        )
-                    elif 'WEAK_PASSWORD' in error_message:
-                        raise AuthWeakPasswordError(
-                            "Password is too weak",
-                            provider=self.provider_name
-                        )
-                    else:
-                        raise AuthInvalidTokenError(
-                            f"Password reset failed: {error_message}",
-                            provider=self.provider_name
-                        )
+                    raise AuthInvalidTokenError(
+                        f"Password reset failed: {error_message}",
+                        provider=self.provider_name
+                    )
 
         except (AuthTokenExpiredError, AuthWeakPasswordError, AuthInvalidTokenError):
             raise
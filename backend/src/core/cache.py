@@ -9,6 +9,7 @@ Redis 캐시 설정 및 유틸리티 모듈
 
 주요 기능:
 - get/set/delete: 기본 캐시 CRUD 작업
+- publish/subscribe: 인스턴스 간 캐시 무효화 알림
 - cached 데코레이터: 함수 결과 자동 캐싱
 - hash_key: 함수 인자를 해시하여 캐시 키 생성
 """
@@ -100,6 +101,61 @@ class RedisCache:
             print(f"Redis DELETE error: {e}")
             return False
 
+    def publish(self, channel: str, message: str) -> bool:
+        """
+        Publish a message to a Redis pub/sub channel
+
+        Args:
+            channel: Channel name
+            message: Message payload
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            self.redis_client.publish(channel, message)
+            return True
+        except Exception as e:
+            print(f"Redis PUBLISH error: {e}")
+            return False
+
+    def subscribe(
+        self,
+        channel: str,
+        handler: Callable[[dict], None],
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ):
+        """
+        Subscribe to a Redis pub/sub channel on a background daemon thread
+
+        Args:
+            channel: Channel name
+            handler: Called with each message dict (from the worker thread)
+            on_error: Called once if the subscription connection fails;
+                the worker thread is stopped afterwards
+
+        Returns:
+            Worker thread (check is_alive()), or None if subscribing failed
+        """
+        def _exception_handler(ex, pubsub, thread):
+            print(f"Redis SUBSCRIBE error: {ex}")
+            thread.stop()
+            pubsub.close()
+            if on_error is not None:
+                on_error(ex)
+
+        try:
+            pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{channel: handler})
+            return pubsub.run_in_thread(
+                sleep_time=1.0,
+                daemon=True,
+                exception_handler=_exception_handler,
+            )
+        except Exception as e:
+            print(f"Redis SUBSCRIBE error: {e}")
+            return None
+
     def exists(self, key: str) -> bool:
         """
         Check if key exists in cache
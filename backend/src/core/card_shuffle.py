@@ -18,7 +18,8 @@
 - TASK-014 요구사항 충족
 """
 import random
-from dataclasses import dataclass
+import weakref
+from dataclasses import dataclass, field
 from typing import List, Optional, Tuple, Any
 from enum import Enum
 
@@ -59,8 +60,15 @@ class CardData:
     image_url: Optional[str]
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
+    _dict_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict:
+        """딕셔너리 변환 (결과는 인스턴스에 캐시되므로 읽기 전용으로 사용)"""
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return self._dict_cache
+
+    def _build_dict(self) -> dict:
         return {
             "id": self.id,
             "name": self.name,
@@ -80,6 +88,11 @@ class CardData:
         }
 
 
+# 프로바이더 카드 캐시가 돌려주는 CardDTO -> 변환된 CardData
+# 카드 수정으로 프로바이더 캐시가 무효화되면 DTO가 해제되면서 항목도 함께 사라짐
+_card_data_cache: "weakref.WeakKeyDictionary[CardDTO, CardData]" = weakref.WeakKeyDictionary()
+
+
 class DrawnCard:
     """
     선택된 카드 정보를 담는 클래스
@@ -88,6 +101,9 @@ class DrawnCard:
     타로 리딩에서 실제로 사용되는 카드 표현 형식입니다.
     """
 
+    # 리딩마다 카드 수만큼 생성되는 단순 전달 객체이므로 인스턴스 __dict__를 두지 않음
+    __slots__ = ("card", "orientation", "is_reversed")
+
     def __init__(self, card: CardData, orientation: Orientation):
         """
         Args:
@@ -107,6 +123,11 @@ class DrawnCard:
         }
 
 
+# 역방향 30% 확률 (random.choices 누적 가중치)
+_ORIENTATIONS = (Orientation.REVERSED, Orientation.UPRIGHT)
+_ORIENTATION_CUM_WEIGHTS = (0.3, 1.0)
+
+
 class CardShuffleService:
     """
     Service for card shuffling and drawing operations
@@ -165,12 +186,11 @@ class CardShuffleService:
             )
 
         # Assign random orientation to each card (30% chance for reversed)
-        drawn_cards = []
-        for card in card_data_list:
-            orientation = CardShuffleService._random_orientation()
-            drawn_cards.append(DrawnCard(card, orientation))
-
-        return drawn_cards
+        orientations = CardShuffleService._random_orientations(len(card_data_list))
+        return [
+            DrawnCard(card, orientation)
+            for card, orientation in zip(card_data_list, orientations)
+        ]
 
     @staticmethod
     def _random_orientation() -> Orientation:
@@ -182,6 +202,16 @@ class CardShuffleService:
         """
         return Orientation.REVERSED if random.random() < 0.3 else Orientation.UPRIGHT
 
+    @staticmethod
+    def _random_orientations(count: int) -> List[Orientation]:
+        """
+        Determine orientations for `count` cards in a single random.choices call
+
+        Returns:
+            List of Orientation (each REVERSED with 30% probability)
+        """
+        return random.choices(_ORIENTATIONS, cum_weights=_ORIENTATION_CUM_WEIGHTS, k=count)
+
     @staticmethod
     async def shuffle_and_draw(
         db: Optional[Session],
@@ -261,7 +291,15 @@ class CardShuffleService:
 
     @staticmethod
     def _convert_provider_card(card: CardDTO) -> CardData:
-        """Database provider CardDTO -> 공용 CardData"""
+        """Database provider CardDTO -> 공용 CardData (같은 DTO는 변환 결과 재사용)"""
+        card_data = _card_data_cache.get(card)
+        if card_data is None:
+            card_data = CardShuffleService._build_provider_card(card)
+            _card_data_cache[card] = card_data
+        return card_data
+
+    @staticmethod
+    def _build_provider_card(card: CardDTO) -> CardData:
         return CardData(
             id=card.id,
             name=card.name_en,
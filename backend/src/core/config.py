@@ -62,6 +62,9 @@ class Settings(BaseSettings):
     AI_PROVIDER_PRIORITY: str = "openai,anthropic,gemini"
     AI_PROVIDER_TIMEOUT: int = 30  # seconds per provider (reduced from 60s for faster responses)
     AI_REQUEST_TIMEOUT: int = 90  # seconds total request timeout (reduced from 180s)
+    AI_CACHE_ENABLED: bool = True  # Cache parsed readings in Redis (keyed by prompt + model)
+    AI_CACHE_TTL: int = 86400  # seconds (24 hours)
+    MAX_CONCURRENT_STREAMS: int = 20  # SSE 리딩 동시 생성 수 (초과 요청은 대기열에서 순서대로 처리)
 
     # Prompt Settings
     PROMPT_LANGUAGE: str = "en"  # en | ko - Language for LLM prompts (English is more token-efficient)
@@ -78,6 +81,11 @@ class Settings(BaseSettings):
     # Database Provider Selection
     DATABASE_PROVIDER: str = "firestore"  # firestore | postgresql
 
+    # Transactional Outbox (PostgreSQL only) - 도메인 이벤트를 Redis Stream으로 발행
+    OUTBOX_RELAY_ENABLED: bool = True
+    OUTBOX_POLL_INTERVAL: float = 2.0  # seconds between polls when the outbox is empty
+    OUTBOX_BATCH_SIZE: int = 100
+
     # Firebase Configuration
     FIREBASE_API_KEY: Optional[str] = None  # Firebase Web API Key for REST API
     FIREBASE_CREDENTIALS_PATH: Optional[str] = None  # Path to Firebase Admin SDK JSON file (optional)
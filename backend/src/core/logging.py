@@ -1,12 +1,14 @@
 """
 Logging configuration for the application
 """
+import atexit
 import logging
 import logging.handlers
 import json
+import queue
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 from datetime import datetime
 from src.core.config import settings
 
@@ -79,6 +81,36 @@ class ColoredFormatter(logging.Formatter):
         return formatted
 
 
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a same-process queue
+
+    The stock prepare() pre-formats the record and drops exc_info so it can
+    be pickled; records here never leave the process, so only the message
+    is merged (args may be mutated later) and the exception info is kept
+    for the JSON formatter.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """현재 QueueListener를 멈추고 남은 로그를 비움 (종료 시 한 번만 등록)"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 def setup_logging() -> None:
     """
     Setup application logging configuration
@@ -87,17 +119,23 @@ def setup_logging() -> None:
     - Console handler with colored output (DEBUG level)
     - File handler with rotation (INFO level)
     - JSON file handler for structured logs (WARNING level)
+
+    Handlers run on a QueueListener thread so console/file I/O never blocks
+    the event loop; the root level follows the lowest handler level so
+    records nobody would emit (e.g. DEBUG in production) are not created.
     """
+    global _queue_listener
     # Create logs directory if it doesn't exist
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
 
     # Get root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)
+    root_logger.setLevel(logging.DEBUG if settings.DEBUG else logging.INFO)
 
     # Remove existing handlers to avoid duplicates
     root_logger.handlers.clear()
+    _stop_queue_listener()
 
     # Console Handler (colored, DEBUG level)
     console_handler = logging.StreamHandler(sys.stdout)
@@ -107,7 +145,6 @@ def setup_logging() -> None:
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
 
     # File Handler with rotation (INFO level)
     file_handler = logging.handlers.RotatingFileHandler(
@@ -122,7 +159,6 @@ def setup_logging() -> None:
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
 
     # JSON File Handler (WARNING level, structured logs)
     json_handler = logging.handlers.RotatingFileHandler(
@@ -133,7 +169,18 @@ def setup_logging() -> None:
     )
     json_handler.setLevel(logging.WARNING)
     json_handler.setFormatter(JSONFormatter())
-    root_logger.addHandler(json_handler)
+
+    # Route all records through a queue; the listener thread does the I/O
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(_InProcessQueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        json_handler,
+        respect_handler_level=True,
+    )
+    _queue_listener.start()
 
     # Set log levels for third-party libraries
     logging.getLogger("uvicorn").setLevel(logging.INFO)
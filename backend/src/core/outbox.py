@@ -0,0 +1,128 @@
+"""
+Transactional Outbox 릴레이 모듈
+
+이 모듈의 목적:
+- 도메인 쓰기와 같은 트랜잭션에 기록된 outbox 이벤트를 비동기로 발행
+- 후속 작업(분석, AI 튜닝 파이프라인 알림)을 요청 처리 경로에서 분리
+- 이벤트 발행과 DB 쓰기의 원자성 보장 (커밋된 쓰기만 이벤트가 됨)
+
+발행 방식:
+- 배치를 DB에서 선점(claimed_until)해 여러 인스턴스가 같은 이벤트를 중복 발행하지 않음
+- 이벤트 타입별 Redis Stream(events:<event_type>)에 XADD
+- 발행 성공 후 processed_at 기록 (at-least-once, 소비자는 event id로 중복 제거)
+- Redis 오류 시 선점을 해제해 다음 폴링에서 재시도 (종료된 인스턴스의 선점은 기한 후 재선점)
+"""
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from src.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from src.database.provider import DatabaseProvider
+
+logger = get_logger(__name__)
+
+# 이벤트 타입
+FEEDBACK_CREATED_EVENT = "feedback.created"
+
+OUTBOX_STREAM_PREFIX = "events:"
+OUTBOX_STREAM_MAXLEN = 10000
+# 발행이 끝나지 않은 선점을 다른 인스턴스가 가져가기까지의 시간
+OUTBOX_CLAIM_LEASE_SECONDS = 60.0
+
+
+class OutboxRelay:
+    """
+    미발행 outbox 이벤트를 주기적으로 Redis Stream에 발행하는 백그라운드 작업
+
+    앱 lifespan에서 start()/stop()으로 관리합니다.
+    """
+
+    def __init__(
+        self,
+        db_provider: "DatabaseProvider",
+        redis_client: Any,
+        poll_interval: float = 2.0,
+        batch_size: int = 100,
+        claim_lease: float = OUTBOX_CLAIM_LEASE_SECONDS,
+    ):
+        self.db_provider = db_provider
+        self.redis_client = redis_client
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.claim_lease = claim_lease
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """릴레이 백그라운드 태스크 시작"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="outbox-relay")
+            logger.info("[Outbox] Relay started (poll_interval=%.1fs)", self.poll_interval)
+
+    async def stop(self) -> None:
+        """릴레이 종료 (진행 중인 배치는 취소)"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("[Outbox] Relay stopped")
+
+    async def relay_once(self) -> int:
+        """
+        미발행 이벤트 한 배치 발행
+
+        Returns:
+            발행된 이벤트 수
+        """
+        events = await self.db_provider.claim_outbox_events(
+            limit=self.batch_size,
+            lease_seconds=self.claim_lease,
+        )
+        if not events:
+            return 0
+
+        event_ids = [event["id"] for event in events]
+        try:
+            await asyncio.to_thread(self._publish, events)
+        except Exception:
+            # 선점을 풀어 다음 폴링에서 다시 발행 (해제도 실패하면 선점 기한 후 재시도)
+            await self.db_provider.release_outbox_events(event_ids)
+            raise
+        await self.db_provider.mark_outbox_events_processed(event_ids)
+        return len(events)
+
+    def _publish(self, events: List[Dict[str, Any]]) -> None:
+        """이벤트 배치를 하나의 파이프라인(단일 라운드트립)으로 XADD"""
+        pipe = self.redis_client.pipeline(transaction=False)
+        for event in events:
+            pipe.xadd(
+                f"{OUTBOX_STREAM_PREFIX}{event['event_type']}",
+                {
+                    "event_id": event["id"],
+                    "event_type": event["event_type"],
+                    "payload": json.dumps(event["payload"], ensure_ascii=False),
+                },
+                maxlen=OUTBOX_STREAM_MAXLEN,
+                approximate=True,
+            )
+        pipe.execute()
+
+    async def _run(self) -> None:
+        """폴링 루프: 배치가 가득 차면 바로 다음 배치, 비어 있으면 대기"""
+        while True:
+            try:
+                published = await self.relay_once()
+                if published:
+                    logger.debug("[Outbox] Published %d event(s)", published)
+                if published >= self.batch_size:
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("[Outbox] Relay batch failed, will retry: %s", e)
+            await asyncio.sleep(self.poll_interval)
@@ -5,8 +5,10 @@ Firebase Firestore를 사용하는 DatabaseProvider 구현체
 
 Phase 2 Optimization: Added in-memory card caching
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Callable
 from datetime import datetime, timezone
+import asyncio
+import copy
 import random
 import uuid
 import time
@@ -14,6 +16,8 @@ import time
 from firebase_admin import firestore
 from google.cloud.firestore_v1 import FieldFilter
 
+from src.core.cache import cache
+
 from .provider import (
     DatabaseProvider,
     Card as CardDTO,
@@ -25,6 +29,10 @@ from .provider import (
 )
 
 
+# 설정 변경 시 모든 인스턴스의 앱 설정 캐시를 비우기 위한 Redis pub/sub 채널
+SETTINGS_INVALIDATION_CHANNEL = "settings:invalidate"
+
+
 class FirestoreProvider(DatabaseProvider):
     """
     Firestore 데이터베이스 Provider
@@ -52,6 +60,17 @@ class FirestoreProvider(DatabaseProvider):
         self._cache_timestamp: float = 0
         self._cache_ttl: int = 3600  # 1 hour TTL (cards don't change often)
 
+        # 앱 설정 캐시: 관리자 확인 등 읽기가 잦고 변경은 드묾
+        # 변경 시 Redis pub/sub으로 모든 인스턴스에 무효화를 알리며,
+        # 구독이 살아 있지 않으면 다른 인스턴스의 변경을 놓칠 수 있으므로 캐시를 사용하지 않음
+        self._settings_cache: Optional[Dict[str, Any]] = None
+        self._settings_cache_timestamp: float = 0
+        self._settings_cache_ttl: int = 60
+        self._settings_cache_generation: int = 0
+        # 생성 시 한 번 구독하고, 끊긴 경우 재구독은 _ensure_settings_subscriber가 스레드에서 시도
+        self._settings_subscribe_attempted_at: float = time.time()
+        self._settings_subscriber = self._subscribe_settings_invalidation()
+
     # ==================== Conversion Methods ====================
 
     def _doc_to_card_dto(self, doc) -> CardDTO:
@@ -156,6 +175,15 @@ class FirestoreProvider(DatabaseProvider):
 
         return None
 
+    async def get_cards_by_ids(self, card_ids: List[int]) -> Dict[int, CardDTO]:
+        """여러 카드를 ID로 한 번에 조회 (캐시된 덱 사용, 캐시 미스 시 컬렉션 1회 조회)"""
+        if not card_ids:
+            return {}
+
+        wanted = set(card_ids)
+        all_cards = await self.get_all_cards_cached()
+        return {card.id: card for card in all_cards if card.id in wanted}
+
     async def get_card_by_name(self, name: str) -> Optional[CardDTO]:
         """이름으로 카드 조회"""
         # Try English name first
@@ -365,6 +393,7 @@ class FirestoreProvider(DatabaseProvider):
         batch.set(doc_ref, reading_doc_data)
 
         cards = reading_data.get('cards', [])
+        card_entries: List[Dict[str, Any]] = []
         for index, card_data in enumerate(cards):
             card_ref = doc_ref.collection('reading_cards').document()
             card_payload = {
@@ -374,11 +403,32 @@ class FirestoreProvider(DatabaseProvider):
                 'updated_at': firestore.SERVER_TIMESTAMP,
             }
             batch.set(card_ref, card_payload)
+            card_entries.append({**card_data, 'order_index': index, 'id': card_ref.id})
 
         batch.commit()
 
-        doc = doc_ref.get()
-        return self._doc_to_reading_dto(doc)
+        # 방금 쓴 데이터로 DTO 구성 (문서와 reading_cards 서브컬렉션을 다시 읽지 않음)
+        # SERVER_TIMESTAMP는 커밋 시각으로 채워지므로 batch.commit_time과 동일
+        commit_time = batch.commit_time
+        for card_entry in card_entries:
+            card_entry['created_at'] = commit_time
+            card_entry['updated_at'] = commit_time
+
+        return ReadingDTO(
+            id=reading_id,
+            user_id=reading_doc_data['user_id'],
+            question=reading_doc_data['question'],
+            spread_type=reading_doc_data['spread_type'],
+            category=reading_doc_data['category'],
+            cards=card_entries,
+            card_relationships=reading_doc_data['card_relationships'],
+            overall_reading=reading_doc_data['overall_reading'],
+            advice=reading_doc_data['advice'],
+            summary=reading_doc_data['summary'],
+            llm_usage=reading_doc_data['llm_usage'],
+            created_at=created_at or commit_time,
+            updated_at=updated_at or commit_time,
+        )
 
     async def get_reading_by_id(self, reading_id: str) -> Optional[ReadingDTO]:
         """ID로 리딩 조회"""
@@ -390,6 +440,11 @@ class FirestoreProvider(DatabaseProvider):
 
         return self._doc_to_reading_dto(doc)
 
+    async def reading_exists(self, reading_id: str) -> bool:
+        """리딩 존재 여부 확인 (단일 필드만 조회)"""
+        doc = self.readings_collection.document(reading_id).get(field_paths=['user_id'])
+        return doc.exists
+
     async def get_readings_by_user(
         self,
         user_id: str,
@@ -399,6 +454,16 @@ class FirestoreProvider(DatabaseProvider):
         category: Optional[str] = None,
     ) -> List[ReadingDTO]:
         """사용자별 리딩 목록 조회"""
+        query = self._user_readings_query(user_id, spread_type, category)
+        return self._fetch_readings_page(query, skip, limit)
+
+    def _user_readings_query(
+        self,
+        user_id: str,
+        spread_type: Optional[str] = None,
+        category: Optional[str] = None,
+    ):
+        """사용자별 리딩 조회 쿼리 (필터 적용, 정렬/페이지네이션 전)"""
         query = self.readings_collection.where(
             filter=FieldFilter('user_id', '==', user_id)
         )
@@ -408,16 +473,63 @@ class FirestoreProvider(DatabaseProvider):
             query = query.where(filter=FieldFilter('spread_type', '==', spread_type))
         if category:
             query = query.where(filter=FieldFilter('category', '==', category))
+        return query
 
-        # Order by created_at descending
+    def _fetch_readings_page(self, query, skip: int, limit: int) -> List[ReadingDTO]:
+        """created_at 내림차순으로 한 페이지 조회"""
         query = query.order_by('created_at', direction=firestore.Query.DESCENDING)
+        docs = query.offset(skip).limit(limit).stream()
+        return [self._doc_to_reading_dto(doc) for doc in docs]
 
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
+    async def get_readings_by_user_after(
+        self,
+        user_id: str,
+        after_created_at: datetime,
+        after_id: str,
+        limit: int = 100,
+        spread_type: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> List[ReadingDTO]:
+        """
+        사용자별 리딩 키셋 조회 ((created_at, 문서 ID) 커서 값 기준 start_after, offset 스캔 없음)
 
-        docs = query.stream()
+        커서 문서를 다시 읽지 않으므로 추가 조회가 없고, 커서 리딩이 삭제되어도 다음 페이지를 반환합니다.
+        정렬은 첫 페이지의 암묵적 순서(created_at DESC, __name__ DESC)와 같습니다.
+        """
+        query = self._user_readings_query(user_id, spread_type, category)
+        query = query.order_by('created_at', direction=firestore.Query.DESCENDING)
+        query = query.order_by('__name__', direction=firestore.Query.DESCENDING)
+        docs = query.start_after({
+            'created_at': after_created_at,
+            '__name__': after_id,
+        }).limit(limit).stream()
         return [self._doc_to_reading_dto(doc) for doc in docs]
 
+    @staticmethod
+    def _count_query(query) -> int:
+        """쿼리 결과 문서 수"""
+        return sum(1 for _ in query.stream())
+
+    async def get_readings_by_user_paginated(
+        self,
+        user_id: str,
+        skip: int = 0,
+        limit: int = 100,
+        spread_type: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> Tuple[List[ReadingDTO], int]:
+        """
+        사용자별 리딩 목록 + 전체 수 조회
+
+        Firestore 클라이언트는 동기 호출이므로 목록/개수 쿼리를 각각 스레드에서 동시에 실행
+        """
+        query = self._user_readings_query(user_id, spread_type, category)
+        readings, total = await asyncio.gather(
+            asyncio.to_thread(self._fetch_readings_page, query, skip, limit),
+            asyncio.to_thread(self._count_query, query),
+        )
+        return readings, total
+
     async def get_total_readings_count(
         self,
         user_id: str,
@@ -425,19 +537,8 @@ class FirestoreProvider(DatabaseProvider):
         category: Optional[str] = None,
     ) -> int:
         """사용자별 전체 리딩 수 조회"""
-        query = self.readings_collection.where(
-            filter=FieldFilter('user_id', '==', user_id)
-        )
-
-        # Apply filters
-        if spread_type:
-            query = query.where(filter=FieldFilter('spread_type', '==', spread_type))
-        if category:
-            query = query.where(filter=FieldFilter('category', '==', category))
-
-        # Count documents
-        docs = query.stream()
-        return sum(1 for _ in docs)
+        query = self._user_readings_query(user_id, spread_type, category)
+        return self._count_query(query)
 
     async def update_reading(self, reading_id: str, reading_data: Dict[str, Any]) -> ReadingDTO:
         """리딩 수정"""
@@ -864,25 +965,93 @@ class FirestoreProvider(DatabaseProvider):
     # ==================== Settings Operations ====================
 
     async def get_app_settings(self) -> Optional[Dict[str, Any]]:
-        """애플리케이션 설정 조회"""
+        """
+        애플리케이션 설정 조회 (캐시 사용)
+
+        호출자가 반환값을 수정해도 캐시에 영향이 없도록 복사본을 반환합니다.
+        """
+        return copy.deepcopy(await self._get_cached_app_settings())
+
+    async def _get_cached_app_settings(self) -> Dict[str, Any]:
+        """캐시된 설정 원본 반환 (만료 시 Firestore에서 다시 조회, 수정 금지)"""
+        if not await self._ensure_settings_subscriber():
+            # 인스턴스 간 무효화를 받을 수 없으면 항상 최신 설정을 조회
+            return await self._fetch_app_settings()
+
+        now = time.time()
+        if self._settings_cache is not None and (now - self._settings_cache_timestamp < self._settings_cache_ttl):
+            return self._settings_cache
+
+        # 조회 중 무효화 알림이 도착하면 조회 결과가 이미 오래된 것일 수 있으므로 캐시하지 않음
+        generation = self._settings_cache_generation
+        settings = await self._fetch_app_settings()
+        if generation == self._settings_cache_generation:
+            self._settings_cache = settings
+            self._settings_cache_timestamp = now
+        return settings
+
+    async def _ensure_settings_subscriber(self) -> bool:
+        """
+        설정 무효화 채널 구독이 살아 있는지 확인 (끊긴 경우 TTL 간격으로 재구독 시도)
+
+        재구독은 동기 pub/sub 연결이므로 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+        """
+        subscriber = self._settings_subscriber
+        if subscriber is not None and subscriber.is_alive():
+            return True
+
+        now = time.time()
+        if now - self._settings_subscribe_attempted_at < self._settings_cache_ttl:
+            return False
+        self._settings_subscribe_attempted_at = now
+
+        self._settings_subscriber = await asyncio.to_thread(self._subscribe_settings_invalidation)
+        return self._settings_subscriber is not None
+
+    def _subscribe_settings_invalidation(self):
+        """설정 무효화 채널 구독 시작 (Redis 사용 불가 시 None)"""
+        self._clear_settings_cache()
+        return cache.subscribe(
+            SETTINGS_INVALIDATION_CHANNEL,
+            lambda message: self._clear_settings_cache(),
+            on_error=lambda error: self._clear_settings_cache(),
+        )
+
+    @staticmethod
+    def _default_app_settings() -> Dict[str, Any]:
+        """설정 문서가 없을 때 사용하는 기본 설정"""
+        return {
+            "id": "app_settings",
+            "admin": {
+                "admin_emails": []
+            },
+            "ai": {
+                "provider_priority": ["openai", "anthropic"],
+                "providers": [],
+                "default_timeout": 30
+            },
+            "updated_at": None,
+            "updated_by": None
+        }
+
+    def invalidate_settings_cache(self):
+        """앱 설정 캐시 무효화 (설정 변경 후 호출, 다른 인스턴스에도 전파)"""
+        self._clear_settings_cache()
+        cache.publish(SETTINGS_INVALIDATION_CHANNEL, "app_settings")
+
+    def _clear_settings_cache(self):
+        """이 인스턴스의 앱 설정 캐시만 비움 (pub/sub 구독 스레드에서도 호출됨)"""
+        self._settings_cache_generation += 1
+        self._settings_cache = None
+        self._settings_cache_timestamp = 0
+
+    async def _fetch_app_settings(self) -> Dict[str, Any]:
+        """Firestore에서 애플리케이션 설정 조회"""
         settings_ref = self.db.collection('settings').document('app_settings')
         doc = settings_ref.get()
         
         if not doc.exists:
-            # Return default settings
-            return {
-                "id": "app_settings",
-                "admin": {
-                    "admin_emails": []
-                },
-                "ai": {
-                    "provider_priority": ["openai", "anthropic"],
-                    "providers": [],
-                    "default_timeout": 30
-                },
-                "updated_at": None,
-                "updated_by": None
-            }
+            return self._default_app_settings()
         
         data = doc.to_dict()
         
@@ -909,6 +1078,7 @@ class FirestoreProvider(DatabaseProvider):
         
         # Upsert (create or update)
         settings_ref.set(update_data, merge=True)
+        self.invalidate_settings_cache()
         
         # Fetch updated document
         doc = settings_ref.get()
@@ -921,10 +1091,85 @@ class FirestoreProvider(DatabaseProvider):
         
         return data
 
+    async def modify_app_settings(
+        self,
+        mutator: Callable[[Dict[str, Any]], None],
+        updated_by: str
+    ) -> Dict[str, Any]:
+        """
+        설정 읽기-수정-쓰기를 하나의 트랜잭션으로 수행
+
+        동시에 다른 관리자가 변경하면 Firestore가 트랜잭션을 재시도하므로
+        (mutator는 최신 문서로 다시 호출됨) 변경 내용이 유실되지 않습니다.
+        저장 후 문서를 다시 조회하지 않고 수정한 내용을 그대로 반환합니다.
+        """
+        settings_ref = self.db.collection('settings').document('app_settings')
+
+        @firestore.transactional
+        def _apply(transaction) -> Dict[str, Any]:
+            snapshot = settings_ref.get(transaction=transaction)
+            data = snapshot.to_dict() if snapshot.exists else self._default_app_settings()
+            mutator(data)
+            data['updated_by'] = updated_by
+            transaction.set(settings_ref, {**data, 'updated_at': firestore.SERVER_TIMESTAMP})
+            return data
+
+        try:
+            data = _apply(self.db.transaction())
+        finally:
+            self.invalidate_settings_cache()
+
+        data['updated_at'] = datetime.now(timezone.utc)
+        return data
+
+    async def toggle_ai_provider(
+        self,
+        provider_name: str,
+        updated_by: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        AI Provider 활성화 상태 반전 (트랜잭션)
+
+        Firestore는 배열 원소의 필드만 갱신할 수 없으므로 ai.providers 배열만
+        다시 쓰고 나머지 설정 필드는 건드리지 않습니다.
+        """
+        settings_ref = self.db.collection('settings').document('app_settings')
+
+        @firestore.transactional
+        def _apply(transaction) -> Optional[Dict[str, Any]]:
+            snapshot = settings_ref.get(transaction=transaction)
+            if not snapshot.exists:
+                return None
+            data = snapshot.to_dict()
+            providers = data.get('ai', {}).get('providers', [])
+            for provider in providers:
+                if provider.get('name') == provider_name:
+                    provider['enabled'] = not provider.get('enabled', True)
+                    break
+            else:
+                return None
+
+            data['updated_by'] = updated_by
+            transaction.update(settings_ref, {
+                'ai.providers': providers,
+                'updated_at': firestore.SERVER_TIMESTAMP,
+                'updated_by': updated_by,
+            })
+            return data
+
+        try:
+            data = _apply(self.db.transaction())
+        finally:
+            self.invalidate_settings_cache()
+
+        if data is not None:
+            data['updated_at'] = datetime.now(timezone.utc)
+        return data
+
     async def get_admin_emails(self) -> List[str]:
         """관리자 이메일 목록 조회"""
-        settings = await self.get_app_settings()
-        return settings.get('admin', {}).get('admin_emails', [])
+        settings = await self._get_cached_app_settings()
+        return list(settings.get('admin', {}).get('admin_emails', []))
 
     async def add_admin_email(self, email: str, updated_by: str) -> bool:
         """관리자 이메일 추가"""
@@ -938,6 +1183,7 @@ class FirestoreProvider(DatabaseProvider):
             'updated_at': firestore.SERVER_TIMESTAMP,
             'updated_by': updated_by
         }, merge=True)
+        self.invalidate_settings_cache()
         
         return True
 
@@ -953,6 +1199,7 @@ class FirestoreProvider(DatabaseProvider):
             'updated_at': firestore.SERVER_TIMESTAMP,
             'updated_by': updated_by
         }, merge=True)
+        self.invalidate_settings_cache()
         
         return True
 
@@ -3,11 +3,13 @@ PostgreSQL Database Provider
 
 기존 SQLAlchemy 모델을 사용하는 DatabaseProvider 구현체
 """
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime, timedelta
 import uuid
+import time
 from sqlalchemy.orm import Session
-from sqlalchemy import func, or_, and_, cast, Integer
+from sqlalchemy import func, or_, and_, cast, delete, insert, select, update, tuple_, Integer
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 import random
 
 from .provider import (
@@ -25,6 +27,8 @@ from src.models.feedback import Feedback as FeedbackModel
 from src.models.user import User as UserModel
 from src.models.conversation import Conversation as ConversationModel
 from src.models.message import Message as MessageModel, MessageRole
+from src.models.outbox_event import OutboxEvent as OutboxEventModel
+from src.core.outbox import FEEDBACK_CREATED_EVENT
 
 
 class PostgreSQLProvider(DatabaseProvider):
@@ -38,6 +42,11 @@ class PostgreSQLProvider(DatabaseProvider):
         """Initialize PostgreSQL provider"""
         self._session: Optional[Session] = None
 
+        # 카드 덱 인메모리 캐시 (카드는 거의 변경되지 않음)
+        self._cards_cache: Optional[List[CardDTO]] = None
+        self._cache_timestamp: float = 0
+        self._cache_ttl: int = 3600  # 1 hour TTL
+
     def _get_session(self) -> Session:
         """Get or create database session"""
         if self._session is None:
@@ -134,6 +143,15 @@ class PostgreSQLProvider(DatabaseProvider):
             return None
         return self._model_to_card_dto(card_model)
 
+    async def get_cards_by_ids(self, card_ids: List[int]) -> Dict[int, CardDTO]:
+        """여러 카드를 ID로 한 번에 조회 (단일 IN 쿼리)"""
+        if not card_ids:
+            return {}
+
+        db = self._get_session()
+        card_models = db.query(CardModel).filter(CardModel.id.in_(set(card_ids))).all()
+        return {card_model.id: self._model_to_card_dto(card_model) for card_model in card_models}
+
     async def get_card_by_name(self, name: str) -> Optional[CardDTO]:
         """이름으로 카드 조회"""
         db = self._get_session()
@@ -183,16 +201,37 @@ class PostgreSQLProvider(DatabaseProvider):
         return query.scalar()
 
     async def get_random_cards(self, count: int) -> List[CardDTO]:
-        """랜덤 카드 추출"""
+        """랜덤 카드 추출 (캐시된 덱에서 메모리 내 샘플링, DB 조회 없음)"""
+        all_cards = await self.get_all_cards_cached()
+
+        if count >= len(all_cards):
+            return all_cards.copy()
+
+        return random.sample(all_cards, count)
+
+    async def get_all_cards_cached(self) -> List[CardDTO]:
+        """
+        전체 카드 덱 조회 (인메모리 캐시, 1시간 TTL)
+
+        Returns:
+            List of all card DTOs
+        """
+        now = time.time()
+
+        if self._cards_cache and (now - self._cache_timestamp < self._cache_ttl):
+            return self._cards_cache
+
         db = self._get_session()
-        total_cards = db.query(func.count(CardModel.id)).scalar()
+        card_models = db.query(CardModel).order_by(CardModel.id).all()
+        self._cards_cache = [self._model_to_card_dto(card) for card in card_models]
+        self._cache_timestamp = now
 
-        # Get random IDs
-        random_ids = random.sample(range(1, total_cards + 1), min(count, total_cards))
+        return self._cards_cache
 
-        # Fetch cards
-        card_models = db.query(CardModel).filter(CardModel.id.in_(random_ids)).all()
-        return [self._model_to_card_dto(card) for card in card_models]
+    def invalidate_cards_cache(self):
+        """카드 생성/수정/삭제 시 덱 캐시 무효화"""
+        self._cards_cache = None
+        self._cache_timestamp = 0
 
     async def create_card(self, card_data: Dict[str, Any]) -> CardDTO:
         """카드 생성"""
@@ -216,6 +255,7 @@ class PostgreSQLProvider(DatabaseProvider):
         db.add(card_model)
         db.commit()
         db.refresh(card_model)
+        self.invalidate_cards_cache()
 
         return self._model_to_card_dto(card_model)
 
@@ -234,6 +274,7 @@ class PostgreSQLProvider(DatabaseProvider):
 
         db.commit()
         db.refresh(card_model)
+        self.invalidate_cards_cache()
 
         return self._model_to_card_dto(card_model)
 
@@ -247,6 +288,7 @@ class PostgreSQLProvider(DatabaseProvider):
 
         db.delete(card_model)
         db.commit()
+        self.invalidate_cards_cache()
         return True
 
     # ==================== Reading Operations ====================
@@ -266,24 +308,29 @@ class PostgreSQLProvider(DatabaseProvider):
             advice=reading_data["advice"],
             summary=reading_data["summary"],
         )
-
         db.add(reading_model)
         db.flush()  # Get ID without committing
-
-        # Create ReadingCards
-        for card_data in reading_data.get("cards", []):
-            reading_card = ReadingCard(
-                reading_id=reading_model.id,
-                card_id=card_data["card_id"],
-                position=card_data["position"],
-                orientation=card_data["orientation"],
-                interpretation=card_data["interpretation"],
-                key_message=card_data["key_message"],
-            )
-            db.add(reading_card)
+        reading_id = reading_model.id
+
+        # Create ReadingCards: 카드 수와 관계없이 한 번의 multi-row INSERT
+        card_rows = [
+            {
+                "reading_id": reading_id,
+                "card_id": card_data["card_id"],
+                "position": card_data["position"],
+                "orientation": card_data["orientation"],
+                "interpretation": card_data["interpretation"],
+                "key_message": card_data["key_message"],
+            }
+            for card_data in reading_data.get("cards", [])
+        ]
+        if card_rows:
+            db.execute(insert(ReadingCard), card_rows)
 
         db.commit()
-        db.refresh(reading_model)
+
+        # 카드/카드 상세는 joined 관계이므로 한 번의 SELECT로 다시 로드
+        reading_model = db.query(ReadingModel).filter(ReadingModel.id == reading_id).one()
 
         return self._model_to_reading_dto(reading_model)
 
@@ -299,6 +346,13 @@ class PostgreSQLProvider(DatabaseProvider):
 
         return self._model_to_reading_dto(reading_model)
 
+    async def reading_exists(self, reading_id: str) -> bool:
+        """리딩 존재 여부 확인 (SELECT EXISTS, 카드 로딩 없음)"""
+        db = self._get_session()
+        return db.query(
+            db.query(ReadingModel.id).filter(ReadingModel.id == reading_id).exists()
+        ).scalar()
+
     async def get_readings_by_user(
         self,
         user_id: str,
@@ -318,7 +372,8 @@ class PostgreSQLProvider(DatabaseProvider):
             query = query.filter(ReadingModel.category == category)
 
         # Order by created_at descending
-        query = query.order_by(ReadingModel.created_at.desc())
+        # id는 동일 시각 리딩의 순서를 키셋 커서와 일치시키기 위한 보조 정렬 키
+        query = query.order_by(ReadingModel.created_at.desc(), ReadingModel.id.desc())
 
         # Apply pagination
         reading_models = query.offset(skip).limit(limit).all()
@@ -344,6 +399,73 @@ class PostgreSQLProvider(DatabaseProvider):
 
         return query.scalar()
 
+    async def get_readings_by_user_paginated(
+        self,
+        user_id: str,
+        skip: int = 0,
+        limit: int = 100,
+        spread_type: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> Tuple[List[ReadingDTO], int]:
+        """사용자별 리딩 목록 + 전체 수 조회 (COUNT(*) OVER () 단일 쿼리)"""
+        db = self._get_session()
+        query = db.query(
+            ReadingModel,
+            func.count().over().label("total"),
+        ).filter(ReadingModel.user_id == user_id)
+
+        # Apply filters
+        if spread_type:
+            query = query.filter(ReadingModel.spread_type == spread_type)
+        if category:
+            query = query.filter(ReadingModel.category == category)
+
+        # id는 동일 시각 리딩의 순서를 키셋 커서와 일치시키기 위한 보조 정렬 키
+        query = query.order_by(ReadingModel.created_at.desc(), ReadingModel.id.desc())
+        rows = query.offset(skip).limit(limit).all()
+
+        if not rows:
+            # 범위를 벗어난 페이지는 윈도우 값이 없으므로 개수만 별도로 조회
+            total = 0
+            if skip > 0:
+                total = await self.get_total_readings_count(
+                    user_id=user_id,
+                    spread_type=spread_type,
+                    category=category,
+                )
+            return [], total
+
+        total = rows[0].total
+        return [self._model_to_reading_dto(row[0]) for row in rows], total
+
+    async def get_readings_by_user_after(
+        self,
+        user_id: str,
+        after_created_at: datetime,
+        after_id: str,
+        limit: int = 100,
+        spread_type: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> List[ReadingDTO]:
+        """사용자별 리딩 키셋 조회 (WHERE (created_at, id) < (커서) - idx_readings_user_created 사용)"""
+        db = self._get_session()
+        query = db.query(ReadingModel).filter(
+            ReadingModel.user_id == user_id,
+            tuple_(ReadingModel.created_at, ReadingModel.id) < (after_created_at, after_id),
+        )
+
+        if spread_type:
+            query = query.filter(ReadingModel.spread_type == spread_type)
+        if category:
+            query = query.filter(ReadingModel.category == category)
+
+        reading_models = (
+            query.order_by(ReadingModel.created_at.desc(), ReadingModel.id.desc())
+            .limit(limit)
+            .all()
+        )
+        return [self._model_to_reading_dto(reading) for reading in reading_models]
+
     async def update_reading(self, reading_id: str, reading_data: Dict[str, Any]) -> ReadingDTO:
         """리딩 수정"""
         db = self._get_session()
@@ -400,6 +522,46 @@ class PostgreSQLProvider(DatabaseProvider):
 
         return self._model_to_feedback_dto(feedback_model)
 
+    async def create_feedback_if_absent(
+        self,
+        feedback_data: Dict[str, Any],
+    ) -> Optional[FeedbackDTO]:
+        """피드백 생성 (INSERT ... ON CONFLICT DO NOTHING RETURNING, 단일 라운드트립)"""
+        db = self._get_session()
+
+        stmt = (
+            pg_insert(FeedbackModel)
+            .values(
+                id=uuid.UUID(feedback_data['id']) if feedback_data.get('id') else uuid.uuid4(),
+                reading_id=uuid.UUID(feedback_data['reading_id']),
+                user_id=uuid.UUID(feedback_data['user_id']),
+                rating=feedback_data['rating'],
+                comment=feedback_data.get('comment'),
+                helpful=feedback_data.get('helpful', True),
+                accurate=feedback_data.get('accurate', True),
+            )
+            .on_conflict_do_nothing(index_elements=['reading_id', 'user_id'])
+            .returning(FeedbackModel)
+        )
+
+        feedback = db.scalars(stmt).first()
+        if feedback is not None:
+            # 같은 트랜잭션에 이벤트 기록 (피드백 저장과 이벤트 발행의 원자성 보장)
+            db.execute(
+                insert(OutboxEventModel).values(
+                    event_type=FEEDBACK_CREATED_EVENT,
+                    payload={
+                        "feedback_id": str(feedback.id),
+                        "reading_id": str(feedback.reading_id),
+                        "user_id": str(feedback.user_id),
+                        "rating": feedback.rating,
+                    },
+                )
+            )
+        db.commit()
+
+        return self._model_to_feedback_dto(feedback) if feedback else None
+
     async def get_feedback_by_id(self, feedback_id: str) -> Optional[FeedbackDTO]:
         """ID로 피드백 조회"""
         db = self._get_session()
@@ -448,37 +610,96 @@ class PostgreSQLProvider(DatabaseProvider):
         feedback_id: str,
         feedback_data: Dict[str, Any],
     ) -> Optional[FeedbackDTO]:
-        """피드백 수정"""
+        """피드백 수정 (UPDATE ... RETURNING, refresh 조회 없음)"""
         db = self._get_session()
-        feedback = db.query(FeedbackModel).filter(
-            FeedbackModel.id == uuid.UUID(feedback_id)
-        ).first()
+        feedback_uuid = uuid.UUID(feedback_id)
+
+        changes = {
+            field: feedback_data[field]
+            for field in ("rating", "comment", "helpful", "accurate")
+            if field in feedback_data and feedback_data[field] is not None
+        }
+        if not changes:
+            feedback = db.query(FeedbackModel).filter(FeedbackModel.id == feedback_uuid).first()
+            return self._model_to_feedback_dto(feedback) if feedback else None
+
+        stmt = (
+            update(FeedbackModel)
+            .where(FeedbackModel.id == feedback_uuid)
+            .values(**changes)
+            .returning(FeedbackModel)
+        )
+        feedback = db.scalars(stmt).first()
+        db.commit()
 
         if not feedback:
             return None
 
-        for field in ("rating", "comment", "helpful", "accurate"):
-            if field in feedback_data and feedback_data[field] is not None:
-                setattr(feedback, field, feedback_data[field])
-
-        db.commit()
-        db.refresh(feedback)
-
         return self._model_to_feedback_dto(feedback)
 
     async def delete_feedback(self, feedback_id: str) -> bool:
-        """피드백 삭제"""
+        """피드백 삭제 (DELETE ... RETURNING 한 번으로 존재 확인 및 삭제)"""
         db = self._get_session()
-        feedback = db.query(FeedbackModel).filter(
-            FeedbackModel.id == uuid.UUID(feedback_id)
-        ).first()
+        stmt = (
+            delete(FeedbackModel)
+            .where(FeedbackModel.id == uuid.UUID(feedback_id))
+            .returning(FeedbackModel.id)
+        )
+        deleted_id = db.execute(stmt).scalar_one_or_none()
+        db.commit()
+        return deleted_id is not None
+
+    async def update_feedback_if_owner(
+        self,
+        feedback_id: str,
+        user_id: str,
+        feedback_data: Dict[str, Any],
+    ) -> Optional[FeedbackDTO]:
+        """작성자 확인과 수정을 한 번의 UPDATE ... WHERE id AND user_id RETURNING으로 처리"""
+        db = self._get_session()
+        feedback_uuid = uuid.UUID(feedback_id)
+        user_uuid = uuid.UUID(str(user_id))
+
+        changes = {
+            field: feedback_data[field]
+            for field in ("rating", "comment", "helpful", "accurate")
+            if field in feedback_data and feedback_data[field] is not None
+        }
+        if not changes:
+            feedback = db.query(FeedbackModel).filter(
+                FeedbackModel.id == feedback_uuid,
+                FeedbackModel.user_id == user_uuid,
+            ).first()
+            return self._model_to_feedback_dto(feedback) if feedback else None
+
+        stmt = (
+            update(FeedbackModel)
+            .where(FeedbackModel.id == feedback_uuid, FeedbackModel.user_id == user_uuid)
+            .values(**changes)
+            .returning(FeedbackModel)
+        )
+        feedback = db.scalars(stmt).first()
+        db.commit()
 
         if not feedback:
-            return False
+            return None
+
+        return self._model_to_feedback_dto(feedback)
 
-        db.delete(feedback)
+    async def delete_feedback_if_owner(self, feedback_id: str, user_id: str) -> bool:
+        """작성자 확인과 삭제를 한 번의 DELETE ... WHERE id AND user_id RETURNING으로 처리"""
+        db = self._get_session()
+        stmt = (
+            delete(FeedbackModel)
+            .where(
+                FeedbackModel.id == uuid.UUID(feedback_id),
+                FeedbackModel.user_id == uuid.UUID(str(user_id)),
+            )
+            .returning(FeedbackModel.id)
+        )
+        deleted_id = db.execute(stmt).scalar_one_or_none()
         db.commit()
-        return True
+        return deleted_id is not None
 
     async def get_feedback_statistics(self) -> Dict[str, Any]:
         """전체 피드백 통계"""
@@ -578,6 +799,87 @@ class PostgreSQLProvider(DatabaseProvider):
 
         return results
 
+    # ==================== Outbox Operations ====================
+
+    async def claim_outbox_events(
+        self,
+        limit: int = 100,
+        lease_seconds: float = 60.0,
+    ) -> List[Dict[str, Any]]:
+        """
+        미발행 outbox 이벤트를 오래된 순으로 선점 (단일 UPDATE ... RETURNING)
+
+        FOR UPDATE SKIP LOCKED로 여러 인스턴스가 같은 행을 동시에 선점하지 않고,
+        claimed_until이 지나기 전까지 다른 릴레이의 폴링에서 제외됩니다.
+        발행 도중 인스턴스가 종료되면 선점 기한이 지난 뒤 다시 선점됩니다.
+        """
+        db = self._get_session()
+        now = datetime.utcnow()
+        claimable_ids = (
+            select(OutboxEventModel.id)
+            .where(OutboxEventModel.processed_at.is_(None))
+            .where(or_(
+                OutboxEventModel.claimed_until.is_(None),
+                OutboxEventModel.claimed_until < now,
+            ))
+            .order_by(OutboxEventModel.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        rows = db.execute(
+            update(OutboxEventModel)
+            .where(OutboxEventModel.id.in_(claimable_ids))
+            .values(claimed_until=now + timedelta(seconds=lease_seconds))
+            .returning(
+                OutboxEventModel.id,
+                OutboxEventModel.event_type,
+                OutboxEventModel.payload,
+                OutboxEventModel.created_at,
+            )
+            .execution_options(synchronize_session=False)
+        ).all()
+        db.commit()
+
+        # RETURNING 순서는 보장되지 않으므로 생성 순으로 정렬
+        return [
+            {
+                "id": str(row.id),
+                "event_type": row.event_type,
+                "payload": row.payload,
+                "created_at": row.created_at,
+            }
+            for row in sorted(rows, key=lambda row: row.created_at)
+        ]
+
+    async def release_outbox_events(self, event_ids: List[str]) -> int:
+        """발행에 실패한 이벤트의 선점 해제 (다음 폴링에서 바로 재시도)"""
+        if not event_ids:
+            return 0
+
+        db = self._get_session()
+        result = db.execute(
+            update(OutboxEventModel)
+            .where(OutboxEventModel.id.in_([uuid.UUID(event_id) for event_id in event_ids]))
+            .where(OutboxEventModel.processed_at.is_(None))
+            .values(claimed_until=None)
+        )
+        db.commit()
+        return result.rowcount
+
+    async def mark_outbox_events_processed(self, event_ids: List[str]) -> int:
+        """발행이 끝난 outbox 이벤트에 처리 완료 표시 (단일 UPDATE)"""
+        if not event_ids:
+            return 0
+
+        db = self._get_session()
+        result = db.execute(
+            update(OutboxEventModel)
+            .where(OutboxEventModel.id.in_([uuid.UUID(event_id) for event_id in event_ids]))
+            .values(processed_at=datetime.utcnow())
+        )
+        db.commit()
+        return result.rowcount
+
     # ==================== Admin Statistics Operations ====================
 
     async def get_total_users_count(self) -> int:
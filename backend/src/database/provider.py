@@ -3,8 +3,9 @@ Database Provider Interface
 
 다양한 데이터베이스 백엔드(PostgreSQL, Firestore 등)를 추상화하는 인터페이스
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Callable
 from datetime import datetime
 
 
@@ -270,6 +271,20 @@ class DatabaseProvider(ABC):
         """ID로 카드 조회"""
         pass
 
+    async def get_cards_by_ids(self, card_ids: List[int]) -> Dict[int, Card]:
+        """
+        여러 카드를 ID로 한 번에 조회
+
+        Default implementation issues the single-card lookups concurrently.
+        Providers should override this with a single bulk query.
+
+        Returns:
+            {카드 ID: 카드} 딕셔너리 (존재하지 않는 ID는 제외)
+        """
+        unique_ids = list(dict.fromkeys(card_ids))
+        cards = await asyncio.gather(*(self.get_card_by_id(card_id) for card_id in unique_ids))
+        return {card.id: card for card in cards if card is not None}
+
     @abstractmethod
     async def get_card_by_name(self, name: str) -> Optional[Card]:
         """이름으로 카드 조회"""
@@ -327,6 +342,15 @@ class DatabaseProvider(ABC):
         """ID로 리딩 조회"""
         pass
 
+    async def reading_exists(self, reading_id: str) -> bool:
+        """
+        리딩 존재 여부만 확인
+
+        Default implementation loads the reading. Providers can override with
+        a lighter existence query.
+        """
+        return await self.get_reading_by_id(reading_id) is not None
+
     @abstractmethod
     async def get_readings_by_user(
         self,
@@ -349,6 +373,55 @@ class DatabaseProvider(ABC):
         """사용자별 전체 리딩 수 조회"""
         pass
 
+    async def get_readings_by_user_paginated(
+        self,
+        user_id: str,
+        skip: int = 0,
+        limit: int = 100,
+        spread_type: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> Tuple[List[Reading], int]:
+        """
+        사용자별 리딩 목록과 전체 개수를 함께 조회
+
+        Default implementation issues the list and count queries separately.
+        Providers can override to compute both in a single round-trip.
+
+        Returns:
+            (리딩 목록, 필터 조건에 맞는 전체 리딩 수)
+        """
+        readings = await self.get_readings_by_user(
+            user_id=user_id,
+            skip=skip,
+            limit=limit,
+            spread_type=spread_type,
+            category=category,
+        )
+        total = await self.get_total_readings_count(
+            user_id=user_id,
+            spread_type=spread_type,
+            category=category,
+        )
+        return readings, total
+
+    @abstractmethod
+    async def get_readings_by_user_after(
+        self,
+        user_id: str,
+        after_created_at: datetime,
+        after_id: str,
+        limit: int = 100,
+        spread_type: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> List[Reading]:
+        """
+        사용자별 리딩 목록 키셋(커서) 조회
+
+        (created_at, id) 내림차순에서 커서 리딩 바로 다음부터 limit개를 반환합니다.
+        OFFSET과 달리 앞 페이지 행을 건너뛰며 스캔하지 않습니다.
+        """
+        pass
+
     @abstractmethod
     async def update_reading(self, reading_id: str, reading_data: Dict[str, Any]) -> Reading:
         """리딩 수정"""
@@ -404,6 +477,28 @@ class DatabaseProvider(ABC):
         """피드백 생성"""
         pass
 
+    async def create_feedback_if_absent(
+        self,
+        feedback_data: Dict[str, Any],
+    ) -> Optional[Feedback]:
+        """
+        리딩당 사용자 1건 제약을 지키며 피드백 생성
+
+        Default implementation checks for an existing feedback and then inserts.
+        Providers with a native unique constraint should override this with a
+        single atomic insert.
+
+        Returns:
+            생성된 피드백, 같은 (reading_id, user_id) 피드백이 이미 있으면 None
+        """
+        existing = await self.get_feedback_by_reading_and_user(
+            reading_id=feedback_data["reading_id"],
+            user_id=feedback_data["user_id"],
+        )
+        if existing:
+            return None
+        return await self.create_feedback(feedback_data)
+
     @abstractmethod
     async def get_feedback_by_id(self, feedback_id: str) -> Optional[Feedback]:
         """ID로 피드백 조회"""
@@ -442,6 +537,38 @@ class DatabaseProvider(ABC):
         """피드백 삭제"""
         pass
 
+    async def update_feedback_if_owner(
+        self,
+        feedback_id: str,
+        user_id: str,
+        feedback_data: Dict[str, Any],
+    ) -> Optional[Feedback]:
+        """
+        작성자 본인의 피드백일 때만 수정
+
+        Default implementation loads the feedback, checks the owner and then
+        updates. Providers should override with a single conditional UPDATE.
+
+        Returns:
+            수정된 피드백, 피드백이 없거나 작성자가 다르면 None
+        """
+        feedback = await self.get_feedback_by_id(feedback_id)
+        if not feedback or str(feedback.user_id) != str(user_id):
+            return None
+        return await self.update_feedback(feedback_id, feedback_data)
+
+    async def delete_feedback_if_owner(self, feedback_id: str, user_id: str) -> bool:
+        """
+        작성자 본인의 피드백일 때만 삭제
+
+        Returns:
+            삭제되었으면 True, 피드백이 없거나 작성자가 다르면 False
+        """
+        feedback = await self.get_feedback_by_id(feedback_id)
+        if not feedback or str(feedback.user_id) != str(user_id):
+            return False
+        return await self.delete_feedback(feedback_id)
+
     @abstractmethod
     async def get_feedback_statistics(self) -> Dict[str, Any]:
         """전체 피드백 통계"""
@@ -461,6 +588,42 @@ class DatabaseProvider(ABC):
         """스프레드 타입별 피드백 통계"""
         pass
 
+    # ==================== Outbox Operations ====================
+
+    async def claim_outbox_events(
+        self,
+        limit: int = 100,
+        lease_seconds: float = 60.0,
+    ) -> List[Dict[str, Any]]:
+        """
+        미발행 outbox 이벤트를 오래된 순으로 선점
+
+        선점된 이벤트는 lease_seconds 동안 다른 릴레이에 반환되지 않습니다.
+        outbox를 기록하지 않는 Provider는 빈 목록을 반환합니다.
+
+        Returns:
+            {"id", "event_type", "payload", "created_at"} 딕셔너리 목록
+        """
+        return []
+
+    async def release_outbox_events(self, event_ids: List[str]) -> int:
+        """
+        발행에 실패한 이벤트의 선점 해제
+
+        Returns:
+            선점이 해제된 이벤트 수
+        """
+        return 0
+
+    async def mark_outbox_events_processed(self, event_ids: List[str]) -> int:
+        """
+        발행이 끝난 outbox 이벤트에 처리 완료 표시
+
+        Returns:
+            처리 완료로 표시된 이벤트 수
+        """
+        return 0
+
     # ==================== Admin Statistics Operations ====================
 
     @abstractmethod
@@ -503,6 +666,55 @@ class DatabaseProvider(ABC):
         """애플리케이션 설정 업데이트"""
         pass
 
+    async def modify_app_settings(
+        self,
+        mutator: Callable[[Dict[str, Any]], None],
+        updated_by: str
+    ) -> Dict[str, Any]:
+        """
+        현재 설정을 읽어 mutator로 제자리 수정한 뒤 저장
+
+        Default implementation reads and writes separately (not atomic).
+        Providers should override this with a single transaction so concurrent
+        admin updates do not overwrite each other.
+
+        Args:
+            mutator: 설정 dict를 직접 수정하는 함수 (검증 실패 시 예외를 던지면 저장하지 않음)
+            updated_by: 변경한 사용자 ID
+
+        Returns:
+            저장된 설정
+        """
+        settings_data = await self.get_app_settings() or {}
+        mutator(settings_data)
+        return await self.update_app_settings(settings_data, updated_by=updated_by)
+
+    async def toggle_ai_provider(
+        self,
+        provider_name: str,
+        updated_by: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        AI Provider 활성화 상태 반전
+
+        Providers may override this to write only the provider list instead of
+        the whole settings document.
+
+        Returns:
+            저장된 설정 (해당 Provider가 없으면 None, 이 경우 저장하지 않음)
+        """
+        def apply_toggle(settings_data: Dict[str, Any]) -> None:
+            for provider in settings_data.get('ai', {}).get('providers', []):
+                if provider.get('name') == provider_name:
+                    provider['enabled'] = not provider.get('enabled', True)
+                    return
+            raise LookupError(provider_name)
+
+        try:
+            return await self.modify_app_settings(apply_toggle, updated_by=updated_by)
+        except LookupError:
+            return None
+
     @abstractmethod
     async def get_admin_emails(self) -> List[str]:
         """관리자 이메일 목록 조회"""
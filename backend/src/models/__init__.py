@@ -7,6 +7,7 @@ from src.models.user import User
 from src.models.feedback import Feedback
 from src.models.conversation import Conversation
 from src.models.message import Message, MessageRole
+from src.models.outbox_event import OutboxEvent
 
 __all__ = [
     "Card",
@@ -19,4 +20,5 @@ __all__ = [
     "Conversation",
     "Message",
     "MessageRole",
+    "OutboxEvent",
 ]
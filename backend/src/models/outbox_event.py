@@ -0,0 +1,97 @@
+"""
+Outbox 이벤트 데이터 모델 정의 모듈
+
+이 모듈의 목적:
+- 도메인 변경(피드백 생성 등)과 같은 트랜잭션에 기록되는 이벤트 저장 (Transactional Outbox)
+- 요청 처리 경로에서 후속 작업(분석, AI 튜닝 파이프라인 알림)을 분리
+- 이벤트 발행과 DB 쓰기의 원자성 보장
+
+주요 모델:
+- OutboxEvent: 발행 대기 중이거나 발행된 도메인 이벤트
+
+처리 흐름:
+1. 도메인 쓰기와 같은 트랜잭션에서 OutboxEvent 행 추가
+2. 백그라운드 OutboxRelay가 processed_at IS NULL 행을 배치로 선점 (claimed_until 기록)
+3. Redis Stream으로 발행 후 processed_at 기록 (at-least-once)
+"""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, String
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+from src.core.database import Base
+
+
+class OutboxEvent(Base):
+    """
+    Outbox 이벤트 모델
+
+    Attributes:
+        id (UUID): 이벤트 고유 식별자 (Primary Key)
+        event_type (str): 이벤트 타입 (예: "feedback.created")
+        payload (dict): 이벤트 데이터 (JSONB)
+        created_at (datetime): 이벤트 생성 시각
+        processed_at (datetime | None): 발행 완료 시각 (미발행이면 NULL)
+        claimed_until (datetime | None): 릴레이 선점 만료 시각 (선점되지 않았으면 NULL)
+    """
+
+    __tablename__ = "outbox_events"
+
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+        comment="이벤트 고유 식별자",
+    )
+
+    event_type = Column(
+        String(100),
+        nullable=False,
+        comment="이벤트 타입",
+    )
+
+    payload = Column(
+        JSONB,
+        nullable=False,
+        default=dict,
+        comment="이벤트 데이터",
+    )
+
+    created_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        comment="이벤트 생성 시각",
+    )
+
+    processed_at = Column(
+        DateTime,
+        nullable=True,
+        comment="발행 완료 시각",
+    )
+
+    claimed_until = Column(
+        DateTime,
+        nullable=True,
+        comment="릴레이 선점 만료 시각",
+    )
+
+    __table_args__ = (
+        # 미발행 이벤트 폴링용 부분 인덱스
+        Index(
+            "ix_outbox_events_pending",
+            "created_at",
+            postgresql_where=processed_at.is_(None),
+        ),
+        {"comment": "Transactional outbox 이벤트 테이블"},
+    )
+
+    def __repr__(self) -> str:
+        """String representation of OutboxEvent"""
+        return (
+            f"<OutboxEvent(id={self.id}, "
+            f"event_type={self.event_type}, "
+            f"processed_at={self.processed_at})>"
+        )
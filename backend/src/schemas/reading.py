@@ -43,13 +43,23 @@ TASK 참조:
         summary="..."
     )
 """
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
 from pydantic import BaseModel, Field
 
 from src.schemas.card import CardResponse
 
 
+# 지원하는 스프레드 타입 (spread_config.SPREAD_CONFIGS의 키와 일치)
+# Literal은 정규식 매칭 대신 고정 집합 조회로 검증되고, OpenAPI 스키마에 enum으로 노출됨
+SpreadType = Literal[
+    "one_card",
+    "three_card_past_present_future",
+    "three_card_situation_action_outcome",
+    "celtic_cross",
+]
+
+
 class LLMUsageResponse(BaseModel):
     """
     LLM 사용 기록 응답 스키마
@@ -103,9 +113,8 @@ class ReadingRequest(BaseModel):
         description="사용자의 질문 (5-500자)",
         examples=["새로운 직장으로 이직해야 할까요?"]
     )
-    spread_type: str = Field(
+    spread_type: SpreadType = Field(
         default="one_card",
-        pattern="^(one_card|three_card_past_present_future|three_card_situation_action_outcome|celtic_cross)$",
         description="스프레드 타입 (one_card, three_card_past_present_future, three_card_situation_action_outcome, celtic_cross)",
         examples=["one_card"]
     )
@@ -241,10 +250,18 @@ class ReadingListResponse(BaseModel):
 
     여러 리딩 결과를 페이지네이션과 함께 반환합니다.
     """
-    total: int = Field(..., description="전체 리딩 개수")
+    total: Optional[int] = Field(
+        None,
+        description="전체 리딩 개수 (include_total=false로 조회하면 null)"
+    )
     page: int = Field(..., description="현재 페이지 번호")
     page_size: int = Field(..., description="페이지당 항목 수")
     readings: List[ReadingResponse] = Field(..., description="리딩 목록")
+    has_more: bool = Field(False, description="다음 페이지 존재 여부")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="다음 페이지 커서 (cursor 파라미터로 전달, 마지막 페이지면 null)"
+    )
 
     class Config:
         json_json_schema_extra = {
@@ -252,6 +269,8 @@ class ReadingListResponse(BaseModel):
                 "total": 10,
                 "page": 1,
                 "page_size": 5,
-                "readings": []
+                "readings": [],
+                "has_more": False,
+                "next_cursor": None
             }
         }
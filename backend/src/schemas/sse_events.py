@@ -6,8 +6,13 @@ used during real-time tarot reading generation.
 """
 from enum import Enum
 from typing import Optional, Dict, Any, List
+
+import orjson
 from pydantic import BaseModel, Field
 
+# JSON 응답(src/api/responses.py)과 동일한 규칙: naive datetime은 UTC, 정수 키 허용
+_SSE_JSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
 
 class SSEEventType(str, Enum):
     """SSE event types for reading generation"""
@@ -16,7 +21,7 @@ class SSEEventType(str, Enum):
     CARD_DRAWN = "card_drawn"
     RAG_ENRICHMENT = "rag_enrichment"
     AI_GENERATION = "ai_generation"
-    CHUNK = "chunk"  # AI response chunk
+    AI_TOKEN = "ai_token"  # AI response text delta
     SECTION_COMPLETE = "section_complete"  # Individual section completed
     COMPLETE = "complete"
     ERROR = "error"
@@ -44,8 +49,8 @@ class SSEEvent(BaseModel):
         Returns:
             SSE formatted string (e.g., "event: progress\\ndata: {...}\\n\\n")
         """
-        import json
-        return f"event: {self.event.value}\ndata: {json.dumps(self.data, ensure_ascii=False)}\n\n"
+        payload = orjson.dumps(self.data, option=_SSE_JSON_OPTIONS).decode()
+        return f"event: {self.event.value}\ndata: {payload}\n\n"
 
 
 class StartedEvent(BaseModel):
@@ -87,10 +92,10 @@ class AIGenerationEvent(BaseModel):
     message: str = "AI 리딩 생성 중..."
 
 
-class ChunkEvent(BaseModel):
-    """Event for streaming AI response chunks"""
-    chunk: str
-    accumulated_length: int
+class AITokenEvent(BaseModel):
+    """Event for streaming AI response text deltas"""
+    delta: str
+    attempt: int = Field(0, ge=0, description="Generation attempt; a new value means the client should discard earlier deltas")
 
 
 class SectionCompleteEvent(BaseModel):
@@ -131,6 +136,17 @@ def create_sse_event(event_type: SSEEventType, data: BaseModel) -> SSEEvent:
     return SSEEvent(event=event_type, data=data.model_dump(exclude_none=True))
 
 
+def format_ai_token_event(delta: str, attempt: int) -> str:
+    """
+    Format an ai_token event directly as an SSE string
+
+    Token events are sent once per delta, so this skips the pydantic
+    round-trip of create_sse_event(); the payload matches AITokenEvent.
+    """
+    payload = orjson.dumps({"delta": delta, "attempt": attempt}).decode()
+    return f"event: {SSEEventType.AI_TOKEN.value}\ndata: {payload}\n\n"
+
+
 def create_progress_event(
     stage: ReadingStage,
     progress: int,
@@ -0,0 +1,79 @@
+"""
+Unit tests for the shared auth provider HTTP client lifecycle
+
+Tests verify:
+- Provider reuses one keep-alive httpx client
+- A closed client is re-created on next use
+- AuthOrchestrator.close_all closes every provider, even if one fails
+"""
+import pytest
+from unittest.mock import AsyncMock
+
+from src.auth.orchestrator import AuthOrchestrator
+from src.auth.providers.auth0_provider import Auth0Provider
+
+
+def _auth0_provider() -> Auth0Provider:
+    return Auth0Provider({
+        "domain": "tenant.auth0.com",
+        "client_id": "client-id",
+        "client_secret": "client-secret",
+    })
+
+
+class TestProviderHttpClient:
+    """Provider 전용 HTTP 클라이언트 재사용"""
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused(self):
+        provider = _auth0_provider()
+
+        client = provider._get_http_client()
+
+        assert provider._get_http_client() is client
+        await provider.close()
+
+    @pytest.mark.asyncio
+    async def test_closed_client_is_recreated(self):
+        provider = _auth0_provider()
+        client = provider._get_http_client()
+
+        await client.aclose()
+        new_client = provider._get_http_client()
+
+        assert new_client is not client
+        assert not new_client.is_closed
+        await provider.close()
+
+    @pytest.mark.asyncio
+    async def test_close_releases_client(self):
+        provider = _auth0_provider()
+        client = provider._get_http_client()
+
+        await provider.close()
+
+        assert client.is_closed
+        assert provider._http_client is None
+
+
+class TestOrchestratorCloseAll:
+    """AuthOrchestrator 종료 처리"""
+
+    @pytest.mark.asyncio
+    async def test_close_all_closes_every_provider(self):
+        orchestrator = AuthOrchestrator(
+            primary_provider="custom_jwt",
+            configs={"custom_jwt": {"secret_key": "x" * 32}},
+        )
+        auth0 = _auth0_provider()
+        client = auth0._get_http_client()
+        orchestrator.providers["auth0"] = auth0
+
+        # 한 Provider의 종료 실패가 나머지 종료를 막지 않아야 함
+        orchestrator.providers["custom_jwt"].close = AsyncMock(side_effect=RuntimeError("boom"))
+
+        await orchestrator.close_all()
+
+        orchestrator.providers["custom_jwt"].close.assert_awaited_once()
+        assert client.is_closed
+        assert auth0._http_client is None
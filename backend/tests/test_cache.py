@@ -17,7 +17,8 @@ import json
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime
 
-from src.ai.cache import AICache, AICacheMetrics
+from src.ai.cache import AICache, AICacheMetrics, ReadingCache
+from src.ai.prompt_engine.schemas import ReadingResponse as ParsedReading
 from src.ai.orchestrator import CachedAIOrchestrator
 from src.ai.provider import AIProvider
 from src.ai import AIResponse, GenerationConfig
@@ -772,3 +773,97 @@ class TestCacheErrorHandling:
 
             # Clear all should return 0
             assert cache.clear_all() == 0
+
+
+class TestReadingCache:
+    """Test suite for the parsed reading cache"""
+
+    @pytest.fixture
+    def parsed_reading(self):
+        """Valid parsed reading"""
+        return ParsedReading(
+            cards=[
+                {
+                    "card_id": "major_0",
+                    "position": "present",
+                    "interpretation": "바보 카드는 새로운 시작을 상징합니다. " * 5,
+                    "key_message": "새로운 시작의 시간입니다",
+                }
+            ],
+            card_relationships="단일 카드 리딩으로 집중된 에너지를 나타냅니다.",
+            overall_reading="타로는 당신에게 새로운 시작의 시기임을 알려주고 있습니다. " * 5,
+            advice={
+                "immediate_action": "오늘 당장 시작할 수 있는 작은 일을 하나 선택해보세요. " * 2,
+                "short_term": "앞으로 2주 동안은 새로운 경험에 열린 마음을 유지하세요. " * 2,
+                "long_term": "향후 몇 달간은 자신만의 길을 만들어가는 과정이 될 것입니다. " * 2,
+                "mindset": "초심자의 마음을 유지하세요. 배움 자체가 가치있습니다. " * 2,
+                "cautions": "지나친 무모함은 피하세요. 균형을 찾으세요. " * 2,
+            },
+            summary="새로운 시작을 받아들이고 순수한 마음으로 성장하세요",
+        )
+
+    def test_cache_key_depends_on_prompt_system_and_model(self):
+        """Test that every key component changes the cache key"""
+        cache = ReadingCache(redis_client=Mock())
+
+        base = cache._generate_cache_key("prompt", "system", "openai/gpt-4o-mini")
+
+        assert base.startswith("ai:reading:")
+        assert base == cache._generate_cache_key("prompt", "system", "openai/gpt-4o-mini")
+        assert base != cache._generate_cache_key("prompt2", "system", "openai/gpt-4o-mini")
+        assert base != cache._generate_cache_key("prompt", "system2", "openai/gpt-4o-mini")
+        assert base != cache._generate_cache_key("prompt", "system", "anthropic/claude")
+
+    def test_set_then_get_round_trip(self, parsed_reading):
+        """Test that a cached reading is returned unchanged"""
+        store = {}
+        mock_redis = Mock()
+        mock_redis.setex.side_effect = lambda key, ttl, value: store.__setitem__(key, value)
+        mock_redis.get.side_effect = store.get
+
+        cache = ReadingCache(redis_client=mock_redis, default_ttl=60)
+
+        assert cache.get(prompt="p", system_prompt="s", model="m") is None
+        assert cache.set(parsed_reading, prompt="p", system_prompt="s", model="m") is True
+
+        cached = cache.get(prompt="p", system_prompt="s", model="m")
+
+        assert cached == parsed_reading
+        assert mock_redis.setex.call_args[0][1] == 60
+        assert cache.get_metrics()["hits"] == 1
+        assert cache.get_metrics()["misses"] == 1
+
+    def test_get_error_is_treated_as_miss(self):
+        """Test that Redis errors never propagate"""
+        mock_redis = Mock()
+        mock_redis.get.side_effect = Exception("Redis error")
+
+        cache = ReadingCache(redis_client=mock_redis)
+
+        assert cache.get(prompt="Test") is None
+        assert cache.metrics.errors == 1
+
+    def test_reconnects_after_initial_connection_failure(self):
+        """Test that Redis being down at startup does not disable the cache for good"""
+        mock_redis = Mock()
+        mock_redis.get.return_value = None
+
+        with patch('redis.from_url', side_effect=[Exception("Connection refused"), mock_redis]) as from_url:
+            cache = ReadingCache(redis_client=None, reconnect_interval=0)
+            assert cache.redis is None
+
+            assert cache.get(prompt="Test") is None
+
+        assert from_url.call_count == 2
+        assert cache.redis is mock_redis
+        assert cache.metrics.misses == 1
+
+    def test_reconnect_attempts_are_throttled(self):
+        """Test that a Redis outage does not add a connection attempt to every call"""
+        with patch('redis.from_url', side_effect=Exception("Connection refused")) as from_url:
+            cache = ReadingCache(redis_client=None, reconnect_interval=30)
+
+            assert cache.get(prompt="Test") is None
+            assert cache.get(prompt="Test") is None
+
+        assert from_url.call_count == 1
@@ -0,0 +1,141 @@
+"""
+Route tests for the feedback API
+
+단일 문장 쓰기(create_feedback_if_absent / *_if_owner)의 결과를
+409, 403, 404 응답으로 변환하는지 검증합니다.
+"""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# 라우터 패키지 import 시 RAG 임베딩 모듈까지 로드되므로 전체 백엔드 의존성이 필요
+pytest.importorskip("sentence_transformers")
+
+from src.api.dependencies.auth import get_current_active_user
+from src.api.routes import feedback as feedback_routes
+from src.database.factory import get_database_provider
+from src.database.provider import Feedback as FeedbackDTO
+
+USER_ID = "11111111-1111-1111-1111-111111111111"
+OTHER_USER_ID = "22222222-2222-2222-2222-222222222222"
+READING_ID = "33333333-3333-3333-3333-333333333333"
+FEEDBACK_ID = "44444444-4444-4444-4444-444444444444"
+
+
+def _feedback(user_id: str = USER_ID) -> FeedbackDTO:
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return FeedbackDTO(
+        id=FEEDBACK_ID,
+        reading_id=READING_ID,
+        user_id=user_id,
+        rating=5,
+        comment=None,
+        helpful=True,
+        accurate=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class FakeFeedbackProvider:
+    """피드백 라우트가 사용하는 메서드만 제공하는 Provider"""
+
+    def __init__(self):
+        self.existing: Optional[FeedbackDTO] = None
+        self.owned_write_result: Any = None
+        self.created: Optional[FeedbackDTO] = None
+
+    async def get_reading_by_id(self, reading_id: str):
+        return SimpleNamespace(id=reading_id, spread_type="one_card")
+
+    async def create_feedback_if_absent(self, feedback_data: Dict[str, Any]) -> Optional[FeedbackDTO]:
+        return self.created
+
+    async def update_feedback_if_owner(self, feedback_id, user_id, feedback_data):
+        return self.owned_write_result
+
+    async def delete_feedback_if_owner(self, feedback_id, user_id) -> bool:
+        return bool(self.owned_write_result)
+
+    async def get_feedback_by_id(self, feedback_id: str) -> Optional[FeedbackDTO]:
+        return self.existing
+
+
+@pytest.fixture
+def provider():
+    return FakeFeedbackProvider()
+
+
+@pytest.fixture
+def stats_invalidation(monkeypatch):
+    invalidate = AsyncMock()
+    monkeypatch.setattr(feedback_routes, "invalidate_feedback_stats_cache", invalidate)
+    return invalidate
+
+
+@pytest.fixture
+def client(provider, stats_invalidation):
+    app = FastAPI()
+    app.include_router(feedback_routes.router)
+    app.dependency_overrides[get_database_provider] = lambda: provider
+    app.dependency_overrides[get_current_active_user] = lambda: SimpleNamespace(id=USER_ID)
+    return TestClient(app)
+
+
+class TestCreateFeedback:
+    def test_create_returns_201_and_invalidates_stats(self, client, provider, stats_invalidation):
+        provider.created = _feedback()
+
+        response = client.post(f"/api/v1/readings/{READING_ID}/feedback", json={"rating": 5})
+
+        assert response.status_code == 201
+        assert response.json()["id"] == FEEDBACK_ID
+        stats_invalidation.assert_awaited_once()
+
+    def test_duplicate_returns_409(self, client, provider, stats_invalidation):
+        provider.created = None
+
+        response = client.post(f"/api/v1/readings/{READING_ID}/feedback", json={"rating": 5})
+
+        assert response.status_code == 409
+        stats_invalidation.assert_not_awaited()
+
+
+def _owner_write(client: TestClient, method: str):
+    if method == "put":
+        return client.put(f"/api/v1/feedback/{FEEDBACK_ID}", json={"rating": 4})
+    return client.delete(f"/api/v1/feedback/{FEEDBACK_ID}")
+
+
+class TestOwnerWrites:
+    @pytest.mark.parametrize("method", ["put", "delete"])
+    def test_missing_feedback_returns_404(self, client, provider, method):
+        provider.owned_write_result = None
+        provider.existing = None
+
+        response = _owner_write(client, method)
+
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize("method", ["put", "delete"])
+    def test_other_users_feedback_returns_403(self, client, provider, stats_invalidation, method):
+        provider.owned_write_result = None
+        provider.existing = _feedback(user_id=OTHER_USER_ID)
+
+        response = _owner_write(client, method)
+
+        assert response.status_code == 403
+        stats_invalidation.assert_not_awaited()
+
+    def test_owner_update_succeeds(self, client, provider, stats_invalidation):
+        provider.owned_write_result = _feedback()
+
+        response = client.put(f"/api/v1/feedback/{FEEDBACK_ID}", json={"rating": 4})
+
+        assert response.status_code == 200
+        stats_invalidation.assert_awaited_once()
@@ -0,0 +1,138 @@
+"""
+Unit tests for FirestoreProvider caching and pagination helpers
+
+Firestore client와 Redis는 Mock으로 대체합니다.
+"""
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from google.auth.credentials import AnonymousCredentials
+from google.cloud.firestore_v1 import Client
+from google.cloud.firestore_v1.query import Query
+
+from src.database import firestore_provider as firestore_module
+from src.database.firestore_provider import FirestoreProvider, SETTINGS_INVALIDATION_CHANNEL
+
+
+def _make_provider(subscriber_alive: bool = True):
+    """Firestore client와 Redis pub/sub을 Mock으로 대체한 provider 생성"""
+    fake_cache = MagicMock()
+    if subscriber_alive:
+        subscriber = MagicMock()
+        subscriber.is_alive.return_value = True
+        fake_cache.subscribe.return_value = subscriber
+    else:
+        fake_cache.subscribe.return_value = None
+
+    with patch.object(firestore_module.firestore, "client", return_value=MagicMock()), \
+            patch.object(firestore_module, "cache", fake_cache):
+        provider = FirestoreProvider()
+
+    provider._fetch_app_settings = AsyncMock(
+        return_value={"admin": {"admin_emails": ["admin@example.com"]}}
+    )
+    return provider, fake_cache
+
+
+class TestSettingsCache:
+    """앱 설정 캐시와 인스턴스 간 무효화"""
+
+    @pytest.mark.asyncio
+    async def test_settings_cached_while_subscribed(self):
+        provider, _ = _make_provider()
+
+        assert await provider.get_admin_emails() == ["admin@example.com"]
+        assert await provider.get_admin_emails() == ["admin@example.com"]
+
+        assert provider._fetch_app_settings.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidation_message_clears_cache(self):
+        provider, fake_cache = _make_provider()
+        await provider.get_admin_emails()
+
+        # 다른 인스턴스가 발행한 무효화 메시지를 구독 핸들러로 전달
+        channel, handler = fake_cache.subscribe.call_args.args
+        assert channel == SETTINGS_INVALIDATION_CHANNEL
+        handler({"type": "message", "data": "app_settings"})
+
+        await provider.get_admin_emails()
+        assert provider._fetch_app_settings.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_bypassed_without_subscription(self):
+        provider, _ = _make_provider(subscriber_alive=False)
+
+        await provider.get_admin_emails()
+        await provider.get_admin_emails()
+
+        assert provider._fetch_app_settings.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_resubscribe_runs_off_event_loop(self):
+        provider, fake_cache = _make_provider(subscriber_alive=False)
+        provider._settings_subscribe_attempted_at = 0
+        subscriber = MagicMock()
+        subscriber.is_alive.return_value = True
+        fake_cache.subscribe.return_value = subscriber
+
+        threaded_calls = []
+        real_to_thread = asyncio.to_thread
+
+        async def _recording_to_thread(func, *args, **kwargs):
+            threaded_calls.append(func)
+            return await real_to_thread(func, *args, **kwargs)
+
+        with patch.object(firestore_module, "cache", fake_cache), \
+                patch.object(firestore_module.asyncio, "to_thread", _recording_to_thread):
+            await provider.get_admin_emails()
+            await provider.get_admin_emails()
+
+        # 재구독(pub/sub 연결)은 스레드에서 한 번만 실행되고 이후 캐시를 사용
+        assert threaded_calls == [provider._subscribe_settings_invalidation]
+        assert fake_cache.subscribe.call_count == 2
+        assert provider._fetch_app_settings.await_count == 1
+
+    def test_invalidate_publishes_to_other_instances(self):
+        provider, fake_cache = _make_provider()
+
+        with patch.object(firestore_module, "cache", fake_cache):
+            provider.invalidate_settings_cache()
+
+        fake_cache.publish.assert_called_once_with(SETTINGS_INVALIDATION_CHANNEL, "app_settings")
+
+
+class TestReadingsCursor:
+    """키셋 커서 조회"""
+
+    @pytest.mark.asyncio
+    async def test_start_after_uses_cursor_values(self):
+        provider, _ = _make_provider()
+        client = Client(project="test-project", credentials=AnonymousCredentials())
+        provider.readings_collection = client.collection("readings")
+        cursor_created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        captured = []
+
+        def _fake_stream(query, *args, **kwargs):
+            captured.append(query)
+            return iter([])
+
+        with patch.object(Query, "stream", _fake_stream):
+            readings = await provider.get_readings_by_user_after(
+                user_id="user-1",
+                after_created_at=cursor_created_at,
+                after_id="reading-9",
+                limit=5,
+            )
+
+        assert readings == []
+        query_pb = captured[0]._to_protobuf()
+        assert [order.field.field_path for order in query_pb.order_by] == ["created_at", "__name__"]
+        assert query_pb.start_at.before is False
+        cursor_values = query_pb.start_at.values
+        assert cursor_values[0].timestamp_value == cursor_created_at
+        assert cursor_values[1].reference_value.endswith("/documents/readings/reading-9")
+        assert query_pb.limit == 5
@@ -272,6 +272,80 @@ class TestOpenAIProviderGeneration:
             assert mock_create.call_args.kwargs['model'] == "gpt-3.5-turbo"
 
 
+
+class _FakeChatStream:
+    """AsyncStream stand-in that records whether close() was called"""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        self.closed = True
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+def _stream_chunk(content=None, finish_reason=None, usage=None):
+    choices = [] if content is None and finish_reason is None else [
+        Mock(delta=Mock(content=content), finish_reason=finish_reason)
+    ]
+    return Mock(choices=choices, usage=usage)
+
+
+class TestOpenAIProviderStreaming:
+    """Test suite for streaming generation (mocked)"""
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_deltas_and_closes_stream(self, openai_provider):
+        """Test deltas are yielded, followed by the final AIResponse"""
+        fake_stream = _FakeChatStream([
+            _stream_chunk("The Fool "),
+            _stream_chunk("begins", finish_reason="stop"),
+            _stream_chunk(usage=Mock(prompt_tokens=20, completion_tokens=2, total_tokens=22)),
+        ])
+
+        with patch.object(
+            openai_provider.client.chat.completions,
+            'create',
+            new=AsyncMock(return_value=fake_stream)
+        ):
+            items = [item async for item in openai_provider.stream(prompt="Test")]
+
+        assert items[:2] == ["The Fool ", "begins"]
+        assert isinstance(items[-1], AIResponse)
+        assert items[-1].content == "The Fool begins"
+        assert items[-1].completion_tokens == 2
+        assert fake_stream.closed
+
+    @pytest.mark.asyncio
+    async def test_stream_closes_http_stream_on_early_exit(self, openai_provider):
+        """Test the HTTP stream is closed when the consumer stops early"""
+        fake_stream = _FakeChatStream([_stream_chunk("The Fool "), _stream_chunk("begins")])
+
+        with patch.object(
+            openai_provider.client.chat.completions,
+            'create',
+            new=AsyncMock(return_value=fake_stream)
+        ):
+            stream = openai_provider.stream(prompt="Test")
+            assert await stream.__anext__() == "The Fool "
+            await stream.aclose()
+
+        assert fake_stream.closed
+
+
 class TestProviderFactoryIntegration:
     """Test suite for ProviderFactory integration"""
 
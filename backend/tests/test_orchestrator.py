@@ -290,6 +290,111 @@ class TestOrchestratorRetryLogic:
         assert call_count == 1  # No retries for auth error
 
 
+class TestOrchestratorStream:
+    """Test suite for streaming with deadline and pre-first-token fallback"""
+
+    @staticmethod
+    async def _collect(orchestrator, **kwargs):
+        chunks = []
+        final = None
+        async for item in orchestrator.stream(prompt="Test prompt", **kwargs):
+            if isinstance(item, str):
+                chunks.append(item)
+            else:
+                final = item
+        return chunks, final
+
+    @pytest.mark.asyncio
+    async def test_stream_timeout_before_first_token_falls_back(self):
+        """A provider that hangs before its first token is abandoned at the deadline"""
+        primary = MockProvider("primary", should_succeed=True, delay=5)
+        fallback = MockProvider("fallback", should_succeed=True)
+
+        orchestrator = AIOrchestrator([primary, fallback], max_retries=1)
+
+        start_time = time.time()
+        chunks, final = await self._collect(orchestrator, timeout=0.2)
+
+        assert time.time() - start_time < 2.0
+        assert chunks == ["Response from fallback"]
+        assert final.response.provider == "fallback"
+
+    @pytest.mark.asyncio
+    async def test_stream_retries_transient_error_before_first_token(self):
+        """Transient errors before the first token are retried on the same provider"""
+        call_count = 0
+
+        class FlakyProvider(MockProvider):
+            async def generate(self, prompt: str, **kwargs):
+                nonlocal call_count
+                call_count += 1
+                if call_count < 2:
+                    raise AIRateLimitError("Rate limited", provider=self._name)
+                return await super().generate(prompt, **kwargs)
+
+        provider = FlakyProvider("primary")
+        orchestrator = AIOrchestrator([provider], max_retries=2)
+
+        with patch("src.ai.orchestrator.asyncio.sleep", new=AsyncMock()):
+            chunks, final = await self._collect(orchestrator)
+
+        assert call_count == 2
+        assert final.response.provider == "primary"
+
+    @pytest.mark.asyncio
+    async def test_started_stream_without_final_response_raises(self):
+        """A stream that ends after sending text must not fall through to the next provider"""
+
+        class TruncatedProvider(MockProvider):
+            async def stream(self, prompt: str, **kwargs):
+                yield "partial"
+
+        primary = TruncatedProvider("primary")
+        fallback = MockProvider("fallback")
+
+        orchestrator = AIOrchestrator([primary, fallback])
+
+        chunks = []
+        with pytest.raises(AIProviderError) as exc_info:
+            async for item in orchestrator.stream(prompt="Test prompt"):
+                chunks.append(item)
+
+        assert exc_info.value.error_type == "STREAM_INCOMPLETE"
+        assert chunks == ["partial"]
+        assert fallback.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_records_failed_attempts(self):
+        """Failed attempts before the first token appear in all_attempts"""
+        primary = MockProvider("primary", should_succeed=False)
+        fallback = MockProvider("fallback")
+
+        orchestrator = AIOrchestrator([primary, fallback])
+
+        chunks, final = await self._collect(orchestrator)
+
+        assert chunks == ["Response from fallback"]
+        assert [a.provider for a in final.all_attempts] == ["primary", "fallback"]
+        assert final.all_attempts[0].finish_reason == "error"
+        assert final.all_attempts[0].content == ""
+        assert final.total_cost == pytest.approx(0.001)
+
+    @pytest.mark.asyncio
+    async def test_stream_all_providers_fail(self):
+        """Failures of every provider are summarised in ALL_PROVIDERS_FAILED"""
+        primary = MockProvider("primary", should_succeed=False)
+        fallback = MockProvider("fallback", should_succeed=False)
+
+        orchestrator = AIOrchestrator([primary, fallback])
+
+        with pytest.raises(AIProviderError) as exc_info:
+            await self._collect(orchestrator)
+
+        assert exc_info.value.error_type == "ALL_PROVIDERS_FAILED"
+        assert "Primary(primary)" in str(exc_info.value)
+        assert "Fallback(fallback)" in str(exc_info.value)
+
+
 class TestOrchestratorStatus:
     """Test suite for orchestrator status"""
 
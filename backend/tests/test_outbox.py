@@ -0,0 +1,84 @@
+"""
+Unit tests for OutboxRelay
+
+DB Provider와 Redis 파이프라인을 가짜 객체로 대체해 선점, 발행, 처리 완료 표시,
+Redis 오류 시 선점 해제를 검증합니다.
+"""
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.outbox import FEEDBACK_CREATED_EVENT, OUTBOX_STREAM_PREFIX, OutboxRelay
+
+
+def _event(event_id: str, rating: int = 5):
+    return {
+        "id": event_id,
+        "event_type": FEEDBACK_CREATED_EVENT,
+        "payload": {"feedback_id": event_id, "rating": rating},
+        "created_at": datetime(2026, 1, 1),
+    }
+
+
+def _make_relay(events, pipeline_error: Exception = None):
+    db_provider = MagicMock()
+    db_provider.claim_outbox_events = AsyncMock(return_value=events)
+    db_provider.mark_outbox_events_processed = AsyncMock(return_value=len(events))
+    db_provider.release_outbox_events = AsyncMock(return_value=len(events))
+
+    pipeline = MagicMock()
+    if pipeline_error is not None:
+        pipeline.execute.side_effect = pipeline_error
+    redis_client = MagicMock()
+    redis_client.pipeline.return_value = pipeline
+
+    relay = OutboxRelay(db_provider, redis_client, batch_size=10, claim_lease=30.0)
+    return relay, db_provider, pipeline
+
+
+class TestOutboxRelay:
+    """relay_once 한 배치 처리"""
+
+    @pytest.mark.asyncio
+    async def test_publishes_claimed_events_and_marks_processed(self):
+        relay, db_provider, pipeline = _make_relay([_event("e1"), _event("e2", rating=3)])
+
+        published = await relay.relay_once()
+
+        assert published == 2
+        db_provider.claim_outbox_events.assert_awaited_once_with(limit=10, lease_seconds=30.0)
+        assert pipeline.xadd.call_count == 2
+        stream, fields = pipeline.xadd.call_args_list[0].args
+        assert stream == f"{OUTBOX_STREAM_PREFIX}{FEEDBACK_CREATED_EVENT}"
+        assert fields["event_id"] == "e1"
+        assert json.loads(fields["payload"]) == {"feedback_id": "e1", "rating": 5}
+        pipeline.execute.assert_called_once()
+        db_provider.mark_outbox_events_processed.assert_awaited_once_with(["e1", "e2"])
+        db_provider.release_outbox_events.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_empty_outbox_publishes_nothing(self):
+        relay, db_provider, pipeline = _make_relay([])
+
+        assert await relay.relay_once() == 0
+        pipeline.execute.assert_not_called()
+        db_provider.mark_outbox_events_processed.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_releases_claim_for_retry(self):
+        relay, db_provider, pipeline = _make_relay(
+            [_event("e1")], pipeline_error=ConnectionError("redis down")
+        )
+
+        with pytest.raises(ConnectionError):
+            await relay.relay_once()
+
+        db_provider.mark_outbox_events_processed.assert_not_awaited()
+        db_provider.release_outbox_events.assert_awaited_once_with(["e1"])
+
+        # 다음 폴링에서 같은 이벤트를 다시 선점해 발행
+        pipeline.execute.side_effect = None
+        assert await relay.relay_once() == 1
+        db_provider.mark_outbox_events_processed.assert_awaited_once_with(["e1"])
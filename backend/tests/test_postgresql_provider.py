@@ -0,0 +1,223 @@
+"""
+Unit tests for PostgreSQLProvider query construction
+
+PostgreSQL 서버 없이 SQLAlchemy 문장을 postgresql 방언으로 컴파일해 검증합니다.
+"""
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query, Session
+
+from src.core.outbox import FEEDBACK_CREATED_EVENT
+from src.database.postgresql_provider import PostgreSQLProvider
+from src.models.feedback import Feedback as FeedbackModel
+
+
+def _make_provider(session) -> PostgreSQLProvider:
+    """설정 관련 추상 메서드가 남아 있어도 인스턴스화할 수 있도록 생성"""
+    with patch.object(PostgreSQLProvider, "__abstractmethods__", frozenset()):
+        provider = PostgreSQLProvider()
+    provider._session = session
+    return provider
+
+
+def _compile(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class RecordingSession:
+    """실행된 문장과 commit 순서를 기록하는 세션 (RETURNING 결과는 미리 지정)"""
+
+    def __init__(self, returning=None):
+        self.returning = returning
+        self.calls = []
+
+    def scalars(self, statement):
+        self.calls.append(("scalars", statement))
+        return SimpleNamespace(first=lambda: self.returning)
+
+    def execute(self, statement):
+        self.calls.append(("execute", statement))
+        return SimpleNamespace(
+            scalar_one_or_none=lambda: self.returning,
+            all=lambda: self.returning or [],
+            rowcount=len(self.returning or []) if isinstance(self.returning, list) else 0,
+        )
+
+    def commit(self):
+        self.calls.append(("commit", None))
+
+
+def _feedback_model(**overrides) -> FeedbackModel:
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    values = dict(
+        id=uuid.uuid4(),
+        reading_id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        rating=5,
+        comment="좋아요",
+        helpful=True,
+        accurate=True,
+        created_at=now,
+        updated_at=now,
+    )
+    values.update(overrides)
+    return FeedbackModel(**values)
+
+
+class TestReadingsCursor:
+    """키셋 커서 조회"""
+
+    @pytest.mark.asyncio
+    async def test_keyset_query_uses_cursor_values(self):
+        provider = _make_provider(Session())
+        captured = []
+
+        def _fake_all(query):
+            captured.append(query)
+            return []
+
+        with patch.object(Query, "all", _fake_all):
+            readings = await provider.get_readings_by_user_after(
+                user_id="user-1",
+                after_created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+                after_id="reading-9",
+                limit=5,
+                spread_type="one_card",
+            )
+
+        assert readings == []
+        statement = captured[0].statement
+        sql = _compile(statement)
+        assert "(readings.created_at, readings.id) < (" in sql
+        assert "ORDER BY readings.created_at DESC, readings.id DESC" in sql
+        assert "LIMIT" in sql
+
+        params = statement.compile(dialect=postgresql.dialect()).params
+        assert datetime(2026, 1, 1, tzinfo=timezone.utc) in params.values()
+        assert "reading-9" in params.values()
+        assert "one_card" in params.values()
+
+
+class TestFeedbackWrites:
+    """피드백 생성/수정/삭제 단일 문장 처리"""
+
+    @pytest.mark.asyncio
+    async def test_create_writes_outbox_row_in_same_transaction(self):
+        feedback = _feedback_model()
+        session = RecordingSession(returning=feedback)
+        provider = _make_provider(session)
+
+        created = await provider.create_feedback_if_absent({
+            "reading_id": str(feedback.reading_id),
+            "user_id": str(feedback.user_id),
+            "rating": 5,
+        })
+
+        assert created.id == str(feedback.id)
+        assert [name for name, _ in session.calls] == ["scalars", "execute", "commit"]
+
+        insert_sql = _compile(session.calls[0][1])
+        assert "INSERT INTO feedbacks" in insert_sql
+        assert "ON CONFLICT (reading_id, user_id) DO NOTHING" in insert_sql
+        assert "RETURNING" in insert_sql
+
+        outbox_statement = session.calls[1][1]
+        assert outbox_statement.table.name == "outbox_events"
+        outbox_values = outbox_statement.compile(dialect=postgresql.dialect()).params
+        assert outbox_values["event_type"] == FEEDBACK_CREATED_EVENT
+        assert outbox_values["payload"]["feedback_id"] == str(feedback.id)
+
+    @pytest.mark.asyncio
+    async def test_create_duplicate_returns_none_without_outbox_row(self):
+        session = RecordingSession(returning=None)
+        provider = _make_provider(session)
+
+        created = await provider.create_feedback_if_absent({
+            "reading_id": str(uuid.uuid4()),
+            "user_id": str(uuid.uuid4()),
+            "rating": 3,
+        })
+
+        assert created is None
+        assert [name for name, _ in session.calls] == ["scalars", "commit"]
+
+    @pytest.mark.asyncio
+    async def test_update_filters_by_owner(self):
+        session = RecordingSession(returning=None)
+        provider = _make_provider(session)
+
+        updated = await provider.update_feedback_if_owner(
+            feedback_id=str(uuid.uuid4()),
+            user_id=str(uuid.uuid4()),
+            feedback_data={"rating": 4},
+        )
+
+        assert updated is None
+        update_sql = _compile(session.calls[0][1])
+        assert "UPDATE feedbacks SET rating=" in update_sql
+        assert "WHERE feedbacks.id = " in update_sql
+        assert "AND feedbacks.user_id = " in update_sql
+        assert "RETURNING" in update_sql
+
+    @pytest.mark.asyncio
+    async def test_delete_filters_by_owner(self):
+        feedback_id = uuid.uuid4()
+        session = RecordingSession(returning=feedback_id)
+        provider = _make_provider(session)
+
+        deleted = await provider.delete_feedback_if_owner(
+            feedback_id=str(feedback_id),
+            user_id=str(uuid.uuid4()),
+        )
+
+        assert deleted is True
+        delete_sql = _compile(session.calls[0][1])
+        assert "DELETE FROM feedbacks WHERE feedbacks.id = " in delete_sql
+        assert "AND feedbacks.user_id = " in delete_sql
+        assert "RETURNING feedbacks.id" in delete_sql
+        assert session.calls[-1][0] == "commit"
+
+
+class TestOutboxClaims:
+    """outbox 이벤트 선점"""
+
+    @pytest.mark.asyncio
+    async def test_claim_skips_locked_rows_and_returns_oldest_first(self):
+        newer = SimpleNamespace(
+            id=uuid.uuid4(), event_type=FEEDBACK_CREATED_EVENT, payload={}, created_at=datetime(2026, 1, 2)
+        )
+        older = SimpleNamespace(
+            id=uuid.uuid4(), event_type=FEEDBACK_CREATED_EVENT, payload={}, created_at=datetime(2026, 1, 1)
+        )
+        session = RecordingSession(returning=[newer, older])
+        provider = _make_provider(session)
+
+        events = await provider.claim_outbox_events(limit=10, lease_seconds=30)
+
+        assert [event["id"] for event in events] == [str(older.id), str(newer.id)]
+        claim_sql = _compile(session.calls[0][1])
+        assert claim_sql.startswith("UPDATE outbox_events SET claimed_until=")
+        assert "outbox_events.processed_at IS NULL" in claim_sql
+        assert "outbox_events.claimed_until IS NULL OR outbox_events.claimed_until < " in claim_sql
+        assert "ORDER BY outbox_events.created_at" in claim_sql
+        assert "FOR UPDATE SKIP LOCKED" in claim_sql
+        assert "RETURNING outbox_events.id" in claim_sql
+        assert session.calls[-1][0] == "commit"
+
+    @pytest.mark.asyncio
+    async def test_release_clears_claim_of_unprocessed_events(self):
+        session = RecordingSession(returning=[object()])
+        provider = _make_provider(session)
+
+        released = await provider.release_outbox_events([str(uuid.uuid4())])
+
+        assert released == 1
+        release_sql = _compile(session.calls[0][1])
+        assert "SET claimed_until=" in release_sql
+        assert "outbox_events.processed_at IS NULL" in release_sql
+        assert session.calls[-1][0] == "commit"
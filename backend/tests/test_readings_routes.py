@@ -0,0 +1,240 @@
+"""
+Route tests for the readings API
+
+잘린 응답의 선행 재시도가 파싱과 실제로 겹쳐서 시작되는지,
+요청이 취소되면 선행 재시도도 함께 취소되는지,
+목록 커서의 id가 잘못되면 400으로 거부되는지 검증합니다.
+"""
+import asyncio
+import base64
+import threading
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import HTTPException, Response
+
+# 라우터 패키지 import 시 RAG 임베딩 모듈까지 로드되므로 전체 백엔드 의존성이 필요
+pytest.importorskip("sentence_transformers")
+
+from src.ai.models import AIResponse, OrchestratorResponse
+from src.ai.prompt_engine.schemas import ParseError
+from src.api.routes import readings as readings_routes
+from src.core.card_shuffle import CardData, DrawnCard, Orientation
+from src.schemas.reading import ReadingRequest
+
+
+class FakeAdvice(SimpleNamespace):
+    def model_dump(self):
+        return dict(self.__dict__)
+
+
+class FakeOrchestrator:
+    """첫 응답은 max_tokens로 잘리고, 이후 응답은 정상 종료"""
+
+    primary_provider = SimpleNamespace(provider_name="stub", default_model="stub-model")
+
+    def __init__(self, events, retry_delay: float = 0):
+        self.events = events
+        self.retry_delay = retry_delay
+        self.calls = 0
+
+    async def generate(self, prompt, system_prompt=None, config=None):
+        self.calls += 1
+        self.events.append(f"generate:{config.max_tokens}")
+        if self.calls > 1 and self.retry_delay:
+            try:
+                await asyncio.sleep(self.retry_delay)
+            except asyncio.CancelledError:
+                self.events.append("generate_cancelled")
+                raise
+        response = AIResponse(
+            content=f"response-{self.calls}",
+            model="stub-model",
+            provider="stub",
+            completion_tokens=config.max_tokens,
+            finish_reason="max_tokens" if self.calls == 1 else "stop",
+        )
+        return OrchestratorResponse(response=response, all_attempts=[response], total_cost=0.0)
+
+
+async def _async_value(value):
+    return value
+
+
+@pytest.fixture
+def drawn_card():
+    card = CardData(
+        id=1,
+        name="The Fool",
+        name_ko="바보",
+        arcana_type="major",
+        number=0,
+        suit=None,
+        keywords_upright=["start"],
+        keywords_reversed=["risk"],
+        meaning_upright="새로운 시작",
+        meaning_reversed="주의",
+        description=None,
+        symbolism=None,
+        image_url=None,
+    )
+    return DrawnCard(card, Orientation.UPRIGHT)
+
+
+def _patch_reading_pipeline(monkeypatch, orchestrator, fake_parse, drawn_card):
+    """AI 호출과 파싱 외의 리딩 생성 단계를 가짜로 대체하고 DB provider 반환"""
+
+    async def fake_draw_cards(*args, **kwargs):
+        return [drawn_card]
+
+    class FakeEnricher:
+        async def enrich_prompt_context_async(self, **kwargs):
+            return {}
+
+    template = SimpleNamespace(render=lambda **kwargs: "prompt")
+
+    monkeypatch.setattr(
+        readings_routes, "get_spread_meta", lambda _: SimpleNamespace(card_count=1, max_tokens=1000)
+    )
+    monkeypatch.setattr(readings_routes, "get_orchestrator", lambda _: _async_value(orchestrator))
+    monkeypatch.setattr(readings_routes.CardShuffleService, "draw_cards", fake_draw_cards)
+    monkeypatch.setattr(readings_routes, "get_context_enricher", lambda: FakeEnricher())
+    monkeypatch.setattr(
+        readings_routes.ContextBuilder, "build_card_context", staticmethod(lambda _: {"id": 1})
+    )
+    monkeypatch.setattr(
+        readings_routes, "resolve_reading_template", lambda *_: ("reading/one_card.txt", template)
+    )
+    monkeypatch.setattr(readings_routes, "get_reading_cache", lambda: None)
+    monkeypatch.setattr(readings_routes, "ResponseParser", SimpleNamespace(parse=fake_parse))
+    monkeypatch.setattr(
+        readings_routes,
+        "ReadingValidator",
+        SimpleNamespace(validate_reading_quality=lambda **kwargs: None),
+    )
+    monkeypatch.setattr(readings_routes, "invalidate_reading_count_cache", AsyncMock())
+    monkeypatch.setattr(
+        readings_routes,
+        "_reading_response_from_components",
+        lambda dto, data, dicts: SimpleNamespace(id=dto.id, summary=data["summary"]),
+    )
+
+    return SimpleNamespace(
+        create_reading=AsyncMock(return_value=SimpleNamespace(id="reading-1")),
+        create_llm_usage_logs_batch=AsyncMock(),
+    )
+
+
+def _create_reading(db_provider):
+    return readings_routes.create_reading(
+        ReadingRequest(question="새로운 시작?", spread_type="one_card", category="career"),
+        Response(),
+        current_user=SimpleNamespace(id="user-1"),
+        db_provider=db_provider,
+    )
+
+
+@pytest.mark.asyncio
+async def test_truncated_response_retry_starts_before_parse_finishes(monkeypatch, drawn_card):
+    events = []
+    orchestrator = FakeOrchestrator(events)
+    parsed = SimpleNamespace(
+        summary="요약",
+        cards=[SimpleNamespace(position="현재", interpretation="해석", key_message="핵심")],
+        overall_reading="전체",
+        advice=FakeAdvice(headline="조언"),
+        card_relationships=None,
+    )
+
+    def fake_parse(raw_response):
+        events.append(f"parse_start:{raw_response}")
+        time.sleep(0.1)
+        events.append(f"parse_end:{raw_response}")
+        if raw_response == "response-1":
+            raise ParseError("truncated JSON")
+        return parsed
+
+    db_provider = _patch_reading_pipeline(monkeypatch, orchestrator, fake_parse, drawn_card)
+
+    result = await _create_reading(db_provider)
+
+    assert result.summary == "요약"
+    assert orchestrator.calls == 2
+    # 선행 재시도는 잘린 응답의 파싱이 끝나기 전에 시작되어야 함
+    assert events.index("generate:1300") < events.index("parse_end:response-1")
+
+    _, logs = db_provider.create_llm_usage_logs_batch.await_args.args
+    assert [log["purpose"] for log in logs] == ["parse_retry", "main_reading"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_cancels_speculative_retry(monkeypatch, drawn_card):
+    events = []
+    orchestrator = FakeOrchestrator(events, retry_delay=10)
+    parse_started = threading.Event()
+    release_parse = threading.Event()
+
+    def fake_parse(raw_response):
+        parse_started.set()
+        release_parse.wait(timeout=1)
+        raise ParseError("truncated JSON")
+
+    db_provider = _patch_reading_pipeline(monkeypatch, orchestrator, fake_parse, drawn_card)
+
+    request_task = asyncio.create_task(_create_reading(db_provider))
+    try:
+        await asyncio.to_thread(parse_started.wait, 1)
+        await asyncio.sleep(0.01)
+        assert events == ["generate:1000", "generate:1300"]
+
+        # 파싱 대기 중 요청 취소 (클라이언트 연결 종료 등)
+        request_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await request_task
+        await asyncio.sleep(0)
+    finally:
+        release_parse.set()
+
+    assert events[-1] == "generate_cancelled"
+    db_provider.create_reading.assert_not_awaited()
+
+
+def _cursor(raw: str) -> str:
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+@pytest.mark.parametrize("provider", ["postgresql", "firestore"])
+def test_decode_reading_cursor_round_trip(monkeypatch, provider):
+    monkeypatch.setattr(readings_routes.settings, "DATABASE_PROVIDER", provider)
+    reading_id = "3f2b8c1e-9a4d-4e7b-8f0a-1c2d3e4f5a6b"
+
+    created_at, decoded_id = readings_routes._decode_reading_cursor(
+        _cursor(f"2026-01-01T00:00:00+00:00|{reading_id}")
+    )
+
+    assert created_at == datetime(2026, 1, 1, tzinfo=timezone.utc)
+    assert decoded_id == reading_id
+
+
+@pytest.mark.parametrize(
+    "provider,reading_id",
+    [
+        ("postgresql", "not-a-uuid"),
+        ("postgresql", ""),
+        ("firestore", ""),
+        ("firestore", "readings/other-user"),
+        ("firestore", ".."),
+    ],
+)
+def test_decode_reading_cursor_rejects_invalid_id(monkeypatch, provider, reading_id):
+    monkeypatch.setattr(readings_routes.settings, "DATABASE_PROVIDER", provider)
+
+    with pytest.raises(HTTPException) as exc_info:
+        readings_routes._decode_reading_cursor(
+            _cursor(f"2026-01-01T00:00:00+00:00|{reading_id}")
+        )
+
+    assert exc_info.value.status_code == 400
@@ -71,10 +71,21 @@ class _FakeAnthropic:
         return None
 
 
+class _FakeHttpxClient:
+    is_closed = False
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def aclose(self):
+        return None
+
+
 sys.modules.setdefault(
     "anthropic",
     SimpleNamespace(
         AsyncAnthropic=_FakeAnthropic,
+        DefaultAsyncHttpxClient=_FakeHttpxClient,
         APIError=Exception,
         RateLimitError=Exception,
         AuthenticationError=Exception,
@@ -142,10 +153,12 @@ class FakeDBProvider:
         return StubReading(reading_data["id"])
 
 
+async def _async_value(value):
+    return value
+
+
 @pytest.mark.asyncio
 async def test_generate_reading_stream_schedules_background_persistence(monkeypatch):
-    readings_stream._persistence_tasks.clear()
-
     card = CardData(
         id=1,
         name="The Fool",
@@ -186,15 +199,11 @@ async def test_generate_reading_stream_schedules_background_persistence(monkeypa
         def render(self, **kwargs):
             return self._text
 
-    class FakeJinja:
-        def get_template(self, name: str):
-            if name.startswith("system"):
-                return FakeTemplate("system")
-            if name.startswith("output"):
-                return FakeTemplate("{\"summary\": \"stub\"}")
-            return FakeTemplate("prompt")
-
-    monkeypatch.setattr(readings_stream, "jinja_env", FakeJinja())
+    monkeypatch.setattr(
+        readings_stream,
+        "resolve_reading_template",
+        lambda spread_type, language: (f"reading/{spread_type}.txt", FakeTemplate("prompt")),
+    )
 
     fake_ai_response = AIResponse(
         content="stub",
@@ -214,7 +223,11 @@ async def test_generate_reading_stream_schedules_background_persistence(monkeypa
                 total_cost=0.0,
             )
 
-    monkeypatch.setattr(readings_stream, "get_orchestrator", lambda: FakeOrchestrator())
+        async def stream(self, **kwargs):
+            yield fake_ai_response.content
+            yield await self.generate(**kwargs)
+
+    monkeypatch.setattr(readings_stream, "get_orchestrator", lambda *_: _async_value(FakeOrchestrator()))
 
     class FakeParser:
         def parse(self, _content):
@@ -237,6 +250,11 @@ async def test_generate_reading_stream_schedules_background_persistence(monkeypa
     async for event in readings_stream.generate_reading_stream(request, "user-1", db_provider):
         events.append(event)
 
+    token_events = [event for event in events if event.startswith("event: ai_token")]
+    assert token_events == ['event: ai_token\ndata: {"delta":"stub","attempt":0}\n\n']
+    assert events.index(token_events[0]) < next(
+        i for i, event in enumerate(events) if "event: section_complete" in event
+    )
     assert any("저장 백그라운드 처리 중" in event for event in events)
     complete_event = next(evt for evt in events if "event: complete" in evt)
     payload_line = next(line for line in complete_event.split("\n") if line.startswith("data:"))
@@ -247,4 +265,40 @@ async def test_generate_reading_stream_schedules_background_persistence(monkeypa
     assert db_provider.saved_data is not None
     assert db_provider.saved_data["id"] == reading_id
 
-    readings_stream._persistence_tasks.clear()
+    await readings_stream.stop_persistence_workers()
+
+
+@pytest.mark.asyncio
+async def test_with_keepalive_emits_comment_while_waiting():
+    async def slow_events():
+        await asyncio.sleep(0.05)
+        yield "event: started\ndata: {}\n\n"
+
+    frames = [frame async for frame in readings_stream._with_keepalive(slow_events(), interval=0.01)]
+
+    assert frames[0] == readings_stream.SSE_KEEPALIVE_FRAME
+    assert frames[-1] == "event: started\ndata: {}\n\n"
+
+
+@pytest.mark.asyncio
+async def test_with_admission_limits_concurrent_streams(monkeypatch):
+    monkeypatch.setattr(readings_stream.settings, "MAX_CONCURRENT_STREAMS", 2)
+    active = 0
+    peak = 0
+
+    async def events():
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        yield "event: started\ndata: {}\n\n"
+        active -= 1
+
+    async def consume():
+        return [frame async for frame in readings_stream._with_admission(events())]
+
+    results = await asyncio.gather(*(consume() for _ in range(5)))
+
+    assert peak == 2
+    assert all(frames == ["event: started\ndata: {}\n\n"] for frames in results)
+    assert readings_stream._active_streams == 0
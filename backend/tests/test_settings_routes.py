@@ -0,0 +1,136 @@
+"""
+Route tests for the admin settings API
+
+DatabaseProvider의 기본 modify_app_settings / toggle_ai_provider 구현을
+인메모리 설정을 가진 Fake provider로 검증합니다.
+"""
+import copy
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# 라우터 패키지 import 시 RAG 임베딩 모듈까지 로드되므로 전체 백엔드 의존성이 필요
+pytest.importorskip("sentence_transformers")
+
+from src.api.dependencies.auth import get_current_admin_user
+from src.api.routes import settings as settings_routes
+from src.database.factory import get_database_provider
+from src.database.provider import DatabaseProvider
+
+
+class FakeSettingsProvider(DatabaseProvider):
+    """설정 문서 하나만 메모리에 보관하는 Provider (설정 외 메서드는 사용하지 않음)"""
+
+    def __init__(self, settings_data: Dict[str, Any]):
+        self.settings_data = settings_data
+        self.update_calls = 0
+
+    async def get_app_settings(self) -> Optional[Dict[str, Any]]:
+        return copy.deepcopy(self.settings_data)
+
+    async def update_app_settings(self, settings_data: Dict[str, Any], updated_by: str) -> Dict[str, Any]:
+        self.update_calls += 1
+        self.settings_data = {**copy.deepcopy(settings_data), "updated_by": updated_by}
+        return copy.deepcopy(self.settings_data)
+
+
+# 설정과 무관한 추상 메서드는 구현하지 않고 인스턴스화
+FakeSettingsProvider.__abstractmethods__ = frozenset()
+
+
+def _initial_settings() -> Dict[str, Any]:
+    return {
+        "admin": {"admin_emails": ["admin@example.com", "manager@example.com"]},
+        "ai": {
+            "provider_priority": ["openai"],
+            "providers": [
+                {
+                    "name": "openai",
+                    "api_key": "sk-test-1234567890abcd",
+                    "model": "gpt-4o-mini",
+                    "enabled": True,
+                    "timeout": 30,
+                }
+            ],
+            "default_timeout": 30,
+        },
+        "updated_at": None,
+        "updated_by": None,
+    }
+
+
+@pytest.fixture
+def provider():
+    return FakeSettingsProvider(_initial_settings())
+
+
+@pytest.fixture
+def client(provider, monkeypatch):
+    invalidations = []
+    monkeypatch.setattr(settings_routes, "_invalidate_orchestrators", lambda: invalidations.append(True))
+
+    app = FastAPI()
+    app.include_router(settings_routes.router)
+    app.dependency_overrides[get_database_provider] = lambda: provider
+    app.dependency_overrides[get_current_admin_user] = lambda: SimpleNamespace(
+        id="admin-1", email="admin@example.com"
+    )
+
+    test_client = TestClient(app)
+    test_client.invalidations = invalidations
+    return test_client
+
+
+class TestProviderMutations:
+    """Provider 추가/토글 (modify_app_settings, toggle_ai_provider)"""
+
+    def test_toggle_provider_flips_enabled_and_masks_key(self, client, provider):
+        response = client.patch("/api/v1/settings/ai/providers/openai/toggle")
+
+        assert response.status_code == 200
+        saved = provider.settings_data["ai"]["providers"][0]
+        assert saved["enabled"] is False
+        assert saved["api_key"] == "sk-test-1234567890abcd"
+        assert response.json()["ai"]["providers"][0]["api_key"] == "sk-test***abcd"
+        assert client.invalidations
+
+    def test_toggle_unknown_provider_returns_404_without_saving(self, client, provider):
+        response = client.patch("/api/v1/settings/ai/providers/unknown/toggle")
+
+        assert response.status_code == 404
+        assert provider.update_calls == 0
+
+    def test_mutator_http_exception_is_returned_and_nothing_saved(self, client, provider):
+        response = client.post(
+            "/api/v1/settings/ai/providers",
+            json={"name": "openai", "api_key": "sk-other-key-0000", "model": "gpt-4o"},
+        )
+
+        assert response.status_code == 400
+        assert "이미 존재합니다" in response.json()["detail"]
+        assert provider.update_calls == 0
+        assert not client.invalidations
+
+
+class TestAdminEmailRemoval:
+    """관리자 이메일 제거 (마지막 관리자 보호)"""
+
+    def test_remove_admin_email(self, client, provider):
+        response = client.delete("/api/v1/settings/admin/emails/manager@example.com")
+
+        assert response.status_code == 200
+        assert provider.settings_data["admin"]["admin_emails"] == ["admin@example.com"]
+        assert provider.settings_data["updated_by"] == "admin-1"
+
+    def test_last_admin_cannot_be_removed(self, client, provider):
+        provider.settings_data["admin"]["admin_emails"] = ["admin@example.com"]
+
+        response = client.delete("/api/v1/settings/admin/emails/admin@example.com")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "마지막 관리자는 제거할 수 없습니다"
+        assert provider.settings_data["admin"]["admin_emails"] == ["admin@example.com"]
+        assert provider.update_calls == 0
@@ -22,7 +22,8 @@ function HistoryPageContent() {
   const [error, setError] = useState<string | null>(null);
   const [isAuthError, setIsAuthError] = useState(false);
   const [page, setPage] = useState(1);
-  const [total, setTotal] = useState(0);
+  const [total, setTotal] = useState<number | null>(0);
+  const [hasMore, setHasMore] = useState(false);
   const [selectedSpread, setSelectedSpread] = useState<string | undefined>();
 
   const pageSize = 10;
@@ -37,10 +38,13 @@ function HistoryPageContent() {
         page,
         page_size: pageSize,
         spread_type: selectedSpread,
+        include_total: true,
       });
 
       setReadings(response.readings);
-      setTotal(response.total);
+      // total은 서버가 개수를 계산하지 않은 경우 null
+      setTotal(response.total ?? null);
+      setHasMore(response.has_more ?? false);
     } catch (err) {
       console.error('Failed to fetch readings:', err);
       const errorMessage = err instanceof Error ? err.message : '리딩 목록을 불러오는데 실패했습니다';
@@ -70,7 +74,9 @@ function HistoryPageContent() {
     }).format(date);
   };
 
-  const totalPages = Math.ceil(total / pageSize);
+  // 전체 개수를 모르면 has_more로 다음 페이지 여부만 판단
+  const totalPages = total !== null ? Math.ceil(total / pageSize) : null;
+  const hasNextPage = totalPages !== null ? page < totalPages : hasMore;
 
   return (
     <main className="min-h-screen p-8 bg-gradient-to-br from-purple-50 to-indigo-100 dark:from-gray-900 dark:to-indigo-950">
@@ -241,7 +247,7 @@ function HistoryPageContent() {
         )}
 
         {/* Pagination */}
-        {!loading && !error && totalPages > 1 && (
+        {!loading && !error && (page > 1 || hasNextPage) && (
           <div className="mt-8 flex justify-center items-center gap-2">
             <button
               onClick={() => setPage(p => Math.max(1, p - 1))}
@@ -252,12 +258,12 @@ function HistoryPageContent() {
             </button>
 
             <span className="px-4 py-2 text-gray-700 dark:text-gray-300">
-              {page} / {totalPages}
+              {totalPages !== null ? `${page} / ${totalPages}` : page}
             </span>
 
             <button
-              onClick={() => setPage(p => Math.min(totalPages, p + 1))}
-              disabled={page === totalPages}
+              onClick={() => setPage(p => p + 1)}
+              disabled={!hasNextPage}
               className="px-4 py-2 bg-white dark:bg-gray-800 text-gray-700 dark:text-gray-300 rounded-lg disabled:opacity-50 disabled:cursor-not-allowed hover:bg-gray-50 dark:hover:bg-gray-700 transition-colors"
             >
               다음
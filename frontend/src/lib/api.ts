@@ -246,6 +246,7 @@ export const readingAPI = {
     page_size?: number;
     spread_type?: string;
     category?: string;
+    include_total?: boolean;
   }): Promise<ReadingListResponse> => {
     return fetchAPI<ReadingListResponse>('/api/v1/readings/', {
       params,
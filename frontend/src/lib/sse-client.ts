@@ -11,6 +11,7 @@ export type SSEEventType =
   | 'card_drawn'
   | 'rag_enrichment'
   | 'ai_generation'
+  | 'ai_token'
   | 'section_complete'
   | 'complete'
   | 'error';
@@ -52,6 +53,11 @@ export interface AIGenerationEvent {
   message: string;
 }
 
+export interface AITokenEvent {
+  delta: string;
+  attempt: number;  // 값이 바뀌면 이전 시도의 텍스트는 버려야 함 (파싱 재시도)
+}
+
 export interface CompleteEvent {
   reading_id: string;
   total_time: number;
@@ -84,6 +90,7 @@ export interface SSEEventHandlers {
   onCardDrawn?: (data: CardDrawnEvent) => void;
   onRAGEnrichment?: (data: RAGEnrichmentEvent) => void;
   onAIGeneration?: (data: AIGenerationEvent) => void;
+  onAIToken?: (data: AITokenEvent) => void;
   onSectionComplete?: (data: SectionCompleteEvent) => void;
   onComplete?: (data: CompleteEvent) => void;
   onError?: (data: ErrorEvent) => void;
@@ -247,6 +254,12 @@ export class SSEReadingClient {
           }
           break;
 
+        case 'ai_token':
+          if (this.handlers.onAIToken) {
+            this.handlers.onAIToken(data as AITokenEvent);
+          }
+          break;
+
         case 'section_complete':
           if (this.handlers.onSectionComplete) {
             this.handlers.onSectionComplete(data as SectionCompleteEvent);
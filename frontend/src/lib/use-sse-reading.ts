@@ -12,6 +12,7 @@ import {
   type ReadingRequest,
   type ProgressEvent,
   type CardDrawnEvent,
+  type AITokenEvent,
   type SectionCompleteEvent,
   type CompleteEvent,
   type ErrorEvent,
@@ -27,6 +28,9 @@ interface UseSSEReadingState {
   readingId: string | null;
   error: string | null;
   totalTime: number | null;
+  // Raw AI output streamed so far (current attempt only)
+  streamingText: string;
+  streamingAttempt: number;
   // Incremental sections
   summary: string | null;
   cards: any[] | null;
@@ -49,6 +53,8 @@ export function useSSEReading(apiUrl: string, accessToken: string): UseSSEReadin
     readingId: null,
     error: null,
     totalTime: null,
+    streamingText: '',
+    streamingAttempt: 0,
     summary: null,
     cards: null,
     overallReading: null,
@@ -76,6 +82,8 @@ export function useSSEReading(apiUrl: string, accessToken: string): UseSSEReadin
       readingId: null,
       error: null,
       totalTime: null,
+      streamingText: '',
+      streamingAttempt: 0,
       summary: null,
       cards: null,
       overallReading: null,
@@ -99,6 +107,8 @@ export function useSSEReading(apiUrl: string, accessToken: string): UseSSEReadin
         readingId: null,
         error: null,
         totalTime: null,
+        streamingText: '',
+        streamingAttempt: 0,
         summary: null,
         cards: null,
         overallReading: null,
@@ -138,6 +148,21 @@ export function useSSEReading(apiUrl: string, accessToken: string): UseSSEReadin
           console.log('[SSE Hook] AI Generation:', data);
         },
 
+        onAIToken: (data: AITokenEvent) => {
+          setState((prev) => {
+            // 파싱 재시도로 attempt가 바뀌면 이전 텍스트를 버리고 새로 누적
+            const text = data.attempt === prev.streamingAttempt
+              ? prev.streamingText + data.delta
+              : data.delta;
+            return {
+              ...prev,
+              streamingText: text,
+              streamingAttempt: data.attempt,
+              message: `AI가 리딩을 작성하고 있습니다... (${text.length}자)`,
+            };
+          });
+        },
+
         onSectionComplete: (data: SectionCompleteEvent) => {
           console.log('[SSE Hook] Section Complete:', data);
           setState((prev) => {
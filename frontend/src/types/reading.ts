@@ -233,8 +233,10 @@ export interface ReadingResponse {
  * Paginated reading list response from backend
  */
 export interface ReadingListResponse {
-  total: number;
+  total: number | null;  // null unless requested with include_total=true
   page: number;
   page_size: number;
   readings: ReadingResponse[];
+  has_more?: boolean;
+  next_cursor?: string | null;
 }